@@ -0,0 +1,100 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+
+LOG_LEVEL_ENV = 'GAME_STORE_LOG_LEVEL'
+LOG_FORMAT_ENV = 'GAME_STORE_LOG_FORMAT'
+DEFAULT_SETTINGS = {'level': 'INFO', 'format': 'text', 'file': None}
+
+_listener = None
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line, including any fields passed through extra="""
+    RESERVED_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+    def format(self, record):
+        """Returns the JSON line of a record"""
+        entry = {
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'msg': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in self.RESERVED_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class TextFormatter(logging.Formatter):
+    """Single-line key=value prefix followed by the message, for reading in a terminal"""
+    def __init__(self):
+        """Constructor"""
+        super().__init__("%(asctime)s level=%(levelname)s logger=%(name)s thread=%(threadName)s %(message)s")
+
+class QueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that keeps the record arguments, so formatting happens on the listener thread, not the caller's"""
+    def prepare(self, record):
+        """Only resolves exception text, which cannot be sent across threads lazily"""
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+def load_logging_settings(config_filename='config.json'):
+    """Reads the optional top-level "logging" section of the config file. Environment variables override it"""
+    settings = dict(DEFAULT_SETTINGS)
+    try:
+        with open(config_filename, 'r') as f:
+            settings.update(json.load(f).get('logging') or {})
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    settings['level'] = os.environ.get(LOG_LEVEL_ENV, settings['level'])
+    settings['format'] = os.environ.get(LOG_FORMAT_ENV, settings['format'])
+    return settings
+
+def setup_logging(level='INFO', log_format='text', log_file=None):
+    """Routes all loggers through a queue drained by a background thread, so callers never block on console or file I/O"""
+    global _listener
+    shutdown_logging()
+
+    if log_file:
+        target = logging.FileHandler(log_file, encoding='utf-8')
+    else:
+        target = logging.StreamHandler(sys.stdout)
+    target.setFormatter(JsonFormatter() if log_format == 'json' else TextFormatter())
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level.upper() if isinstance(level, str) else level)
+
+    _listener = logging.handlers.QueueListener(log_queue, target, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+def setup_logging_from_config(config_filename='config.json'):
+    """Configures logging from the config file and environment"""
+    settings = load_logging_settings(config_filename)
+    return setup_logging(settings['level'], settings['format'], settings.get('file'))
+
+def shutdown_logging():
+    """Flushes the queued records and stops the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+atexit.register(shutdown_logging)
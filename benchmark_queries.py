@@ -0,0 +1,230 @@
+import argparse
+import contextlib
+import io
+import json
+import math
+import random
+import sys
+import time
+
+from database_manager import DatabaseManager
+from app_logging import setup_logging
+
+SCALE_TABLES = ['Users', 'Studios', 'Games', 'Purchases', 'Purchases_Items', 'Reviews', 'ReviewComments']
+
+
+def build_benchmarks(samples):
+    """Returns (name, callable(db_manager)) pairs covering every DatabaseManager read method"""
+    game_id = samples['game_id']
+    user_id = samples['user_id']
+    studio_id = samples['studio_id']
+    studio_name = samples['studio_name']
+    review_id = samples['review_id']
+    admin_id = samples['admin_id']
+
+    return [
+        ('fetch_all_games[title]', lambda db: db.fetch_all_games('title', 'ASC')),
+        ('fetch_all_games[purchase_count]', lambda db: db.fetch_all_games('purchase_count', 'DESC')),
+        ('fetch_games_page[title]', lambda db: db.fetch_games_page('title', 'ASC', limit=50)),
+        ('fetch_games_page[price]', lambda db: db.fetch_games_page('price', 'DESC', limit=50)),
+        ('fetch_games_page[purchase_count]', lambda db: db.fetch_games_page('purchase_count', 'DESC', limit=50)),
+        ('fetch_game_details', lambda db: db.fetch_game_details(game_id)),
+        ('fetch_game_page', lambda db: db.fetch_game_page(game_id, user_id)),
+        ('fetch_purchased_games', lambda db: db.fetch_purchased_games(user_id)),
+        ('check_ownership', lambda db: db.check_ownership(user_id, game_id)),
+        ('fetch_game_reviews', lambda db: db.fetch_game_reviews(game_id)),
+        ('fetch_review_comments', lambda db: db.fetch_review_comments(review_id)),
+        ('fetch_game_reviews_with_comments', lambda db: db.fetch_game_reviews_with_comments(game_id)),
+        ('fetch_game_genres', lambda db: db.fetch_game_genres(game_id)),
+        ('fetch_game_platforms', lambda db: db.fetch_game_platforms(game_id)),
+        ('fetch_game_studios_by_role', lambda db: db.fetch_game_studios_by_role(game_id, 'Developer')),
+        ('fetch_studio_details_by_name', lambda db: db.fetch_studio_details_by_name(studio_name)),
+        ('fetch_user_info', lambda db: db.fetch_user_info(user_id)),
+        ('check_developer_status', lambda db: db.check_developer_status(user_id)),
+        ('fetch_all_studios', lambda db: db.fetch_all_studios('name', 'ASC')),
+        ('fetch_pending_applications', lambda db: db.fetch_pending_applications(studio_id, admin_id)),
+        ('get_developer_studio_id', lambda db: db.get_developer_studio_id(user_id)),
+        ('check_developer_role', lambda db: db.check_developer_role(user_id, studio_id)),
+        ('get_pending_application_count', lambda db: db.get_pending_application_count(studio_id, admin_id)),
+        ('check_pending_application', lambda db: db.check_pending_application(user_id, studio_id)),
+        ('check_game_edit_permission', lambda db: db.check_game_edit_permission(user_id, game_id)),
+        ('fetch_all_users_for_admin[username]', lambda db: db.fetch_all_users_for_admin(None, 'username', 'ASC')),
+        ('fetch_all_users_for_admin[total_spent]', lambda db: db.fetch_all_users_for_admin(None, 'total_spent', 'DESC')),
+        ('fetch_all_users_for_admin[search]', lambda db: db.fetch_all_users_for_admin('user', 'username', 'ASC')),
+        ('fetch_all_users_for_admin[page]', lambda db: db.fetch_all_users_for_admin(None, 'total_spent', 'DESC', limit=200)),
+        ('fetch_all_studios_for_admin', lambda db: db.fetch_all_studios_for_admin(None, 'name', 'ASC')),
+        ('fetch_all_games_for_admin', lambda db: db.fetch_all_games_for_admin(None, 'title', 'ASC')),
+        ('fetch_all_games_for_admin[page]', lambda db: db.fetch_all_games_for_admin(None, 'price', 'DESC', limit=200)),
+        ('fetch_all_games_for_admin[search]', lambda db: db.fetch_all_games_for_admin('the', 'title', 'ASC')),
+        ('search_users_for_admin', lambda db: db.search_users_for_admin('user')),
+        ('search_studios_for_admin', lambda db: db.search_studios_for_admin(studio_name)),
+        ('search_games_for_admin', lambda db: db.search_games_for_admin('the')),
+        ('has_pending_developer_status_request', lambda db: db.has_pending_developer_status_request(user_id)),
+        ('fetch_pending_admin_notifications', lambda db: db.fetch_pending_admin_notifications()),
+        ('get_user_total_spent', lambda db: db.get_user_total_spent(user_id)),
+        ('get_developer_studio_details', lambda db: db.get_developer_studio_details(user_id)),
+    ]
+
+
+def pick_samples(db_manager, seed):
+    """Chooses the ids the benchmarks run against: the most popular game, the most active buyer and a random studio"""
+    rng = random.Random(seed)
+
+    def first_value(query, default=None):
+        row = db_manager.execute_query(query, fetch_one=True)
+        return row[0] if row and row[0] is not None else default
+
+    studio_ids = db_manager.execute_query("SELECT studio_id, name FROM Studios ORDER BY studio_id;", fetch_all=True) or []
+    studio_id, studio_name = rng.choice(studio_ids) if studio_ids else (None, None)
+
+    return {
+        'game_id': first_value("SELECT game_id FROM Games ORDER BY purchase_count DESC, game_id LIMIT 1;"),
+        'user_id': first_value("SELECT user_id FROM Users ORDER BY owned_games_count DESC, user_id LIMIT 1;"),
+        'admin_id': first_value("SELECT user_id FROM Developers WHERE role = 'Admin' ORDER BY user_id LIMIT 1;"),
+        'review_id': first_value("SELECT review_id FROM ReviewComments GROUP BY review_id ORDER BY COUNT(*) DESC LIMIT 1;"),
+        'studio_id': studio_id,
+        'studio_name': studio_name,
+    }
+
+
+def fetch_scale(db_manager):
+    """Returns the row counts of the main tables, describing the data scale of the benchmarked database"""
+    scale = {}
+    for table in SCALE_TABLES:
+        row = db_manager.execute_query(f"SELECT COUNT(*) FROM {table};", fetch_one=True)
+        scale[table] = row[0] if row else None
+    return scale
+
+
+def count_rows(result):
+    """Counts the rows a read method returned"""
+    if result is None or result is False:
+        return 0
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[0], list):
+        return len(result[0])
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    return 1
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def run_benchmark(db_manager, func, iterations, warmup):
+    """Calls func repeatedly and returns its latency distribution (in ms) and the row count of the last call"""
+    timings = []
+    rows = 0
+    sink = io.StringIO()
+    for i in range(warmup + iterations):
+        with contextlib.redirect_stdout(sink):
+            start = time.perf_counter()
+            result = func(db_manager)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        sink.seek(0)
+        sink.truncate()
+        if i >= warmup:
+            timings.append(elapsed_ms)
+            rows = count_rows(result)
+    timings.sort()
+    return {
+        'rows': rows,
+        'p50_ms': percentile(timings, 50),
+        'p95_ms': percentile(timings, 95),
+        'max_ms': timings[-1] if timings else None,
+    }
+
+
+def run_suite(config_filename, iterations, warmup, seed, name_filter=None, prepared_statements=True, reference_cache=True):
+    """Runs every benchmark against the database described by one config file"""
+    db_manager = DatabaseManager(config_filename)
+    db_manager.use_prepared_statements = db_manager.use_prepared_statements and prepared_statements
+    if not reference_cache:
+        db_manager.reference_cache = None
+    if not db_manager.get_connection():
+        print(f"Cannot benchmark '{config_filename}': no database connection")
+        return None
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            scale = fetch_scale(db_manager)
+            samples = pick_samples(db_manager, seed)
+
+        results = {}
+        for name, func in build_benchmarks(samples):
+            if name_filter and name_filter not in name:
+                continue
+            results[name] = run_benchmark(db_manager, func, iterations, warmup)
+        return {'config': config_filename, 'scale': scale, 'samples': samples, 'results': results}
+    finally:
+        with contextlib.redirect_stdout(io.StringIO()):
+            db_manager.close_connection()
+
+
+def print_report(report, baseline=None, tolerance=1.5):
+    """Prints the latency table of one run and returns the names of benchmarks that regressed against the baseline"""
+    print(f"\n=== {report['config']} ===")
+    print("Data scale: " + ", ".join(f"{table}={count}" for table, count in report['scale'].items()))
+    print(f"{'method':<45}{'rows':>9}{'p50 ms':>11}{'p95 ms':>11}{'max ms':>11}")
+
+    baseline_results = (baseline or {}).get('results', {})
+    regressions = []
+    for name, stats in report['results'].items():
+        marker = ""
+        base = baseline_results.get(name)
+        if base and base.get('p95_ms') and stats['p95_ms'] > base['p95_ms'] * tolerance:
+            marker = f"  REGRESSION (baseline p95 {base['p95_ms']:.2f} ms)"
+            regressions.append(name)
+        print(f"{name:<45}{stats['rows']:>9}{stats['p50_ms']:>11.2f}{stats['p95_ms']:>11.2f}{stats['max_ms']:>11.2f}{marker}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Times every DatabaseManager read method against a local PostgreSQL database")
+    parser.add_argument('--config', action='append', dest='configs',
+                        help="Config file of a database to benchmark. Repeat it to compare databases seeded at different scales")
+    parser.add_argument('--iterations', type=int, default=20, help="Timed calls per method")
+    parser.add_argument('--warmup', type=int, default=2, help="Untimed calls per method before measuring")
+    parser.add_argument('--seed', type=int, default=42, help="Seed used to pick sample ids")
+    parser.add_argument('--filter', help="Only run benchmarks whose name contains this text")
+    parser.add_argument('--save', help="Write the results as JSON to this file")
+    parser.add_argument('--baseline', help="JSON file from a previous --save run to compare p95 latencies against")
+    parser.add_argument('--no-prepared', action='store_true', help="Run the hot lookups as plain queries instead of prepared statements")
+    parser.add_argument('--no-cache', action='store_true', help="Disable the reference data cache, so every call reaches the database")
+    parser.add_argument('--tolerance', type=float, default=1.5, help="Allowed p95 slowdown factor against the baseline")
+    args = parser.parse_args()
+
+    # Only problems are reported, so logging does not distort the timings
+    setup_logging('WARNING')
+
+    baseline_by_config = {}
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline_by_config = {report['config']: report for report in json.load(f)}
+
+    reports = []
+    regressions = []
+    for config_filename in args.configs or ['config.json']:
+        report = run_suite(config_filename, args.iterations, args.warmup, args.seed, args.filter, not args.no_prepared, not args.no_cache)
+        if report is None:
+            continue
+        reports.append(report)
+        regressions.extend(print_report(report, baseline_by_config.get(config_filename), args.tolerance))
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(reports, f, indent=2, default=str)
+        print(f"\nResults saved to '{args.save}'")
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed: {', '.join(regressions)}")
+        return 1
+    return 0 if reports else 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,24 +1,460 @@
 import psycopg2
 import psycopg2.sql as sql
-import bcrypt
+import psycopg2.extras
+import psycopg2.errors
 import json
 import os
+import select
 import decimal
-import traceback
-
+import logging
+import multiprocessing
+import sys
+import threading
+import time
+import weakref
+
+from contextlib import contextmanager
+from functools import partial, wraps
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from tkinter import messagebox
 from decimal import Decimal, InvalidOperation
 
+from query_metrics import QueryMetrics
+from password_hashing import DEFAULT_BCRYPT_ROUNDS, hash_password, check_password, bcrypt_rounds
+
+logger = logging.getLogger(__name__)
+
+# Channel the notify_data_change trigger announces changed rows on (see initialize_game_store_db.sql)
+CHANGE_CHANNEL = 'game_store_changes'
+
+# Cached lookups keyed by game_id, see DatabaseManager.invalidate_reference_cache
+GAME_REFERENCE_KINDS = ('genres', 'platforms', 'game_studios')
+
+# Admin search bars: result cap and the shortest term the trigram indexes can serve
+ADMIN_SEARCH_LIMIT = 200
+MIN_TRIGRAM_TERM_LENGTH = 3
+# Interactive searches are stopped by the server after this many milliseconds
+DEFAULT_SEARCH_TIMEOUT_MS = 3000
+
+# Full-text document of a game; must stay identical to the idx_games_search_document expression
+GAME_SEARCH_DOCUMENT = "to_tsvector('simple', g.title || ' ' || COALESCE(g.description, ''))"
+
+# Admin game sorts on nullable columns. Games without a price sort as -1: first in ascending, last in descending
+# order (idx_games_price_game_id). Games without a release date sort as 0001-01-01 the same way, because a NULL
+# keyset cursor value matches no row; it is date.min, so the value read back into the cursor compares equal
+ADMIN_GAME_SORT_EXPRS = {
+    'price': sql.SQL("COALESCE(g.price, -1)"),
+    'release_date': sql.SQL("COALESCE(g.release_date, DATE '0001-01-01')"),
+}
+
+# Hot lookups run as server-side prepared statements, parsed and planned once per connection
+PREPARED_STATEMENTS = {
+    'check_ownership': """
+        SELECT EXISTS (
+            SELECT 1
+            FROM Purchases_Items pi
+            JOIN Purchases p ON pi.purchase_id = p.purchase_id
+            WHERE p.user_id = %s
+              AND pi.game_id = %s
+              AND p.status = 'Completed'
+        );
+    """,
+    'fetch_user_info': "SELECT username, balance FROM Users WHERE user_id = %s;",
+    'get_developer_studio_id': "SELECT studio_id FROM Developers WHERE user_id = %s;",
+    'check_developer_role': "SELECT role FROM Developers WHERE user_id = %s AND studio_id = %s;",
+    'fetch_game_genres': """
+        SELECT g.name
+        FROM Genres g
+        JOIN Game_Genres gg ON g.genre_id = gg.genre_id
+        WHERE gg.game_id = %s
+        ORDER BY g.name;
+    """,
+}
+
+class ConnectionPool:
+    """Thread-safe pool of PostgreSQL connections with health checks and a checkout timeout"""
+    def __init__(self, connect_func, min_size=1, max_size=5, checkout_timeout=10.0, health_check=True):
+        """Constructor"""
+        self._connect_func = connect_func
+        self.min_size = max(0, int(min_size))
+        self.max_size = max(1, int(max_size), self.min_size)
+        self.checkout_timeout = float(checkout_timeout)
+        self.health_check = bool(health_check)
+
+        self._idle = []
+        self._opened = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        for _ in range(self.min_size):
+            conn = self._connect_func()
+            if not conn:
+                break
+            self._idle.append(conn)
+            self._opened += 1
+
+    def acquire(self):
+        """Checks out a healthy connection, waiting up to checkout_timeout seconds for a free one"""
+        deadline = time.monotonic() + self.checkout_timeout
+        while True:
+            conn = None
+            with self._condition:
+                while True:
+                    if self._closed:
+                        logger.error("Connection pool is closed")
+                        return None
+                    if self._idle:
+                        conn = self._idle.pop()
+                        break
+                    if self._opened < self.max_size:
+                        self._opened += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        logger.error("Timed out after %ss waiting for a free database connection", self.checkout_timeout)
+                        return None
+                    self._condition.wait(remaining)
+
+            if conn is None:
+                conn = self._connect_func()
+                if not conn:
+                    self._forget()
+                return conn
+
+            if self._is_healthy(conn):
+                return conn
+
+            logger.warning("Discarding a broken connection")
+            self._discard(conn)
+
+    def release(self, conn):
+        """Returns a connection to the pool, rolling back any unfinished transaction"""
+        if conn is None:
+            return
+        if conn.closed:
+            self._forget()
+            return
+        try:
+            if conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+        except psycopg2.Error:
+            self._discard(conn)
+            return
+
+        with self._condition:
+            if self._closed:
+                self._opened -= 1
+                conn.close()
+                return
+            self._idle.append(conn)
+            self._condition.notify()
+
+    def close_all(self):
+        """Closes every idle connection and refuses further checkouts"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._opened -= len(idle)
+            self._condition.notify_all()
+        for conn in idle:
+            try:
+                conn.close()
+            except Exception as e:
+                logger.error("Error closing pooled connection: %s", e)
+
+    def _is_healthy(self, conn):
+        """Checks that a pooled connection is still usable"""
+        if conn.closed:
+            return False
+        if not self.health_check:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1;")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _discard(self, conn):
+        """Closes a connection and frees its slot in the pool"""
+        try:
+            conn.close()
+        except Exception:
+            pass
+        self._forget()
+
+    def _forget(self):
+        """Frees a slot that no longer has a live connection behind it"""
+        with self._condition:
+            self._opened -= 1
+            self._condition.notify()
+
+class CopyRowStream:
+    """File-like object that encodes rows from an iterable into COPY text format as they are read"""
+    def __init__(self, rows, rows_per_chunk=500):
+        """Constructor"""
+        self.rows = iter(rows)
+        self.rows_per_chunk = rows_per_chunk
+        self.row_count = 0
+        self._buffer = ""
+        self._exhausted = False
+
+    def read(self, size=-1):
+        """Returns up to size characters of COPY data, pulling more rows from the iterable when the buffer runs low"""
+        while not self._exhausted and (size < 0 or len(self._buffer) < size):
+            lines = [self._format_row(row) for row in islice(self.rows, self.rows_per_chunk)]
+            if not lines:
+                self._exhausted = True
+                break
+            self.row_count += len(lines)
+            self._buffer += "".join(lines)
+
+        if size < 0 or size >= len(self._buffer):
+            chunk, self._buffer = self._buffer, ""
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+    readline = read
+
+    @staticmethod
+    def _format_row(row):
+        """Encodes one row as a tab-separated COPY line"""
+        return "\t".join(CopyRowStream._format_value(value) for value in row) + "\n"
+
+    @staticmethod
+    def _format_value(value):
+        """Encodes one value, escaping the characters COPY treats specially"""
+        if value is None:
+            return "\\N"
+        if isinstance(value, bool):
+            return "t" if value else "f"
+        text = str(value)
+        return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+class OperationFrame:
+    """Statistics of one DatabaseManager operation in progress, filled in by the cursors it uses"""
+    __slots__ = ('name', 'rows', 'failed')
+
+    def __init__(self, name):
+        """Constructor"""
+        self.name = name
+        self.rows = 0
+        self.failed = False
+
+class InstrumentedCursor(psycopg2.extensions.cursor):
+    """Cursor that reports the row count and failure of each statement to the running operation and captures slow statements"""
+    def __init__(self, *args, manager=None, **kwargs):
+        """Constructor"""
+        super().__init__(*args, **kwargs)
+        self.manager = manager
+
+    def execute(self, query, vars=None):
+        """Executes a statement, timing it when it runs inside a tracked operation"""
+        frame = self.manager._current_operation() if self.manager is not None else None
+        if frame is None:
+            return super().execute(query, vars)
+
+        start = time.perf_counter()
+        try:
+            super().execute(query, vars)
+        except Exception:
+            frame.failed = True
+            raise
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if self.rowcount > 0:
+            frame.rows += self.rowcount
+        metrics = self.manager.metrics
+        if metrics.is_slow(elapsed_ms):
+            plan = self._explain() if metrics.should_explain(frame.name) else None
+            query_text = query.as_string(self.connection) if isinstance(query, sql.Composable) else query
+            metrics.record_slow_query(frame.name, elapsed_ms, query_text, plan)
+
+    def _explain(self):
+        """Returns the plan of the statement just executed, or None if it is not a read query"""
+        statement = self.query
+        if isinstance(statement, bytes):
+            statement = statement.decode(psycopg2.extensions.encodings.get(self.connection.encoding, 'utf-8'), 'replace')
+        if not statement or statement.lstrip().split(None, 1)[0].upper() not in ('SELECT', 'WITH', 'EXECUTE'):
+            return None
+        # Savepoints only exist inside a transaction
+        if self.connection.autocommit:
+            return None
+
+        # A failed EXPLAIN must not abort the caller's transaction, nor fail the query it explains
+        with psycopg2.extensions.cursor(self.connection) as cur:
+            try:
+                cur.execute("SAVEPOINT query_metrics_explain;")
+                cur.execute("EXPLAIN " + statement)
+                plan = "\n".join(row[0] for row in cur.fetchall())
+                cur.execute("RELEASE SAVEPOINT query_metrics_explain;")
+                return plan
+            except psycopg2.Error as e:
+                logger.warning("Could not capture the plan of a slow query: %s", e)
+                try:
+                    cur.execute("ROLLBACK TO SAVEPOINT query_metrics_explain;")
+                except psycopg2.Error as rollback_error:
+                    logger.warning("Could not roll back to the EXPLAIN savepoint: %s", rollback_error)
+                return None
+
+class ReferenceCache:
+    """Thread-safe TTL cache for rarely changing lookups. Keys are tuples (kind, *args); game-scoped kinds take game_id as the first argument"""
+    def __init__(self, ttl=300.0, max_entries=5000):
+        """Constructor"""
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get(self, key):
+        """Returns the cached value, or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        """Stores a value for ttl seconds, evicting expired and then the oldest entries when full"""
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                now = time.monotonic()
+                for stale_key in [k for k, (expires_at, _) in self._entries.items() if expires_at < now]:
+                    del self._entries[stale_key]
+                while len(self._entries) >= self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, kinds=None, game_id=None):
+        """Drops the entries of the given kinds (all if None), only those of one game if game_id is given. Returns the number dropped"""
+        with self._lock:
+            stale_keys = [
+                key for key in self._entries
+                if (kinds is None or key[0] in kinds) and (game_id is None or (len(key) > 1 and key[1] == game_id))
+            ]
+            for key in stale_keys:
+                del self._entries[key]
+            return len(stale_keys)
+
+    def stats(self):
+        """Returns the entry count and hit/miss counters"""
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+_cancel_executor = None
+_cancel_executor_lock = threading.Lock()
+
+def _get_cancel_executor():
+    """Starts the thread that sends cancel requests on first use"""
+    global _cancel_executor
+    with _cancel_executor_lock:
+        if _cancel_executor is None:
+            _cancel_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-cancel")
+        return _cancel_executor
+
+class QueryHandle:
+    """Lets another thread cancel a streamed query: stops fetching between chunks and sends a cancel request for a running statement"""
+    def __init__(self):
+        """Constructor"""
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._connection = None
+        # How the query ended: 'finished', 'cancelled', 'timeout' or 'failed' (None while it runs)
+        self.status = None
+
+    @property
+    def cancelled(self):
+        """Tells whether cancel() was called"""
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Cancels the query; safe to call from any thread, any number of times. Never blocks: the cancel request is sent by a background thread"""
+        if self._cancelled.is_set():
+            return
+        self._cancelled.set()
+        with self._lock:
+            running = self._connection is not None
+        if running:
+            _get_cancel_executor().submit(self._send_cancel)
+
+    def _send_cancel(self):
+        """Asks the server to cancel the running statement; waits for a round trip, so it runs off the UI thread"""
+        with self._lock:
+            if self._connection is not None and not self._connection.closed:
+                try:
+                    self._connection.cancel()
+                except psycopg2.Error as e:
+                    logger.debug("Could not send a cancel request: %s", e)
+
+    def _attach(self, conn):
+        """Marks conn as running the query. Returns False if the query was cancelled before it started"""
+        with self._lock:
+            if self.cancelled:
+                return False
+            self._connection = conn
+            return True
+
+    def _detach(self):
+        """Marks the query as no longer running, so a late cancel() cannot hit the next statement of the connection"""
+        with self._lock:
+            self._connection = None
+
+def instrumented(method):
+    """Records the duration, affected rows and failure of a hand-written transactional method in the query metrics"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._track_operation(method.__name__):
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class DatabaseManager:
     def __init__(self, config_filename='config.json'):
         """Constructor"""
         self.db_params = self._load_config(config_filename)
+        self.pool_settings = self.db_params.pop('pool', None) if self.db_params else None
+        self.executor_workers = self.db_params.pop('executor_workers', None) if self.db_params else None
+        password_settings = (self.db_params.pop('password_hashing', None) if self.db_params else None) or {}
+        self.password_rounds = min(31, max(4, int(password_settings.get('rounds', DEFAULT_BCRYPT_ROUNDS))))
+        self.password_workers = password_settings.get('workers')
+        self.use_prepared_statements = bool(self.db_params.pop('prepared_statements', True)) if self.db_params else True
+        cache_settings = (self.db_params.pop('reference_cache', None) if self.db_params else None) or {}
+        cache_ttl = cache_settings.get('ttl', 300)
+        self.reference_cache = ReferenceCache(cache_ttl, cache_settings.get('max_entries', 5000)) if cache_ttl and cache_settings.get('enabled', True) else None
+        metrics_settings = (self.db_params.pop('metrics', None) if self.db_params else None) or {}
+        self.metrics = QueryMetrics(
+            slow_query_ms=metrics_settings.get('slow_query_ms', 200),
+            explain_slow_queries=metrics_settings.get('explain_slow_queries', True)
+        )
+        self.metrics_dump_file = metrics_settings.get('dump_file')
+        if self.metrics_dump_file and self.db_params:
+            self.metrics.start_periodic_dump(self.metrics_dump_file, metrics_settings.get('dump_interval', 60))
+        self.search_timeout_ms = self.db_params.pop('search_timeout_ms', DEFAULT_SEARCH_TIMEOUT_MS) if self.db_params else DEFAULT_SEARCH_TIMEOUT_MS
         self.connection = None
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._local = threading.local()
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._worker_connections = []
+        self._password_executor = None
+        self._prepared = weakref.WeakKeyDictionary()
+        self._prepared_lock = threading.Lock()
+        self._change_subscribers = []
+        self._change_lock = threading.Lock()
+        self._listener_thread = None
+        self._listener_stop = threading.Event()
 
     def _load_config(self, filename):
         """Loads and checks configuration of data base from JSON-file"""
         if not os.path.exists(filename):
-            print(f"Error: Configuration file '{filename}' not found")
+            logger.error("Configuration file '%s' not found", filename)
             return None
 
         try:
@@ -26,23 +462,23 @@ class DatabaseManager:
                 config = json.load(f)
 
             if 'database' not in config:
-                print(f"Error: Key 'database' not found in the file")
+                logger.error("Key 'database' not found in the file")
                 return None
 
             required_keys = {"host", "port", "dbname", "user", "password"}
             if not required_keys.issubset(config['database'].keys()):
                 missing_keys = required_keys - config['database'].keys()
-                print(f"Error: Keys {missing_keys} missing from 'database' section")
+                logger.error("Keys %s missing from 'database' section", missing_keys)
                 return None
 
-            print("Configuration loaded successfully!")
+            logger.info("Configuration loaded successfully!")
             return config['database']
 
         except json.JSONDecodeError:
-            print(f"Error: Unable to parse JSON in '{filename}' file")
+            logger.error("Unable to parse JSON in '%s' file", filename)
             return None
         except Exception as e:
-            print(f"Unexpected error when loading configuration: {e}")
+            logger.error("Unexpected error when loading configuration: %s", e)
             return None
 
     def _connect(self):
@@ -51,75 +487,458 @@ class DatabaseManager:
         if not self.db_params:
             return None
         try:
-            print(f"Connecting to the database '{self.db_params['dbname']}' on {self.db_params['host']}...")
-            conn = psycopg2.connect(**self.db_params)
-            print("The Connection is Successful!")
+            logger.info("Connecting to the database '%s' on %s...", self.db_params['dbname'], self.db_params['host'])
+            conn = psycopg2.connect(**self.db_params, cursor_factory=partial(InstrumentedCursor, manager=self))
+            logger.info("The Connection is Successful!")
             with conn.cursor() as cur:
                 cur.execute("SELECT version();")
                 db_version = cur.fetchone()
                 if db_version:
-                    print(f"Postgre Version: {db_version[0]}")
+                    logger.info("Postgre Version: %s", db_version[0])
             return conn
 
         except psycopg2.OperationalError as e:
-            print(f"\nError connecting to PostgreSQL: {e}")
+            logger.error("Error connecting to PostgreSQL: %s", e)
             return None
         except Exception as e:
-            print(f"\nUnexpected error during trying to connect: {e}")
+            logger.error("Unexpected error during trying to connect: %s", e)
             return None
 
+    def _get_pool(self):
+        """Creates the connection pool on first use from the 'pool' settings of the config"""
+        with self._pool_lock:
+            if self._pool is None:
+                settings = self.pool_settings or {}
+                self._pool = ConnectionPool(
+                    self._connect,
+                    min_size=settings.get('min_size', 1),
+                    max_size=settings.get('max_size', 5),
+                    checkout_timeout=settings.get('checkout_timeout', 10.0),
+                    health_check=settings.get('health_check', True)
+                )
+                logger.info("Connection pool created (min: %s, max: %s)", self._pool.min_size, self._pool.max_size)
+            return self._pool
+
     def get_connection(self):
         """Provides a working connection with data base"""
+        if self.pool_settings is not None:
+            conn = getattr(self._local, 'connection', None)
+            if conn is not None and not conn.closed:
+                return conn
+            if conn is not None:
+                self.release_connection()
+            conn = self._get_pool().acquire()
+            self._local.connection = conn
+            return conn
+
+        if threading.current_thread() is not threading.main_thread():
+            conn = getattr(self._local, 'connection', None)
+            if conn is not None and not conn.closed:
+                return conn
+            conn = self._connect()
+            self._local.connection = conn
+            if conn:
+                with self._executor_lock:
+                    self._worker_connections.append(conn)
+            return conn
+
         if self.connection and not self.connection.closed:
             return self.connection
-        print("Connection lost. Attempting to reconnect...")
+        logger.warning("Connection lost. Attempting to reconnect...")
         self.connection = self._connect()
         return self.connection
 
+    def release_connection(self):
+        """Returns the connection leased by the current thread back to the pool"""
+        conn = getattr(self._local, 'connection', None)
+        self._local.connection = None
+        if conn is not None and self._pool is not None:
+            self._pool.release(conn)
+
+    @contextmanager
+    def connection_scope(self):
+        """Leases a pooled connection to the current thread for the duration of the block"""
+        if self.pool_settings is None or getattr(self._local, 'connection', None) is not None:
+            yield self.get_connection()
+            return
+        try:
+            yield self.get_connection()
+        finally:
+            self.release_connection()
+
+    def _get_executor(self):
+        """Creates the background worker pool on first use"""
+        with self._executor_lock:
+            if self._executor is None:
+                pool_size = self._get_pool().max_size if self.pool_settings is not None else None
+                workers = self.executor_workers
+                if workers is None:
+                    # The Tk thread keeps its own pooled connection for synchronous calls, so leave one for it
+                    workers = pool_size - 1 if pool_size is not None else 1
+                workers = max(1, int(workers))
+                if pool_size is not None and workers >= pool_size:
+                    logger.warning("%s query worker(s) share a pool of %s connection(s) with the UI thread; "
+                                   "raise pool.max_size so they do not wait for each other", workers, pool_size)
+                self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db-worker")
+                logger.info("Background query executor started with %s worker(s)", workers)
+            return self._executor
+
+    def submit(self, func, *args, **kwargs):
+        """Runs a DatabaseManager method (by name or as a callable) on the background worker pool and returns a Future"""
+        if isinstance(func, str):
+            func = getattr(self, func)
+        return self._get_executor().submit(self._run_in_worker, func, args, kwargs)
+
+    def _run_in_worker(self, func, args, kwargs):
+        """Executes a submitted call on a worker thread with its own leased connection"""
+        with self.connection_scope():
+            return func(*args, **kwargs)
+
+    def _get_password_executor(self):
+        """Creates the process pool for bcrypt work on first use, so hashing uses every core and never holds the GIL"""
+        with self._executor_lock:
+            if self._password_executor is None:
+                workers = max(1, int(self.password_workers or os.cpu_count() or 1))
+                # Spawned workers start clean instead of forking a process that runs Tk and the DB threads.
+                # They re-import the main script, so main.py and upload_data.py keep their setup under __main__
+                self._password_executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+                logger.info("Password hashing pool started with %s process(es)", workers)
+            return self._password_executor
+
+    def _run_password_task(self, func, *args):
+        """Runs a bcrypt function in the process pool and waits for the result, falling back to this process if the pool is broken"""
+        try:
+            return self._get_password_executor().submit(func, *args).result()
+        except BrokenProcessPool as e:
+            logger.warning("Password hashing pool is broken, hashing in-process: %s", e)
+            with self._executor_lock:
+                self._password_executor = None
+            return func(*args)
+
+    def hash_password_async(self, password):
+        """Hashes a password with the configured cost in the process pool and returns a Future of the hash"""
+        return self._get_password_executor().submit(hash_password, password, self.password_rounds)
+
+    def hash_passwords(self, passwords):
+        """Hashes many passwords in parallel with the configured cost and returns the hashes in the same order"""
+        passwords = list(passwords)
+        return list(self._get_password_executor().map(hash_password, passwords, [self.password_rounds] * len(passwords)))
+
+    def _upgrade_password_hash(self, user_id, password, stored_hash):
+        """Rehashes a just-verified password in the background if it was stored with a lower cost than configured"""
+        rounds = bcrypt_rounds(stored_hash)
+        if rounds is None or rounds >= self.password_rounds:
+            return
+        logger.info("Upgrading password hash of user %s from cost %s to %s", user_id, rounds, self.password_rounds)
+
+        def _on_hashed(future):
+            if future.cancelled() or future.exception() is not None:
+                logger.error("Password rehash failed for user %s: %s", user_id, future.exception() if not future.cancelled() else 'cancelled')
+                return
+            try:
+                self.submit(self._store_password_hash, user_id, stored_hash, future.result())
+            except RuntimeError:
+                pass
+
+        try:
+            self.hash_password_async(password).add_done_callback(_on_hashed)
+        except (RuntimeError, BrokenProcessPool) as e:
+            logger.error("Could not schedule password rehash for user %s: %s", user_id, e)
+
+    def _store_password_hash(self, user_id, old_hash, new_hash):
+        """Replaces a password hash unless the password was changed in the meantime"""
+        query = "UPDATE Users SET password_hash = %s WHERE user_id = %s AND password_hash = %s;"
+        return self.execute_query(query, (new_hash, user_id, old_hash))
+
+    def _current_operation(self):
+        """Returns the innermost operation tracked on this thread, or None"""
+        operations = getattr(self._local, 'operations', None)
+        return operations[-1] if operations else None
+
+    @contextmanager
+    def _track_operation(self, name):
+        """Times a block as one call of the named operation. Calls nested in an operation of the same name are part of it"""
+        current = self._current_operation()
+        if current is not None and current.name == name:
+            yield current
+            return
+
+        operations = getattr(self._local, 'operations', None)
+        if operations is None:
+            operations = self._local.operations = []
+        frame = OperationFrame(name)
+        operations.append(frame)
+        start = time.perf_counter()
+        try:
+            yield frame
+        except Exception:
+            frame.failed = True
+            raise
+        finally:
+            operations.pop()
+            if frame.failed and operations:
+                operations[-1].failed = True
+            self.metrics.record(name, (time.perf_counter() - start) * 1000, frame.rows, frame.failed)
+
+    def get_query_metrics(self):
+        """Returns a snapshot of per-operation latency histograms, row and error counts, recent slow queries and reference cache counters"""
+        snapshot = self.metrics.snapshot()
+        if self.reference_cache is not None:
+            snapshot['reference_cache'] = self.reference_cache.stats()
+        return snapshot
+
+    def subscribe_changes(self, callback):
+        """Registers callback(event) for data change events. It is called on the listener thread. Returns a function that unsubscribes it"""
+        with self._change_lock:
+            self._change_subscribers.append(callback)
+
+        def _unsubscribe():
+            with self._change_lock:
+                if callback in self._change_subscribers:
+                    self._change_subscribers.remove(callback)
+        return _unsubscribe
+
+    def start_change_listener(self):
+        """Starts a background thread that LISTENs for change notifications on its own connection, reconnecting when it drops"""
+        if not self.db_params or self._listener_thread is not None:
+            return
+        self._listener_stop.clear()
+        self._listener_thread = threading.Thread(target=self._listen_for_changes, name="db-change-listener", daemon=True)
+        self._listener_thread.start()
+
+    def stop_change_listener(self):
+        """Stops the change listener thread"""
+        thread, self._listener_thread = self._listener_thread, None
+        if thread is not None:
+            self._listener_stop.set()
+            thread.join(timeout=5)
+
+    def notify_reload(self):
+        """Tells every listening client that many rows changed at once (e.g. after a bulk load), so they reload instead of patching rows"""
+        return self.execute_query("SELECT pg_notify(%s, %s);", (CHANGE_CHANNEL, json.dumps({'table': '*', 'op': 'RELOAD'})), fetch_one=True)
+
+    def _listen_for_changes(self):
+        """Body of the listener thread: waits on the socket of a dedicated autocommit connection and handles every notification"""
+        retry_delay = 1.0
+        connected_before = False
+        while not self._listener_stop.is_set():
+            conn = self._connect()
+            if conn is None:
+                self._listener_stop.wait(retry_delay)
+                retry_delay = min(retry_delay * 2, 30.0)
+                continue
+
+            try:
+                conn.autocommit = True
+                with conn.cursor() as cur:
+                    cur.execute(sql.SQL("LISTEN {};").format(sql.Identifier(CHANGE_CHANNEL)))
+                logger.info("Listening for data changes on '%s'", CHANGE_CHANNEL)
+                retry_delay = 1.0
+                if connected_before:
+                    # Notifications sent while disconnected are lost
+                    self._handle_change({'table': '*', 'op': 'RELOAD'})
+                connected_before = True
+
+                while not self._listener_stop.is_set():
+                    if not select.select([conn], [], [], 1.0)[0]:
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        notification = conn.notifies.pop(0)
+                        try:
+                            event = json.loads(notification.payload)
+                        except ValueError:
+                            logger.warning("Ignoring malformed change notification: %s", notification.payload)
+                            continue
+                        self._handle_change(event)
+            except (psycopg2.Error, OSError) as e:
+                logger.warning("Change listener lost its connection, reconnecting: %s", e)
+                self._listener_stop.wait(retry_delay)
+            finally:
+                try:
+                    conn.close()
+                except psycopg2.Error:
+                    pass
+
+    def _handle_change(self, event):
+        """Drops the cached lookups a change affects and passes the event on to the subscribers"""
+        table = event.get('table')
+        game_id = event.get('game_id')
+        if table == '*':
+            self.invalidate_reference_cache()
+        elif table in ('games', 'game_genres', 'game_platforms', 'game_studios') and game_id is not None:
+            self.invalidate_reference_cache(game_id=game_id)
+        elif table == 'studios':
+            self.invalidate_reference_cache(('studios', 'game_studios'))
+        elif table in ('genres', 'platforms'):
+            self.invalidate_reference_cache((table,))
+        logger.debug("Data change: %s", event)
+
+        with self._change_lock:
+            subscribers = list(self._change_subscribers)
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Change subscriber failed for %s", event)
+
     def close_connection(self):
         """Closes an active connection with data base if it still exists"""
+        self.stop_change_listener()
+        self.metrics.stop_periodic_dump(self.metrics_dump_file)
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+            worker_connections, self._worker_connections = self._worker_connections, []
+            password_executor, self._password_executor = self._password_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if password_executor is not None:
+            password_executor.shutdown(wait=False, cancel_futures=True)
+        for conn in worker_connections:
+            try:
+                if not conn.closed:
+                    conn.close()
+            except Exception as e:
+                logger.error("Error closing worker connection: %s", e)
+
+        if self.pool_settings is not None:
+            self.release_connection()
+            with self._pool_lock:
+                if self._pool is not None:
+                    self._pool.close_all()
+                    self._pool = None
+                    logger.info("--- Connection pool with PostgreSQL is closed ---")
+            return
+
         if self.connection and not self.connection.closed:
             try:
                 self.connection.close()
-                print("\n--- Connection with PostgreSQL is closed ---")
+                logger.info("--- Connection with PostgreSQL is closed ---")
             except Exception as e:
-                print(f"Error closing database connection: {e}")
+                logger.error("Error closing database connection: %s", e)
         self.connection = None
 
-    def execute_many_query(self, query, params_list):
-        """Executes a query multiple times with different parameters"""
-        conn = self.get_connection()
-        if not conn:
-            print("Cannot execute bulk query: No active database connection")
-            return None
+    def execute_many_query(self, query, params_list, page_size=100):
+        """Executes a query multiple times with different parameters, sending page_size parameter sets per round trip"""
+        with self._track_operation(sys._getframe(1).f_code.co_name) as operation:
+            conn = self.get_connection()
+            if not conn:
+                operation.failed = True
+                logger.error("Cannot execute bulk query: No active database connection")
+                return None
 
-        result = None
-        try:
-            with conn:
-                with conn.cursor() as cur:
-                    cur.executemany(query, params_list)
-                    result = cur.rowcount
-                    print(f"Successfully executed bulk query for {result} rows")
-
-        except(Exception, psycopg2.Error) as error:
-            print(f"\nError executing bulk query: {error}")
-            print(f"Query: {query}")
-            print(f"Number of parameter sets attempted: {len(params_list)}")
-            return None
+            params_list = list(params_list)
+            try:
+                with conn:
+                    with conn.cursor() as cur:
+                        psycopg2.extras.execute_batch(cur, query, params_list, page_size=page_size)
+                        logger.info("Successfully executed bulk query for %s rows", len(params_list))
+
+            except(Exception, psycopg2.Error) as error:
+                operation.failed = True
+                logger.error("Error executing bulk query: %s", error)
+                logger.debug("Query: %s", query)
+                logger.debug("Number of parameter sets attempted: %s", len(params_list))
+                return None
 
-        return result
+            operation.rows = len(params_list)
+            self.invalidate_reference_cache()
+            return len(params_list)
+
+    def execute_values_query(self, query, rows, page_size=1000):
+        """Inserts rows from any iterable with multi-row VALUES statements, page_size rows per statement, in one transaction"""
+        with self._track_operation(sys._getframe(1).f_code.co_name) as operation:
+            conn = self.get_connection()
+            if not conn:
+                operation.failed = True
+                logger.error("Cannot execute bulk insert: No active database connection")
+                return None
+
+            total = 0
+            rows_iter = iter(rows)
+            try:
+                with conn:
+                    with conn.cursor() as cur:
+                        while True:
+                            page = list(islice(rows_iter, page_size))
+                            if not page:
+                                break
+                            psycopg2.extras.execute_values(cur, query, page, page_size=page_size)
+                            total += len(page)
+                logger.info("Successfully inserted %s rows", total)
+
+            except(Exception, psycopg2.Error) as error:
+                operation.failed = True
+                logger.error("Error executing bulk insert: %s", error)
+                logger.debug("Query: %s", query)
+                logger.error("Rows sent before the error: %s", total)
+                return None
+
+            operation.rows = total
+            self.invalidate_reference_cache()
+            return total
+
+    def copy_rows(self, table, columns, rows, page_size=1000):
+        """Streams rows from any iterable into the table with COPY FROM STDIN. Falls back to execute_values_query if the server refuses COPY"""
+        with self._track_operation(sys._getframe(1).f_code.co_name) as operation:
+            conn = self.get_connection()
+            if not conn:
+                operation.failed = True
+                logger.error("Cannot copy rows: No active database connection")
+                return None
+
+            column_list = sql.SQL(', ').join(map(sql.Identifier, columns))
+            copy_query = sql.SQL("COPY {} ({}) FROM STDIN").format(sql.Identifier(table), column_list)
+            stream = CopyRowStream(rows)
+            try:
+                with conn:
+                    with conn.cursor() as cur:
+                        cur.copy_expert(copy_query, stream, size=65536)
+                logger.info("Successfully copied %s rows into %s", stream.row_count, table)
+                operation.rows = stream.row_count
+                self.invalidate_reference_cache()
+                return stream.row_count
+
+            except(Exception, psycopg2.Error) as error:
+                if stream.row_count > 0:
+                    operation.failed = True
+                    logger.error("Error copying rows into %s: %s", table, error)
+                    logger.error("Rows sent before the error: %s", stream.row_count)
+                    return None
+                # Nothing has been read from the iterable yet, so the same rows can still go through INSERTs
+                logger.warning("COPY into %s is unavailable (%s), falling back to multi-row INSERTs", table, error)
+
+            insert_query = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(sql.Identifier(table), column_list)
+            return self.execute_values_query(insert_query, stream.rows, page_size=page_size)
 
     def execute_query(self, query, params=None, fetch_one=False, fetch_all=False):
-        """Executes one SQL-query"""
+        """Executes one SQL-query, counted in the metrics under the name of the calling method"""
+        with self._track_operation(sys._getframe(1).f_code.co_name) as operation:
+            return self._execute(operation, query, params, fetch_one, fetch_all)
+
+    def execute_prepared(self, name, params=None, fetch_one=False, fetch_all=False):
+        """Executes a statement from PREPARED_STATEMENTS, preparing it first if this connection has not seen it yet"""
+        with self._track_operation(sys._getframe(1).f_code.co_name) as operation:
+            if not self.use_prepared_statements:
+                return self._execute(operation, PREPARED_STATEMENTS[name], params, fetch_one, fetch_all)
+            placeholders = ', '.join(['%s'] * len(params or ()))
+            query = f"EXECUTE {name} ({placeholders});" if placeholders else f"EXECUTE {name};"
+            return self._execute(operation, query, params, fetch_one, fetch_all, prepared=name)
+
+    def _execute(self, operation, query, params, fetch_one, fetch_all, prepared=None, retry=True):
+        """Runs one statement in its own transaction on the current thread's connection"""
         conn = self.get_connection()
         if not conn:
-            print("Cannot execute query: No active database connection")
+            operation.failed = True
+            logger.error("Cannot execute query: No active database connection")
             return None
 
         result = None
         try:
             with conn:
                 with conn.cursor() as cur:
+                    if prepared is not None:
+                        self._ensure_prepared(conn, cur, prepared)
                     cur.execute(query, params)
 
                     if fetch_one:
@@ -133,65 +952,173 @@ class DatabaseManager:
                              result = None
 
         except (Exception, psycopg2.Error) as error:
-            print(f"\Error executing query: {error}")
-            print(f"query: {query}")
-            print(f"Parameters: {params}")
+            if prepared is not None and retry and isinstance(error, psycopg2.errors.InvalidSqlStatementName):
+                # The server dropped the statement (e.g. DISCARD ALL), so prepare it again
+                logger.warning("Prepared statement '%s' is gone on the server, preparing it again", prepared)
+                self._forget_prepared(conn, prepared)
+                operation.failed = False
+                return self._execute(operation, query, params, fetch_one, fetch_all, prepared, retry=False)
+            if prepared is not None and retry and isinstance(error, psycopg2.errors.DuplicatePreparedStatement):
+                # The server still has a statement the registry lost track of, so just execute it
+                logger.warning("Prepared statement '%s' already exists on the server, using it", prepared)
+                self._remember_prepared(conn, prepared)
+                operation.failed = False
+                return self._execute(operation, query, params, fetch_one, fetch_all, prepared, retry=False)
+
+            operation.failed = True
+            logger.error("Error executing query: %s", error)
+            logger.debug("query: %s", query)
+            logger.debug("Parameters: %s", params)
 
             return None
 
         return result
+
+    def stream_query(self, query, params, on_rows, handle=None, columns=None, chunk_size=200, statement_timeout_ms=None):
+        """Runs a SELECT through a server-side cursor, passing its rows to on_rows chunk by chunk. Returns the row count, or None on error, timeout or cancellation; handle.status tells which"""
+        def _end(status, result=None):
+            if handle is not None:
+                handle.status = status
+            return result
+
+        with self._track_operation(sys._getframe(1).f_code.co_name) as operation:
+            conn = self.get_connection()
+            if not conn:
+                operation.failed = True
+                logger.error("Cannot stream query: No active database connection")
+                return _end('failed')
+            if handle is not None and not handle._attach(conn):
+                return _end('cancelled')
+
+            row_count = 0
+            try:
+                with conn:
+                    if statement_timeout_ms:
+                        with conn.cursor() as cur:
+                            cur.execute("SET LOCAL statement_timeout = %s;", (int(statement_timeout_ms),))
+                    with conn.cursor(name=f"stream_{threading.get_ident()}") as cur:
+                        cur.execute(query, params)
+                        while True:
+                            rows = cur.fetchmany(chunk_size)
+                            if not rows or (handle is not None and handle.cancelled):
+                                break
+                            row_count += len(rows)
+                            on_rows([dict(zip(columns, row)) for row in rows] if columns else rows)
+            except psycopg2.errors.QueryCanceled as error:
+                if handle is not None and handle.cancelled:
+                    logger.debug("Streamed query cancelled")
+                    return _end('cancelled')
+                operation.failed = True
+                logger.warning("Streamed query stopped after %s ms: %s", statement_timeout_ms, error)
+                return _end('timeout')
+            except (Exception, psycopg2.Error) as error:
+                operation.failed = True
+                logger.error("Error streaming query: %s", error)
+                logger.debug("query: %s", query)
+                return _end('failed')
+            finally:
+                if handle is not None:
+                    handle._detach()
+
+            operation.rows = row_count
+            if handle is not None and handle.cancelled:
+                return _end('cancelled')
+            return _end('finished', row_count)
+
+    def _ensure_prepared(self, conn, cur, name):
+        """Sends PREPARE for a statement the first time it is used on a connection. A new connection starts with none"""
+        with self._prepared_lock:
+            prepared = self._prepared.setdefault(conn, set())
+            if name in prepared:
+                return
+        parts = PREPARED_STATEMENTS[name].strip().rstrip(';').split('%s')
+        statement = parts[0] + ''.join(f"${number}{part}" for number, part in enumerate(parts[1:], start=1))
+        cur.execute(f"PREPARE {name} AS {statement};")
+        logger.debug("Prepared statement '%s' on a new connection", name)
+        self._remember_prepared(conn, name)
+
+    def _remember_prepared(self, conn, name):
+        """Marks a statement as prepared on a connection"""
+        with self._prepared_lock:
+            self._prepared.setdefault(conn, set()).add(name)
+
+    def _forget_prepared(self, conn, name):
+        """Marks a statement the server no longer has as unprepared on a connection; the others stay prepared"""
+        with self._prepared_lock:
+            self._prepared.get(conn, set()).discard(name)
     
+    def invalidate_reference_cache(self, kinds=None, game_id=None):
+        """Drops cached reference lookups ('genres', 'platforms', 'game_studios', 'studios'), optionally only those of one game"""
+        if self.reference_cache is not None:
+            if kinds is None and game_id is not None:
+                kinds = GAME_REFERENCE_KINDS
+            dropped = self.reference_cache.invalidate(kinds, game_id)
+            logger.debug("Invalidated %s cached reference lookup(s) (kinds: %s, game: %s)", dropped, kinds, game_id)
+
+    def _get_cached_reference(self, key):
+        """Returns a cached reference lookup, or None on a miss or when the cache is disabled"""
+        return self.reference_cache.get(key) if self.reference_cache is not None else None
+
+    def _put_cached_reference(self, key, value):
+        """Caches a successfully loaded reference lookup"""
+        if self.reference_cache is not None:
+            self.reference_cache.put(key, value)
+
     def clear_specified_table(self, table_name):
         """Deleting all data from specified table"""
         try:
             query = sql.SQL("TRUNCATE TABLE {} RESTART IDENTITY CASCADE").format(sql.Identifier(table_name))
-            print(f"A safe query has formed: {query.as_string(self.get_connection())}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("A safe query has formed: %s", query.as_string(self.get_connection()))
 
             result = self.execute_query(query)
 
             if result is None:
-                print(f"Failed to clear the table '{table_name}'")
+                logger.error("Failed to clear the table '%s'", table_name)
                 return False
             else:
+                self.invalidate_reference_cache()
                 return True
 
         except Exception as e:
-            print(f"Unexpected error was occurred while trying to clear the table '{table_name}' : {e}")
+            logger.error("Unexpected error was occurred while trying to clear the table '%s' : %s", table_name, e)
             return False
 
     def validate_user(self, username, password):
         """Checks whether a user with that username exists and whether the provided password matches the stored hash in the database"""
-        print(f"DBManager validating user: {username}")
+        logger.debug("Validating user: %s", username)
         query = "SELECT user_id, password_hash, is_app_admin FROM Users WHERE username = %s;"
         result = self.execute_query(query, (username,), fetch_one=True)
 
         if result:
             user_id, stored_hash, is_app_admin = result
-            if bcrypt.checkpw(password.encode('utf-8'), stored_hash.encode('utf-8')):
-                print(f"User {username} validated successfully. User ID: {user_id}, Is App Admin: {is_app_admin}")
+            if self._run_password_task(check_password, password, stored_hash):
+                logger.debug("User %s validated successfully. User ID: %s, Is App Admin: %s", username, user_id, is_app_admin)
+                self._upgrade_password_hash(user_id, password, stored_hash)
                 return user_id, is_app_admin
             else:
-                print(f"Password validation failed for user {username}")
+                logger.warning("Password validation failed for user %s", username)
                 return None
         else:
-            print(f"User {username} not found.")
+            logger.warning("User %s not found.", username)
             return None
         
-    def register_user(self, username, email, password):
-        """Registers a new user in the system"""
+    @instrumented
+    def register_user(self, username, email, password=None, password_hash=None):
+        """Registers a new user in the system. A precomputed password_hash (see hash_password_async) skips hashing here"""
         conn = self.get_connection()
         if not conn:
             messagebox.showerror("Помилка Бази Даних", "Не вдалося підключитися до бази даних для реєстрації.")
             return False
 
-        try:
-            password_bytes = password.encode('utf-8')
-            salt = bcrypt.gensalt()
-            hashed_password_bytes = bcrypt.hashpw(password_bytes, salt)
-            hashed_password_str = hashed_password_bytes.decode('utf-8')
-        except Exception as e:
-            print(f"DB: Помилка хешування пароля для {username}: {e}")
-            return False
+        if password_hash is not None:
+            hashed_password_str = password_hash
+        else:
+            try:
+                hashed_password_str = self._run_password_task(hash_password, password, self.password_rounds)
+            except Exception as e:
+                logger.error("Помилка хешування пароля для %s: %s", username, e)
+                return False
 
         query = sql.SQL("""
             INSERT INTO Users (username, email, password_hash)
@@ -206,7 +1133,7 @@ class DatabaseManager:
             return True
 
         except psycopg2.IntegrityError as e:
-            print(f"DB: IntegrityError during registration for {username}: {e}")
+            logger.error("IntegrityError during registration for %s: %s", username, e)
             if "users_username_key" in str(e).lower():
                 messagebox.showerror("Помилка Реєстрації", f"Користувач з іменем '{username}' вже існує.")
             elif "users_email_key" in str(e).lower():
@@ -216,9 +1143,10 @@ class DatabaseManager:
             return False
 
         except (Exception, psycopg2.Error) as error:
-            print(f"\nDB: Error during user registration for '{username}': {error}")
-            print(f"Query: {query.as_string(conn) if conn else query}")
-            print(f"Parameters: {params}")
+            logger.error("Error during user registration for '%s': %s", username, error)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Query: %s", query.as_string(conn) if conn else query)
+            logger.debug("Parameters: %s", params)
             return False
 
 
@@ -226,31 +1154,25 @@ class DatabaseManager:
         """Fetches a list of all games from the database to display in the store. Sortable"""
         conn = self.get_connection()
         if not conn:
-            print("DB: No connection to fetch games.")
+            logger.error("No connection to fetch games.")
             return None
 
         allowed_sort_columns = {'title', 'price', 'purchase_count'}
         if sort_by not in allowed_sort_columns:
-            print(f"DB Warning: Invalid sort column '{sort_by}'. Defaulting to 'title'.")
+            logger.warning("Invalid sort column '%s'. Defaulting to 'title'.", sort_by)
             sort_by = 'title'
 
         sort_order = sort_order.upper()
         if sort_order not in ('ASC', 'DESC'):
-            print(f"DB Warning: Invalid sort order '{sort_order}'. Defaulting to 'ASC'.")
+            logger.warning("Invalid sort order '%s'. Defaulting to 'ASC'.", sort_order)
             sort_order = 'ASC'
 
         base_query = sql.SQL("""
             SELECT
                 g.game_id, g.title, NULL AS genre, g.price, g.image,
-                COUNT(pi.purchase_item_id) AS purchase_count
+                g.purchase_count
             FROM
                 games g
-            LEFT JOIN
-                Purchases_Items pi ON g.game_id = pi.game_id
-            LEFT JOIN
-                Purchases p ON pi.purchase_id = p.purchase_id AND p.status = 'Completed'
-            GROUP BY
-                g.game_id, g.title, g.price, g.image
         """)
 
         order_by_clause = sql.SQL("ORDER BY {sort_col} {sort_dir}")
@@ -275,24 +1197,99 @@ class DatabaseManager:
 
         query = sql.SQL(" ").join([base_query, order_by_sql])
 
-        print(f"DB: Fetching all games sorted by {sort_by} {sort_order}...")
+        logger.debug("Fetching all games sorted by %s %s...", sort_by, sort_order)
         try:
             games_data = self.execute_query(query, fetch_all=True)
 
             if games_data is None:
-                print("DB: Failed to fetch games (execute_query returned None)")
+                logger.error("Failed to fetch games (execute_query returned None)")
                 return None
             elif not games_data:
-                print("DB: Fetched 0 games.")
+                logger.debug("Fetched 0 games.")
                 return []
             else:
-                print(f"DB: Fetched {len(games_data)} games.")
+                logger.debug("Fetched %s games.", len(games_data))
                 return games_data
         except Exception as e:
-            print(f"DB: Unexpected error fetching sorted games: {e}")
-            traceback.print_exc()
+            logger.exception("Unexpected error fetching sorted games: %s", e)
             return None
     
+    def fetch_games_page(self, sort_by='title', sort_order='ASC', after=None, limit=50):
+        """Fetches one page of the store catalog using keyset pagination on (sort key, game_id). Returns (rows, next_cursor)"""
+        conn = self.get_connection()
+        if not conn:
+            logger.error("No connection to fetch games page.")
+            return None, None
+
+        sort_expressions = {
+            'title': sql.SQL("g.title"),
+            'price': sql.SQL("COALESCE(g.price, -1)"),
+            'purchase_count': sql.SQL("g.purchase_count")
+        }
+        if sort_by not in sort_expressions:
+            logger.warning("Invalid sort column '%s'. Defaulting to 'title'.", sort_by)
+            sort_by = 'title'
+
+        sort_order = sort_order.upper()
+        if sort_order not in ('ASC', 'DESC'):
+            logger.warning("Invalid sort order '%s'. Defaulting to 'ASC'.", sort_order)
+            sort_order = 'ASC'
+
+        sort_expr = sort_expressions[sort_by]
+        seek_sql = sql.SQL("")
+        params = []
+        if after is not None:
+            seek_op = sql.SQL(">") if sort_order == 'ASC' else sql.SQL("<")
+            seek_sql = sql.SQL("WHERE ({sort_expr}, g.game_id) {seek_op} (%s, %s)").format(sort_expr=sort_expr, seek_op=seek_op)
+            params.extend(after)
+        params.append(limit)
+
+        query = sql.SQL("""
+            SELECT
+                g.game_id, g.title, NULL AS genre, g.price, g.image,
+                g.purchase_count,
+                {sort_expr} AS sort_key
+            FROM
+                games g
+            {seek}
+            ORDER BY {sort_expr} {sort_dir}, g.game_id {sort_dir}
+            LIMIT %s
+        """).format(
+            sort_expr=sort_expr,
+            seek=seek_sql,
+            sort_dir=sql.SQL(sort_order)
+        )
+
+        logger.debug("Fetching games page sorted by %s %s after %s...", sort_by, sort_order, after)
+        try:
+            rows = self.execute_query(query, tuple(params), fetch_all=True)
+            if rows is None:
+                logger.error("Failed to fetch games page (execute_query returned None)")
+                return None, None
+
+            next_cursor = None
+            if len(rows) == limit:
+                last_row = rows[-1]
+                next_cursor = (last_row[6], last_row[0])
+            logger.debug("Fetched %s games for the page.", len(rows))
+            return [row[:6] for row in rows], next_cursor
+        except Exception as e:
+            logger.exception("Unexpected error fetching games page: %s", e)
+            return None, None
+
+    def fetch_store_rows(self, game_ids):
+        """Fetches the store list rows (same columns as fetch_games_page) of specific games, e.g. to patch rows that changed"""
+        query = sql.SQL("""
+            SELECT g.game_id, g.title, NULL AS genre, g.price, g.image, g.purchase_count
+            FROM games g
+            WHERE g.game_id = ANY(%s)
+        """)
+        try:
+            return self.execute_query(query, (list(game_ids),), fetch_all=True)
+        except Exception as e:
+            logger.exception("Unexpected error fetching store rows for games %s: %s", game_ids, e)
+            return None
+
     def fetch_game_details(self, game_id):
         """Fetches detailed information about one concrete game by it's id"""
         query = """
@@ -310,7 +1307,7 @@ class DatabaseManager:
                 g.game_id, g.title, g.description, g.price, g.image, g.status,
                 g.release_date, g.created_at, g.updated_at;
         """
-        print(f"DB: Fetching details and review count for game_id {game_id}...")
+        logger.debug("Fetching details and review count for game_id %s...", game_id)
         game_tuple = self.execute_query(query, (game_id,), fetch_one=True)
         if game_tuple:
             details = {
@@ -325,12 +1322,61 @@ class DatabaseManager:
                 'updated_at': game_tuple[8],
                 'review_count': game_tuple[9]
             }
-            print(f"DB: Fetched details for game {game_id}: Review count = {details['review_count']}")
+            logger.debug("Fetched details for game %s: Review count = %s", game_id, details['review_count'])
             return details
         else:
-            print(f"DB: Game details not found for game_id {game_id}.")
+            logger.warning("Game details not found for game_id %s.", game_id)
             return None
         
+    def fetch_game_page(self, game_id, user_id=None):
+        """Fetches everything the game detail page needs (details, genres, platforms, studios, edit permission and ownership) in a single query"""
+        query = """
+            SELECT
+                g.game_id, g.title, g.description, g.price, g.image, g.status,
+                g.release_date, g.created_at, g.updated_at,
+                (SELECT COUNT(*) FROM reviews r WHERE r.game_id = g.game_id) AS review_count,
+                COALESCE((SELECT array_agg(ge.name ORDER BY ge.name)
+                          FROM Genres ge JOIN Game_Genres gg ON ge.genre_id = gg.genre_id
+                          WHERE gg.game_id = g.game_id), '{}') AS genres,
+                COALESCE((SELECT array_agg(pl.name ORDER BY pl.name)
+                          FROM Platforms pl JOIN Game_Platforms gp ON pl.platform_id = gp.platform_id
+                          WHERE gp.game_id = g.game_id), '{}') AS platforms,
+                COALESCE((SELECT array_agg(s.name ORDER BY s.name)
+                          FROM Studios s JOIN Game_Studios gs ON s.studio_id = gs.studio_id
+                          WHERE gs.game_id = g.game_id AND gs.role = 'Developer'), '{}') AS developers,
+                COALESCE((SELECT array_agg(s.name ORDER BY s.name)
+                          FROM Studios s JOIN Game_Studios gs ON s.studio_id = gs.studio_id
+                          WHERE gs.game_id = g.game_id AND gs.role = 'Publisher'), '{}') AS publishers,
+                EXISTS (
+                    SELECT 1
+                    FROM Developers_Games dg
+                    JOIN Developers d ON dg.developer_id = d.developer_id
+                    WHERE d.user_id = %(user_id)s AND dg.game_id = g.game_id
+                ) AS can_edit,
+                EXISTS (
+                    SELECT 1
+                    FROM Purchases_Items pi
+                    JOIN Purchases p ON pi.purchase_id = p.purchase_id
+                    WHERE p.user_id = %(user_id)s AND pi.game_id = g.game_id AND p.status = 'Completed'
+                ) AS is_owned
+            FROM
+                games g
+            WHERE
+                g.game_id = %(game_id)s;
+        """
+        logger.debug("Fetching detail page bundle for game_id %s, user_id %s...", game_id, user_id)
+        game_tuple = self.execute_query(query, {'game_id': game_id, 'user_id': user_id}, fetch_one=True)
+        if not game_tuple:
+            logger.warning("Game details not found for game_id %s.", game_id)
+            return None
+
+        columns = ['game_id', 'title', 'description', 'price', 'image', 'status',
+                   'release_date', 'created_at', 'updated_at', 'review_count',
+                   'genres', 'platforms', 'developers', 'publishers', 'can_edit', 'is_owned']
+        page = dict(zip(columns, game_tuple))
+        logger.debug("Fetched detail page for game %s: Review count = %s, Owned = %s", game_id, page['review_count'], page['is_owned'])
+        return page
+
     def fetch_purchased_games(self, user_id):
         """Fetches a list of games that have been successfully bought by a concrete user"""
         query = """
@@ -347,28 +1393,29 @@ class DatabaseManager:
               AND p.status = 'Completed'
             ORDER BY g.title;
         """
-        print(f"DB: Fetching purchased games for user_id {user_id}...")
+        logger.debug("Fetching purchased games for user_id %s...", user_id)
         try:
             purchased_games = self.execute_query(query, (user_id,), fetch_all=True)
 
             if purchased_games is None:
-                print(f"DB: Error occurred while fetching purchased games for user_id {user_id}.")
+                logger.error("Error occurred while fetching purchased games for user_id %s.", user_id)
                 return None
             elif not purchased_games:
-                print(f"DB: No purchased games found for user_id {user_id}.")
+                logger.debug("No purchased games found for user_id %s.", user_id)
                 return []
             else:
-                print(f"DB: Found {len(purchased_games)} purchased games for user_id {user_id}.")
+                logger.debug("Found %s purchased games for user_id %s.", len(purchased_games), user_id)
                 return purchased_games
         except Exception as e:
-            print(f"DB: Unexpected error fetching purchased games for user_id {user_id}: {e}")
+            logger.error("Unexpected error fetching purchased games for user_id %s: %s", user_id, e)
             return None
             
+    @instrumented
     def purchase_game(self, user_id, game_id, price_at_purchase):
         """Implements a logic for user to purchase a game"""
         conn = self.get_connection()
         if not conn:
-            print("Cannot purchase game: No active database connection")
+            logger.error("Cannot purchase game: No active database connection")
             return False
 
         try:
@@ -377,7 +1424,7 @@ class DatabaseManager:
             else:
                 final_price = decimal.Decimal(str(price_at_purchase)).quantize(decimal.Decimal("0.01"))
         except (ValueError, TypeError, decimal.InvalidOperation) as e:
-             print(f"Error: Invalid price format for purchase: {price_at_purchase} - {e}")
+             logger.error("Invalid price format for purchase: %s - %s", price_at_purchase, e)
              return False
 
         purchase_id = None
@@ -405,7 +1452,7 @@ class DatabaseManager:
 
                     if result and result[0]:
                         purchase_id = result[0]
-                        print(f"DB: Created Purchases record with ID: {purchase_id}")
+                        logger.debug("Created Purchases record with ID: %s", purchase_id)
                     else:
                         raise psycopg2.DatabaseError("Failed to create Purchases record")
 
@@ -423,38 +1470,28 @@ class DatabaseManager:
                         cur.execute("UPDATE Users SET balance = %s WHERE user_id = %s;", (new_balance, user_id))
                         if cur.rowcount != 1:
                              raise psycopg2.DatabaseError("Failed to update user balance")
-                        print(f"DB: Updated balance for user {user_id} to {new_balance:.2f}")
+                        logger.debug("Updated balance for user %s to %.2f", user_id, new_balance)
 
-                    print(f"DB: Added game {game_id} to purchase {purchase_id} successfully.")
+                    logger.debug("Added game %s to purchase %s successfully.", game_id, purchase_id)
             return True
 
         except (ValueError, psycopg2.DatabaseError) as db_error:
-            print(f"\nError during game purchase transaction: {db_error}")
+            logger.error("Error during game purchase transaction: %s", db_error)
             return False
         except (Exception, psycopg2.Error) as error:
-            print(f"\nUnexpected error during game purchase transaction: {error}")
-            traceback.print_exc()
+            logger.exception("Unexpected error during game purchase transaction: %s", error)
             return False
         
     def check_ownership(self, user_id, game_id):
         """Checks if the user has a specific game"""
-        query = """
-            SELECT EXISTS (
-                SELECT 1
-                FROM Purchases_Items pi
-                JOIN Purchases p ON pi.purchase_id = p.purchase_id
-                WHERE p.user_id = %s
-                  AND pi.game_id = %s
-                  AND p.status = 'Completed'
-            );
-        """
         try:
-            result = self.execute_query(query, (user_id, game_id), fetch_one=True)
+            result = self.execute_prepared('check_ownership', (user_id, game_id), fetch_one=True)
             return result[0] if result else False
         except Exception as e:
-            print(f"DB: Error checking ownership for user {user_id}, game {game_id}: {e}")
+            logger.error("Error checking ownership for user %s, game %s: %s", user_id, game_id, e)
             return False
         
+    @instrumented
     def add_or_update_review(self, user_id, game_id, review_text):
         """Adds a new review on a game from the user"""
         conn = self.get_connection()
@@ -472,13 +1509,14 @@ class DatabaseManager:
             with conn:
                 with conn.cursor() as cur:
                     cur.execute(query, params)
-            print(f"DB: Review for game {game_id} by user {user_id} added successfully.")
+            logger.debug("Review for game %s by user %s added successfully.", game_id, user_id)
             return True
 
         except (Exception, psycopg2.Error) as error:
-            print(f"\nDB: Error adding review for game {game_id}, user {user_id}: {error}")
-            print(f"Query: {query.as_string(conn) if conn else query}")
-            print(f"Parameters: {params}")
+            logger.error("Error adding review for game %s, user %s: %s", game_id, user_id, error)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Query: %s", query.as_string(conn) if conn else query)
+            logger.debug("Parameters: %s", params)
             return False
     
     def fetch_game_reviews(self, game_id):
@@ -494,7 +1532,7 @@ class DatabaseManager:
             reviews_data = self.execute_query(query, (game_id,), fetch_all=True)
             return reviews_data
         except Exception as error:
-            print(f"DB: Error fetching reviews for game {game_id}: {error}")
+            logger.error("Error fetching reviews for game %s: %s", game_id, error)
             return None
 
     def fetch_review_comments(self, review_id):
@@ -510,9 +1548,48 @@ class DatabaseManager:
             comments_data = self.execute_query(query, (review_id,), fetch_all=True)
             return comments_data
         except Exception as error:
-            print(f"DB: Error fetching comments for review {review_id}: {error}")
+            logger.error("Error fetching comments for review %s: %s", review_id, error)
             return None
         
+    @instrumented
+    def fetch_game_reviews_with_comments(self, game_id):
+        """Fetches all reviews for concrete game together with their comments using two set-based queries"""
+        conn = self.get_connection()
+        if not conn: return None
+        reviews_query = sql.SQL("""
+            SELECT r.review_id, u.username, r.review_text, r.review_date
+            FROM reviews r JOIN users u ON r.user_id = u.user_id
+            WHERE r.game_id = %s ORDER BY r.review_date DESC;
+        """)
+        comments_query = sql.SQL("""
+            SELECT rc.review_id, u.username, rc.comment_text, rc.comment_date
+            FROM reviewcomments rc
+            JOIN reviews r ON rc.review_id = r.review_id
+            JOIN users u ON rc.user_id = u.user_id
+            WHERE r.game_id = %s ORDER BY rc.review_id, rc.comment_date ASC;
+        """)
+        try:
+            with conn:
+                with conn.cursor() as cur:
+                    cur.execute(reviews_query, (game_id,))
+                    reviews_data = cur.fetchall()
+                    if not reviews_data:
+                        return []
+                    cur.execute(comments_query, (game_id,))
+                    comments_data = cur.fetchall()
+
+            comments_by_review = {}
+            for review_id, username, comment_text, comment_date in comments_data:
+                comments_by_review.setdefault(review_id, []).append((username, comment_text, comment_date))
+
+            result = [review + (comments_by_review.get(review[0], []),) for review in reviews_data]
+            logger.debug("Fetched %s reviews with %s comments for game %s", len(result), len(comments_data), game_id)
+            return result
+        except (Exception, psycopg2.Error) as error:
+            logger.error("Error fetching reviews with comments for game %s: %s", game_id, error)
+            return None
+
+    @instrumented
     def add_review_comment(self, review_id, user_id, comment_text):
         """Adds a new comment to an existing review"""
         conn = self.get_connection()
@@ -530,35 +1607,38 @@ class DatabaseManager:
                     cur.execute(query, params)
             return True
         except (Exception, psycopg2.Error) as error:
-            print(f"\nDB: Error adding comment to review {review_id} by user {user_id}: {error}")
+            logger.error("Error adding comment to review %s by user %s: %s", review_id, user_id, error)
             return False
         
     def fetch_game_genres(self, game_id):
         """Fetches a list of genre names for a specific game"""
-        conn = self.get_connection()
-        if not conn or game_id is None:
+        if game_id is None:
             return []
 
-        query = sql.SQL("""
-            SELECT g.name
-            FROM Genres g
-            JOIN Game_Genres gg ON g.genre_id = gg.genre_id
-            WHERE gg.game_id = %s
-            ORDER BY g.name;
-        """)
+        cached = self._get_cached_reference(('genres', game_id))
+        if cached is not None:
+            return list(cached)
+
         try:
-            results = self.execute_query(query, (game_id,), fetch_all=True)
-            return [row[0] for row in results] if results else []
+            results = self.execute_prepared('fetch_game_genres', (game_id,), fetch_all=True)
+            if results is None:
+                return []
+            genres = [row[0] for row in results]
+            self._put_cached_reference(('genres', game_id), genres)
+            return list(genres)
         except Exception as e:
-            print(f"DB: Error fetching genres for game_id {game_id}: {e}")
+            logger.error("Error fetching genres for game_id %s: %s", game_id, e)
             return []
         
     def fetch_game_platforms(self, game_id):
         """Fetches a list of platform names for a specific game"""
-        conn = self.get_connection()
-        if not conn or game_id is None:
+        if game_id is None:
             return []
 
+        cached = self._get_cached_reference(('platforms', game_id))
+        if cached is not None:
+            return list(cached)
+
         query = sql.SQL("""
             SELECT p.name
             FROM Platforms p
@@ -568,23 +1648,30 @@ class DatabaseManager:
         """)
         try:
             results = self.execute_query(query, (game_id,), fetch_all=True)
-            return [row[0] for row in results] if results else []
+            if results is None:
+                return []
+            platforms = [row[0] for row in results]
+            self._put_cached_reference(('platforms', game_id), platforms)
+            return list(platforms)
         except Exception as e:
-            print(f"DB: Error fetching platforms for game_id {game_id}: {e}")
+            logger.error("Error fetching platforms for game_id %s: %s", game_id, e)
             return []
         
     def fetch_game_studios_by_role(self, game_id, role):
         """Fetches a list of studio names associated with game in specific role"""
-        conn = self.get_connection()
-        if not conn or game_id is None:
-            print(f"DB: Cannot fetch studios for game {game_id}, role {role}. Connection or game_id missing.")
+        if game_id is None:
+            logger.error("Cannot fetch studios for game %s, role %s. game_id missing.", game_id, role)
             return []
 
         valid_roles = ['Developer', 'Publisher']
         if role not in valid_roles:
-             print(f"DB: Invalid role '{role}' requested for game {game_id}.")
+             logger.warning("Invalid role '%s' requested for game %s.", role, game_id)
              return []
 
+        cached = self._get_cached_reference(('game_studios', game_id, role))
+        if cached is not None:
+            return list(cached)
+
         query = sql.SQL("""
             SELECT s.name
             FROM Studios s
@@ -595,11 +1682,14 @@ class DatabaseManager:
         try:
             params = (game_id, role)
             results = self.execute_query(query, params, fetch_all=True)
-            studio_names = [row[0] for row in results] if results else []
-            print(f"DB: Fetched {len(studio_names)} {role}(s) for game {game_id}: {studio_names}")
-            return studio_names
+            if results is None:
+                return []
+            studio_names = [row[0] for row in results]
+            logger.debug("Fetched %s %s(s) for game %s: %s", len(studio_names), role, game_id, studio_names)
+            self._put_cached_reference(('game_studios', game_id, role), studio_names)
+            return list(studio_names)
         except Exception as e:
-            print(f"DB: Error fetching {role} studios for game_id {game_id}: {e}")
+            logger.error("Error fetching %s studios for game_id %s: %s", role, game_id, e)
             return []
           
     def fetch_studio_details_by_name(self, studio_name):
@@ -625,54 +1715,53 @@ class DatabaseManager:
                     'logo': studio_tuple[3], 'country': studio_tuple[4], 'description': studio_tuple[5],
                     'established_date': studio_tuple[6]
                 }
-                print(f"DB: Fetched base details for studio: {studio_name} (ID: {studio_id})")
+                logger.debug("Fetched base details for studio: %s (ID: %s)", studio_name, studio_id)
 
                 query_dev_count = sql.SQL("SELECT COUNT(*) FROM Developers WHERE studio_id = %s;")
                 dev_count_result = self.execute_query(query_dev_count, (studio_id,), fetch_one=True)
                 if dev_count_result:
                     developer_count = dev_count_result[0]
-                print(f"DB: Developer count for studio {studio_id}: {developer_count}")
+                logger.debug("Developer count for studio %s: %s", studio_id, developer_count)
 
                 query_game_count = sql.SQL("SELECT COUNT(DISTINCT game_id) FROM Game_Studios WHERE studio_id = %s;")
                 game_count_result = self.execute_query(query_game_count, (studio_id,), fetch_one=True)
                 if game_count_result:
                     game_count = game_count_result[0]
-                print(f"DB: Game count for studio {studio_id}: {game_count}")
+                logger.debug("Game count for studio %s: %s", studio_id, game_count)
 
                 details['developer_count'] = developer_count
                 details['game_count'] = game_count
 
             else:
-                print(f"DB: Studio not found: {studio_name}")
+                logger.warning("Studio not found: %s", studio_name)
                 return None
         except Exception as e:
-            print(f"DB: Error fetching full studio details for '{studio_name}': {e}")
-            traceback.print_exc()
+            logger.exception("Error fetching full studio details for '%s': %s", studio_name, e)
             return None
 
         return details
         
     def fetch_user_info(self, user_id):
         """Fetches the username and their current balance"""
-        query = "SELECT username, balance FROM Users WHERE user_id = %s;"
-        print(f"DB: Fetching user info for user_id {user_id}...")
-        result = self.execute_query(query, (user_id,), fetch_one=True)
+        logger.debug("Fetching user info for user_id %s...", user_id)
+        result = self.execute_prepared('fetch_user_info', (user_id,), fetch_one=True)
         if result:
             try:
                 balance = decimal.Decimal(str(result[1])).quantize(decimal.Decimal("0.01"))
                 return {'username': result[0], 'balance': balance}
             except (TypeError, decimal.InvalidOperation):
-                 print(f"DB Warning: Invalid balance format for user {user_id}. Returning 0.00.")
+                 logger.warning("Invalid balance format for user %s. Returning 0.00.", user_id)
                  return {'username': result[0], 'balance': decimal.Decimal('0.00')}
         else:
-            print(f"DB: User info not found for user_id {user_id}.")
+            logger.warning("User info not found for user_id %s.", user_id)
             return None
 
+    @instrumented
     def add_funds(self, user_id, amount_to_add):
         """Adds specified sum of finds on user's balance"""
         conn = self.get_connection()
         if not conn:
-            print("DB Error: No connection to add funds.")
+            logger.error("No connection to add funds.")
             messagebox.showerror("Помилка Бази Даних", "Немає підключення до бази даних.", parent=None)
             return False
 
@@ -680,36 +1769,35 @@ class DatabaseManager:
             amount_decimal = decimal.Decimal(str(amount_to_add)).quantize(decimal.Decimal("0.01"))
             if amount_decimal <= 0:
                 messagebox.showerror("Помилка Вводу", "Сума для нарахування повинна бути позитивною.", parent=None)
-                print(f"DB Error: Amount to add must be positive ({amount_decimal}).")
+                logger.error("Amount to add must be positive (%s).", amount_decimal)
                 return False
         except (ValueError, TypeError, decimal.InvalidOperation) as e:
             messagebox.showerror("Помилка Вводу", f"Некоректний формат суми: '{amount_to_add}'.", parent=None)
-            print(f"DB Error: Invalid amount format '{amount_to_add}': {e}")
+            logger.error("Invalid amount format '%s': %s", amount_to_add, e)
             return False
 
         query = sql.SQL("UPDATE Users SET balance = balance + %s WHERE user_id = %s;")
         params = (amount_decimal, user_id)
 
         try:
-            print(f"DB: Attempting to add {amount_decimal} to balance for user_id {user_id}")
+            logger.debug("Attempting to add %s to balance for user_id %s", amount_decimal, user_id)
             with conn:
                 with conn.cursor() as cur:
                     cur.execute(query, params)
                     if cur.rowcount == 1:
-                        print(f"DB: Successfully added funds for user_id {user_id}.")
+                        logger.info("Successfully added funds for user_id %s.", user_id)
                         return True
                     else:
                         messagebox.showerror("Помилка", f"Користувача з ID {user_id} не знайдено.", parent=None)
-                        print(f"DB Error: User with user_id {user_id} not found when adding funds.")
+                        logger.warning("User with user_id %s not found when adding funds.", user_id)
                         return False
         except psycopg2.Error as db_error:
             messagebox.showerror("Помилка Бази Даних", f"Помилка під час нарахування коштів:\n{db_error}", parent=None)
-            print(f"\nDB Error adding funds for user {user_id}: {db_error}")
+            logger.error("Error adding funds for user %s: %s", user_id, db_error)
             return False
         except Exception as e:
             messagebox.showerror("Неочікувана Помилка", f"Неочікувана помилка під час нарахування коштів:\n{e}", parent=None)
-            print(f"\nDB Unexpected error adding funds for user {user_id}: {e}")
-            traceback.print_exc()
+            logger.exception("Unexpected error adding funds for user %s: %s", user_id, e)
             return False
         
     def check_developer_status(self, user_id):
@@ -721,21 +1809,21 @@ class DatabaseManager:
                 WHERE user_id = %s
             );
         """)
-        print(f"DB: Checking developer status for user_id {user_id}...")
+        logger.debug("Checking developer status for user_id %s...", user_id)
         try:
             result = self.execute_query(query, (user_id,), fetch_one=True)
             if result:
                 is_dev = result[0]
-                print(f"DB: Developer status for user {user_id}: {is_dev}")
+                logger.debug("Developer status for user %s: %s", user_id, is_dev)
                 return is_dev
             else:
-                print(f"DB Warning: Failed to execute developer status check query for user {user_id}.")
+                logger.warning("Failed to execute developer status check query for user %s.", user_id)
                 return False
         except Exception as e:
-            print(f"DB: Error checking developer status for user {user_id}: {e}")
-            traceback.print_exc()
+            logger.exception("Error checking developer status for user %s: %s", user_id, e)
             return False
 
+    @instrumented
     def set_developer_status(self, user_id, status=True, contact_email=None, cursor=None):
         """Adds or removes a user from the Developers table. Can operate within an existing transaction if cursor is provided."""
         manage_connection = cursor is None
@@ -761,14 +1849,13 @@ class DatabaseManager:
             if manage_connection and conn and not conn.closed:
                 pass
             action_desc = "ensure/update developer entry" if status else "remove developer status"
-            print(f"\nDB Error during '{action_desc}' for user {user_id}: {db_error}")
+            logger.error("Error during '%s' for user %s: %s", action_desc, user_id, db_error)
             return False
         except Exception as e:
             if manage_connection and conn and not conn.closed:
                  pass
             action_desc = "ensure/update developer entry" if status else "remove developer status"
-            print(f"\nDB Unexpected error during '{action_desc}' for user {user_id}: {e}")
-            traceback.print_exc()
+            logger.exception("Unexpected error during '%s' for user %s: %s", action_desc, user_id, e)
             return False
           
     def _execute_set_developer_status_logic(self, cur, user_id, status, contact_email):
@@ -780,9 +1867,9 @@ class DatabaseManager:
                  user_info = cur.fetchone()
                  if user_info and user_info[0]:
                       contact_email = user_info[0]
-                      print(f"DB: No contact email provided for becoming developer (user {user_id}). Using primary email: {contact_email}")
+                      logger.debug("No contact email provided for becoming developer (user %s). Using primary email: %s", user_id, contact_email)
                  else:
-                      print(f"DB Error: Cannot set developer status for user {user_id} without a contact email if status is True.")
+                      logger.error("Cannot set developer status for user %s without a contact email if status is True.", user_id)
                       return False 
 
             insert_query = sql.SQL("""
@@ -801,11 +1888,12 @@ class DatabaseManager:
             action_desc = "remove developer status"
             current_query_to_execute = delete_query
 
-        print(f"DB: Attempting to {action_desc} for user {user_id} using provided cursor.")
+        logger.debug("Attempting to %s for user %s using provided cursor.", action_desc, user_id)
         cur.execute(current_query_to_execute, params)
-        print(f"DB: Operation '{action_desc}' complete for user {user_id}. Affected rows: {cur.rowcount}")
+        logger.debug("Operation '%s' complete for user %s. Affected rows: %s", action_desc, user_id, cur.rowcount)
         return True
     
+    @instrumented
     def delete_user_account(self, user_id):
         """Deletes a user account and all related data via CASCADE constraints"""
         conn = self.get_connection()
@@ -817,42 +1905,40 @@ class DatabaseManager:
         params = (user_id,)
 
         try:
-            print(f"DB: Attempting to delete user account with ID: {user_id}")
+            logger.debug("Attempting to delete user account with ID: %s", user_id)
             with conn:
                 with conn.cursor() as cur:
                     cur.execute(query, params)
                     if cur.rowcount == 1:
-                        print(f"DB: Successfully deleted user account with ID: {user_id}")
+                        logger.info("Successfully deleted user account with ID: %s", user_id)
                         return True
                     else:
-                        print(f"DB: User account with ID: {user_id} not found for deletion.")
+                        logger.warning("User account with ID: %s not found for deletion.", user_id)
                         return False
         except psycopg2.Error as db_error:
-            print(f"\nDB: Error deleting user account {user_id}: {db_error}")
+            logger.error("Error deleting user account %s: %s", user_id, db_error)
             return False
         except Exception as e:
-            print(f"\nDB: Unexpected error deleting user account {user_id}: {e}")
-            traceback.print_exc()
+            logger.exception("Unexpected error deleting user account %s: %s", user_id, e)
             return False
         
           
     def fetch_all_studios(self, sort_by='name', sort_order='ASC'):
         """Fetches a list of all studios, optionally sorted"""
-        conn = self.get_connection()
-        if not conn:
-            print("DB: No connection to fetch studios.")
-            return None
-
         allowed_sort_columns = {'name', 'country', 'established_date'}
         if sort_by not in allowed_sort_columns:
-            print(f"DB Warning: Invalid sort column '{sort_by}' for studios. Defaulting to 'name'.")
+            logger.warning("Invalid sort column '%s' for studios. Defaulting to 'name'.", sort_by)
             sort_by = 'name'
 
         sort_order = sort_order.upper()
         if sort_order not in ('ASC', 'DESC'):
-            print(f"DB Warning: Invalid sort order '{sort_order}'. Defaulting to 'ASC'.")
+            logger.warning("Invalid sort order '%s'. Defaulting to 'ASC'.", sort_order)
             sort_order = 'ASC'
 
+        cached = self._get_cached_reference(('studios', sort_by, sort_order))
+        if cached is not None:
+            return [dict(studio) for studio in cached]
+
         order_by_sql = sql.SQL("ORDER BY {sort_col} {sort_dir}").format(
             sort_col=sql.Identifier(sort_by),
             sort_dir=sql.SQL(sort_order)
@@ -861,26 +1947,28 @@ class DatabaseManager:
         base_query = sql.SQL("SELECT studio_id, name, logo, country FROM Studios")
         query = sql.SQL(" ").join([base_query, order_by_sql])
 
-        print(f"DB: Fetching all studios sorted by {sort_by} {sort_order}...")
+        logger.debug("Fetching all studios sorted by %s %s...", sort_by, sort_order)
         try:
             studios_data = self.execute_query(query, fetch_all=True)
 
             if studios_data is None:
-                print("DB: Failed to fetch studios (execute_query returned None)")
+                logger.error("Failed to fetch studios (execute_query returned None)")
                 return None
             elif not studios_data:
-                print("DB: Fetched 0 studios.")
+                logger.debug("Fetched 0 studios.")
+                self._put_cached_reference(('studios', sort_by, sort_order), [])
                 return []
             else:
-                print(f"DB: Fetched {len(studios_data)} studios.")
+                logger.debug("Fetched %s studios.", len(studios_data))
                 columns = ['studio_id', 'name', 'logo', 'country']
                 studios_list = [dict(zip(columns, row)) for row in studios_data]
-                return studios_list
+                self._put_cached_reference(('studios', sort_by, sort_order), studios_list)
+                return [dict(studio) for studio in studios_list]
         except Exception as e:
-            print(f"DB: Unexpected error fetching sorted studios: {e}")
-            traceback.print_exc()
+            logger.exception("Unexpected error fetching sorted studios: %s", e)
             return None
 
+    @instrumented
     def submit_studio_application(self, user_id, studio_id):
         """Submits an application for a user to join a studio"""
         conn = self.get_connection()
@@ -900,10 +1988,10 @@ class DatabaseManager:
         try:
             existing_pending_app = self.execute_query(query_check_pending, (user_id,), fetch_one=True)
             if existing_pending_app:
-                print(f"DB: User {user_id} already has a pending application.")
+                logger.debug("User %s already has a pending application.", user_id)
                 return False
         except Exception as e:
-             print(f"DB: Error checking for existing pending applications for user {user_id}: {e}")
+             logger.error("Error checking for existing pending applications for user %s: %s", user_id, e)
              return False
 
         query_insert = sql.SQL("""
@@ -919,19 +2007,19 @@ class DatabaseManager:
                 with conn.cursor() as cur:
                     cur.execute(query_insert, params)
                     if cur.rowcount > 0:
-                        print(f"DB: Application submitted successfully by user {user_id} for studio {studio_id}.")
+                        logger.debug("Application submitted successfully by user %s for studio %s.", user_id, studio_id)
                         return True
                     else:
-                        print(f"DB: Pending application likely already exists for user {user_id}, studio {studio_id} (ON CONFLICT triggered).")
+                        logger.debug("Pending application likely already exists for user %s, studio %s (ON CONFLICT triggered).", user_id, studio_id)
                         return False
         except psycopg2.Error as db_error:
-            print(f"DB Error submitting application for user {user_id}, studio {studio_id}: {db_error}")
+            logger.error("Error submitting application for user %s, studio %s: %s", user_id, studio_id, db_error)
             return False
         except Exception as e:
-            print(f"DB Unexpected error submitting application: {e}")
-            traceback.print_exc()
+            logger.exception("Unexpected error submitting application: %s", e)
             return False
         
+    @instrumented
     def process_studio_application(self, application_id, new_status, admin_user_id):
         """Processes a pending studio application"""
         conn = self.get_connection()
@@ -940,10 +2028,10 @@ class DatabaseManager:
             return False
 
         if new_status not in ('Accepted', 'Rejected'):
-            print(f"DB Error: Invalid new status '{new_status}' for application processing.")
+            logger.error("Invalid new status '%s' for application processing.", new_status)
             return False
 
-        print(f"DB: Processing application {application_id} to status '{new_status}' by admin {admin_user_id}")
+        logger.debug("Processing application %s to status '%s' by admin %s", application_id, new_status, admin_user_id)
 
         studio_id = None
         applicant_user_id = None
@@ -957,7 +2045,7 @@ class DatabaseManager:
                     """, (application_id,))
                     app_data = cur.fetchone()
                     if not app_data:
-                        print(f"DB: Application {application_id} not found or not pending.")
+                        logger.warning("Application %s not found or not pending.", application_id)
                         return False
                     applicant_user_id, studio_id = app_data
 
@@ -966,7 +2054,7 @@ class DatabaseManager:
                         WHERE user_id = %s AND studio_id = %s AND role = 'Admin';
                     """, (admin_user_id, studio_id))
                     if cur.fetchone() is None:
-                        print(f"DB: User {admin_user_id} is not authorized (not Admin) to process applications for studio {studio_id}.")
+                        logger.debug("User %s is not authorized (not Admin) to process applications for studio %s.", admin_user_id, studio_id)
                         conn.rollback()
                         return False
 
@@ -976,7 +2064,7 @@ class DatabaseManager:
                         WHERE application_id = %s;
                     """, (new_status, admin_user_id, application_id))
                     if cur.rowcount == 0:
-                        print(f"DB: Failed to update application {application_id} status.")
+                        logger.error("Failed to update application %s status.", application_id)
                         conn.rollback()
                         return False
 
@@ -986,27 +2074,26 @@ class DatabaseManager:
                             WHERE user_id = %s AND studio_id IS NULL;
                         """, (studio_id, applicant_user_id))
                         if cur.rowcount == 0:
-                            print(f"DB Warning: Could not assign accepted user {applicant_user_id} to studio {studio_id}. User not found in Developers or already has a studio.")
+                            logger.warning("Could not assign accepted user %s to studio %s. User not found in Developers or already has a studio.", applicant_user_id, studio_id)
                         else:
-                            print(f"DB: User {applicant_user_id} successfully added to studio {studio_id} as Member.")
+                            logger.debug("User %s successfully added to studio %s as Member.", applicant_user_id, studio_id)
 
-            print(f"DB: Application {application_id} processed successfully to status '{new_status}'.")
+            logger.debug("Application %s processed successfully to status '%s'.", application_id, new_status)
             return True
 
         except psycopg2.Error as db_error:
-            print(f"DB Error processing application {application_id}: {db_error}")
+            logger.error("Error processing application %s: %s", application_id, db_error)
             return False
         except Exception as e:
-            print(f"DB Unexpected error processing application {application_id}: {e}")
-            traceback.print_exc()
+            logger.exception("Unexpected error processing application %s: %s", application_id, e)
             return False
     
     def fetch_pending_applications(self, studio_id, admin_user_id):
         """Fetches pending applications for a specific studio"""
-        print(f"DB: Fetching pending applications for studio {studio_id} by admin {admin_user_id}")
+        logger.debug("Fetching pending applications for studio %s by admin %s", studio_id, admin_user_id)
         role = self.check_developer_role(admin_user_id, studio_id)
         if role != 'Admin':
-            print(f"DB: User {admin_user_id} is not an admin for studio {studio_id}. Role: {role}")
+            logger.debug("User %s is not an admin for studio %s. Role: %s", admin_user_id, studio_id, role)
             return []
 
         query = sql.SQL("""
@@ -1020,42 +2107,39 @@ class DatabaseManager:
             results = self.execute_query(query, (studio_id,), fetch_all=True)
             if results is None: return None
             apps = [{'id': row[0], 'username': row[1], 'date': row[2]} for row in results]
-            print(f"DB: Found {len(apps)} pending applications for studio {studio_id}.")
+            logger.debug("Found %s pending applications for studio %s.", len(apps), studio_id)
             return apps
         except Exception as e:
-            print(f"DB: Error fetching pending applications for studio {studio_id}: {e}")
-            traceback.print_exc()
+            logger.exception("Error fetching pending applications for studio %s: %s", studio_id, e)
             return None
           
     def get_developer_studio_id(self, user_id):
         """Gets the studio_id associated with a developer user"""
-        query = "SELECT studio_id FROM Developers WHERE user_id = %s;"
-        result = self.execute_query(query, (user_id,), fetch_one=True)
+        result = self.execute_prepared('get_developer_studio_id', (user_id,), fetch_one=True)
         return result[0] if result and result[0] is not None else None
           
     def check_developer_role(self, user_id, studio_id):
         """Checks the role of a developer within a specific studio"""
-        query = "SELECT role FROM Developers WHERE user_id = %s AND studio_id = %s;"
-        result = self.execute_query(query, (user_id, studio_id), fetch_one=True)
+        result = self.execute_prepared('check_developer_role', (user_id, studio_id), fetch_one=True)
         return result[0] if result else None
 
           
     def get_pending_application_count(self, studio_id, admin_user_id):
         """Gets the count of pending applications for a specific studio"""
-        print(f"DB: Getting pending application count for studio {studio_id} by admin {admin_user_id}")
+        logger.debug("Getting pending application count for studio %s by admin %s", studio_id, admin_user_id)
         role = self.check_developer_role(admin_user_id, studio_id)
         if role != 'Admin':
-            print(f"DB: User {admin_user_id} is not an admin for studio {studio_id}. Role: {role}")
+            logger.debug("User %s is not an admin for studio %s. Role: %s", admin_user_id, studio_id, role)
             return 0
 
         query = sql.SQL("SELECT COUNT(*) FROM StudioApplications WHERE studio_id = %s AND status = 'Pending';")
         try:
             result = self.execute_query(query, (studio_id,), fetch_one=True)
             count = result[0] if result else 0
-            print(f"DB: Pending application count for studio {studio_id}: {count}")
+            logger.debug("Pending application count for studio %s: %s", studio_id, count)
             return count
         except Exception as e:
-            print(f"DB: Error getting pending application count for studio {studio_id}: {e}")
+            logger.error("Error getting pending application count for studio %s: %s", studio_id, e)
             return 0
 
     def check_pending_application(self, user_id, studio_id):
@@ -1069,10 +2153,10 @@ class DatabaseManager:
         try:
             result = self.execute_query(query, (user_id, studio_id), fetch_one=True)
             exists = result[0] if result else False
-            print(f"DB: Pending application check for user {user_id}, studio {studio_id}: {'Exists' if exists else 'Does not exist'}")
+            logger.debug("Pending application check for user %s, studio %s: %s", user_id, studio_id, 'Exists' if exists else 'Does not exist')
             return exists
         except Exception as e:
-            print(f"DB: Error checking pending application for user {user_id}, studio {studio_id}: {e}")
+            logger.error("Error checking pending application for user %s, studio %s: %s", user_id, studio_id, e)
             return False
         
     def check_game_edit_permission(self, user_id, game_id):
@@ -1088,13 +2172,13 @@ class DatabaseManager:
         try:
             result = self.execute_query(query, (user_id, game_id), fetch_one=True)
             can_edit = result[0] if result else False
-            print(f"DB: Edit permission check (link exists) for user {user_id}, game {game_id}: {can_edit}")
+            logger.debug("Edit permission check (link exists) for user %s, game %s: %s", user_id, game_id, can_edit)
             return can_edit
         except Exception as e:
-            print(f"DB: Error checking game edit permission (link exists) for user {user_id}, game {game_id}: {e}")
-            traceback.print_exc()
+            logger.exception("Error checking game edit permission (link exists) for user %s, game %s: %s", user_id, game_id, e)
             return False
         
+    @instrumented
     def update_game_details(self, game_id, new_description=None, new_price=None, editor_user_id=None):
         """Updates the description and/or price for a specific game. Relies on DB trigger for updated_at.""" 
         conn = self.get_connection()
@@ -1103,7 +2187,7 @@ class DatabaseManager:
             return False
 
         if new_description is None and new_price is None:
-            print("DB: No changes provided to update_game_details.")
+            logger.debug("No changes provided to update_game_details.")
             return True
 
         update_fields = []
@@ -1127,113 +2211,47 @@ class DatabaseManager:
                     update_fields.append(sql.SQL("price = %s"))
                     params.append(validated_price)
             except (ValueError, TypeError, InvalidOperation) as e:
-                print(f"DB Error: Invalid price format '{new_price}': {e}")
+                logger.error("Invalid price format '%s': %s", new_price, e)
                 return False
         params.append(game_id)
 
         if not update_fields:
-            print("DB: No valid fields to update after validation.")
+            logger.debug("No valid fields to update after validation.")
             return True
 
         set_clause = sql.SQL(", ").join(update_fields)
         query = sql.SQL("UPDATE Games SET {fields} WHERE game_id = %s").format(fields=set_clause)
 
-        print(f"DB: Attempting to update game {game_id} by user {editor_user_id}.")
-        print(f"DB: Query: {query.as_string(conn)}")
-        print(f"DB: Params: {tuple(params)}")
+        logger.debug("Attempting to update game %s by user %s.", game_id, editor_user_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Query: %s", query.as_string(conn))
+        logger.debug("Params: %s", tuple(params))
 
         try:
             with conn:
                 with conn.cursor() as cur:
                     cur.execute(query, tuple(params))
                     if cur.rowcount == 1:
-                        print(f"DB: Successfully updated game {game_id} (trigger handled updated_at).")
-                        return True
+                        logger.info("Successfully updated game %s (trigger handled updated_at).", game_id)
                     elif cur.rowcount == 0:
-                        print(f"DB Warning: Game with ID {game_id} not found for update, or no actual changes made.")
+                        logger.warning("Game with ID %s not found for update, or no actual changes made.", game_id)
                         return True
                     else:
-                        print(f"DB Error: Unexpected rowcount ({cur.rowcount}) updating game {game_id}.")
+                        logger.error("Unexpected rowcount (%s) updating game %s.", cur.rowcount, game_id)
                         conn.rollback()
                         return False
+            # Dropped after the commit, so a concurrent read cannot cache the old rows again
+            self.invalidate_reference_cache(game_id=game_id)
+            return True
 
         except psycopg2.Error as db_error:
-            print(f"\nDB Error updating game {game_id}: {db_error}")
+            logger.error("Error updating game %s: %s", game_id, db_error)
             return False
         except Exception as e:
-            print(f"\nDB Unexpected error updating game {game_id}: {e}")
-            traceback.print_exc()
+            logger.exception("Unexpected error updating game %s: %s", game_id, e)
             return False
         
-    def fetch_all_users_for_admin(self, search_term=None, sort_by='username', sort_order='ASC'):
-        conn = self.get_connection()
-        if not conn:
-            print("DB: No connection to fetch users for admin.")
-            return None
-
-        allowed_sort_columns = {'user_id', 'username', 'email', 'registration_date', 'balance', 'owned_games_count', 'total_spent'}
-        db_sort_key = sort_by
-        if sort_by == 'total_spent':
-             print("DB Warning: Sorting by calculated 'total_spent' might be slow or complex. Sorting by username instead for now.")
-             db_sort_key = 'username'
-        elif sort_by not in allowed_sort_columns:
-            db_sort_key = 'username'
-
-        sort_order_sql_literal = sort_order.upper()
-        if sort_order_sql_literal not in ('ASC', 'DESC'):
-            sort_order_sql_literal = 'ASC'
-
-        sort_order_sql = sql.SQL(sort_order_sql_literal)
-
-        base_query_parts = [
-            sql.SQL("""
-            SELECT
-                u.user_id, u.username, u.email, u.registration_date, u.balance,
-                u.is_app_admin, u.is_banned,
-                EXISTS (SELECT 1 FROM Developers d WHERE d.user_id = u.user_id) as is_developer,
-                (SELECT s.name FROM Studios s JOIN Developers d ON s.studio_id = d.studio_id WHERE d.user_id = u.user_id LIMIT 1) as developer_studio_name,
-                (SELECT COUNT(DISTINCT pi.game_id)
-                    FROM Purchases_Items pi
-                    JOIN Purchases p ON pi.purchase_id = p.purchase_id
-                    WHERE p.user_id = u.user_id AND p.status = 'Completed'
-                ) as owned_games_count,
-                calculate_total_spent(u.user_id) as total_spent
-            FROM Users u
-            """)
-        ]
-        params = []
-
-        if search_term:
-            base_query_parts.append(sql.SQL("WHERE u.username ILIKE %s OR u.email ILIKE %s"))
-            like_pattern = f"%{search_term}%"
-            params.extend([like_pattern, like_pattern])
-
-        base_query_parts.append(sql.SQL("ORDER BY {sort_col} {sort_dir}").format(
-            sort_col=sql.Identifier(db_sort_key),
-            sort_dir=sort_order_sql
-        ))
-
-        if db_sort_key != 'user_id':
-            base_query_parts.append(sql.SQL(", u.user_id {sort_dir}").format(sort_dir=sort_order_sql))
-
-        query = sql.SQL(" ").join(base_query_parts)
-
-        print(f"DB: Fetching all users for admin. Sort: {db_sort_key} {sort_order_sql_literal}. Search: '{search_term}'")
-        try:
-            users_data = self.execute_query(query, tuple(params) if params else None, fetch_all=True)
-            if users_data is None:
-                print("DB: Failed to fetch users for admin.")
-                return None
-
-            columns = ['user_id', 'username', 'email', 'registration_date', 'balance',
-                       'is_app_admin', 'is_banned', 'is_developer',
-                       'developer_studio_name', 'owned_games_count', 'total_spent']
-            return [dict(zip(columns, row)) for row in users_data]
-        except Exception as e:
-            print(f"DB: Unexpected error fetching users for admin: {e}")
-            traceback.print_exc()
-            return None
-        
+    @instrumented
     def set_user_ban_status(self, target_user_id, ban_status, admin_user_id):
         """Sets the ban status for a target user."""
         conn = self.get_connection()
@@ -1256,103 +2274,128 @@ class DatabaseManager:
         params = (ban_status, target_user_id)
 
         try:
-            print(f"DB: Admin {admin_user_id} attempting to set ban_status={ban_status} for user_id {target_user_id}")
+            logger.debug("Admin %s attempting to set ban_status=%s for user_id %s", admin_user_id, ban_status, target_user_id)
             with conn:
                 with conn.cursor() as cur:
                     cur.execute(query, params)
                     if cur.rowcount == 1:
-                        print(f"DB: Successfully updated ban status for user_id {target_user_id}.")
+                        logger.info("Successfully updated ban status for user_id %s.", target_user_id)
                         return True
                     else:
-                        print(f"DB Error: User with user_id {target_user_id} not found for ban status update.")
+                        logger.warning("User with user_id %s not found for ban status update.", target_user_id)
                         return False
         except psycopg2.Error as db_error:
-            print(f"\nDB Error updating ban status for user {target_user_id}: {db_error}")
+            logger.error("Error updating ban status for user %s: %s", target_user_id, db_error)
             return False
         except Exception as e:
-            print(f"\nDB Unexpected error updating ban status for user {target_user_id}: {e}")
-            traceback.print_exc()
+            logger.exception("Unexpected error updating ban status for user %s: %s", target_user_id, e)
             return False
         
-    def fetch_all_users_for_admin(self, search_term=None, sort_by='username', sort_order='ASC'):
+    @staticmethod
+    def _keyset_seek(sort_expr, id_expr, sort_order, after):
+        """WHERE condition and parameters selecting the rows after a (sort value, id) cursor"""
+        if after is None:
+            return None, []
+        seek_op = sql.SQL(">") if sort_order == 'ASC' else sql.SQL("<")
+        if sort_expr is None:
+            return sql.SQL("{id_expr} {seek_op} %s").format(id_expr=id_expr, seek_op=seek_op), [after[-1]]
+        return sql.SQL("({sort_expr}, {id_expr}) {seek_op} (%s, %s)").format(
+            sort_expr=sort_expr, id_expr=id_expr, seek_op=seek_op), list(after)
+
+    @staticmethod
+    def _keyset_page(rows, columns, limit):
+        """Splits the rows of a keyset query (whose last two columns are the sort value and the id) into dicts and the next cursor"""
+        next_cursor = None
+        if limit is not None and len(rows) == limit:
+            next_cursor = (rows[-1][-2], rows[-1][-1])
+        return [dict(zip(columns, row)) for row in rows], next_cursor
+
+    def fetch_all_users_for_admin(self, search_term=None, sort_by='username', sort_order='ASC', user_ids=None, after=None, limit=None):
+        """Fetches the users of the admin panel. With a limit, returns one keyset page as (rows, next_cursor) like fetch_games_page"""
         conn = self.get_connection()
         if not conn:
-            print("DB: No connection to fetch users for admin.")
-            return None
+            logger.error("No connection to fetch users for admin.")
+            return (None, None) if limit is not None else None
 
         allowed_sort_columns = {'user_id', 'username', 'email', 'registration_date', 'balance', 'owned_games_count', 'total_spent'}
-        db_sort_key = sort_by
-        
-        if sort_by == 'total_spent':
-            pass 
-        elif sort_by not in allowed_sort_columns:
-            db_sort_key = 'username'
-        
+        db_sort_key = sort_by if sort_by in allowed_sort_columns else 'username'
+
         sort_order_sql_literal = sort_order.upper()
         if sort_order_sql_literal not in ('ASC', 'DESC'):
             sort_order_sql_literal = 'ASC'
         
         sort_order_sql = sql.SQL(sort_order_sql_literal)
+        sort_col = sql.Identifier('u', db_sort_key)
 
         base_query_parts = [
             sql.SQL("""
             SELECT
                 u.user_id, u.username, u.email, u.registration_date, u.balance,
                 u.is_app_admin, u.is_banned,
-                EXISTS (SELECT 1 FROM Developers d WHERE d.user_id = u.user_id) as is_developer,
-                (SELECT s.name FROM Studios s JOIN Developers d ON s.studio_id = d.studio_id WHERE d.user_id = u.user_id LIMIT 1) as developer_studio_name,
-                (SELECT COUNT(DISTINCT pi.game_id)
-                    FROM Purchases_Items pi
-                    JOIN Purchases p ON pi.purchase_id = p.purchase_id
-                    WHERE p.user_id = u.user_id AND p.status = 'Completed'
-                ) as owned_games_count,
-                calculate_total_spent(u.user_id) as total_spent
+                (d.developer_id IS NOT NULL) as is_developer,
+                s.name as developer_studio_name,
+                u.owned_games_count,
+                u.total_spent,
+                {sort_col} AS sort_key, u.user_id AS seek_id
             FROM Users u
-            """)
+            LEFT JOIN Developers d ON d.user_id = u.user_id
+            LEFT JOIN Studios s ON s.studio_id = d.studio_id
+            """).format(sort_col=sort_col)
         ]
         params = []
+        conditions = []
 
         if search_term:
-            base_query_parts.append(sql.SQL("WHERE u.username ILIKE %s OR u.email ILIKE %s"))
+            conditions.append(sql.SQL("(u.username ILIKE %s OR u.email ILIKE %s)"))
             like_pattern = f"%{search_term}%"
             params.extend([like_pattern, like_pattern])
+        if user_ids is not None:
+            conditions.append(sql.SQL("u.user_id = ANY(%s)"))
+            params.append(list(user_ids))
+        seek_sql, seek_params = self._keyset_seek(
+            sort_col if db_sort_key != 'user_id' else None, sql.SQL("u.user_id"), sort_order_sql_literal, after)
+        if seek_sql is not None:
+            conditions.append(seek_sql)
+            params.extend(seek_params)
+        if conditions:
+            base_query_parts.append(sql.SQL("WHERE ") + sql.SQL(" AND ").join(conditions))
 
         base_query_parts.append(sql.SQL("ORDER BY {sort_col} {sort_dir}").format(
-            sort_col=sql.Identifier(db_sort_key), 
+            sort_col=sort_col,
             sort_dir=sort_order_sql
         ))
         
         if db_sort_key != 'user_id':
             base_query_parts.append(sql.SQL(", u.user_id {sort_dir}").format(sort_dir=sort_order_sql))
+        if limit is not None:
+            base_query_parts.append(sql.SQL("LIMIT %s"))
+            params.append(limit)
 
         query = sql.SQL(" ").join(base_query_parts)
 
-        print(f"DB: Fetching all users for admin (using calculate_total_spent). Sort: {db_sort_key} {sort_order_sql_literal}. Search: '{search_term}'")
+        logger.debug("Fetching all users for admin. Sort: %s %s. Search: '%s'. After: %s", db_sort_key, sort_order_sql_literal, search_term, after)
         try:
             users_data_tuples = self.execute_query(query, tuple(params) if params else None, fetch_all=True)
             if users_data_tuples is None:
-                print("DB: Failed to fetch users for admin.")
-                return None
+                logger.error("Failed to fetch users for admin.")
+                return (None, None) if limit is not None else None
             
             columns = ['user_id', 'username', 'email', 'registration_date', 'balance',
                        'is_app_admin', 'is_banned', 'is_developer', 
                        'developer_studio_name', 'owned_games_count', 'total_spent']
             
-            users_list_of_dicts = []
-            for row_tuple in users_data_tuples:
-                users_list_of_dicts.append(dict(zip(columns, row_tuple)))
-            
-            return users_list_of_dicts
+            users_list_of_dicts, next_cursor = self._keyset_page(users_data_tuples, columns, limit)
+            return (users_list_of_dicts, next_cursor) if limit is not None else users_list_of_dicts
         except Exception as e:
-            print(f"DB: Unexpected error fetching users for admin: {e}")
-            traceback.print_exc()
-            return None
+            logger.exception("Unexpected error fetching users for admin: %s", e)
+            return (None, None) if limit is not None else None
         
-    def fetch_all_studios_for_admin(self, search_term=None, sort_by='name', sort_order='ASC'):
+    def fetch_all_studios_for_admin(self, search_term=None, sort_by='name', sort_order='ASC', after=None, limit=None):
+        """Fetches the studios of the admin panel. With a limit, returns one keyset page as (rows, next_cursor) like fetch_games_page"""
         conn = self.get_connection()
         if not conn:
-            print("DB: No connection to fetch studios for admin.")
-            return None
+            logger.error("No connection to fetch studios for admin.")
+            return (None, None) if limit is not None else None
 
         allowed_sort_columns = {'studio_id', 'name', 'country', 'established_date', 'game_count', 'developer_count'}
         if sort_by not in allowed_sort_columns:
@@ -1362,6 +2405,7 @@ class DatabaseManager:
         if sort_order_sql_literal not in ('ASC', 'DESC'):
             sort_order_sql_literal = 'ASC'
         sort_order_sql = sql.SQL(sort_order_sql_literal)
+        sort_col = sql.Identifier('found', sort_by)
 
         base_query_parts = [
             sql.SQL("""
@@ -1378,34 +2422,46 @@ class DatabaseManager:
             base_query_parts.append(sql.SQL("WHERE s.name ILIKE %s"))
             params.append(f"%{search_term}%")
 
-        base_query_parts.append(sql.SQL("ORDER BY {sort_col} {sort_dir}").format(
-            sort_col=sql.Identifier(sort_by),
+        # The counts are computed columns, so the cursor is applied to the wrapped result
+        query_parts = [sql.SQL("SELECT found.*, {sort_col} AS sort_key, found.studio_id AS seek_id FROM ({base}) found").format(
+            sort_col=sort_col, base=sql.SQL(" ").join(base_query_parts))]
+        seek_sql, seek_params = self._keyset_seek(
+            sort_col if sort_by != 'studio_id' else None, sql.SQL("found.studio_id"), sort_order_sql_literal, after)
+        if seek_sql is not None:
+            query_parts.append(sql.SQL("WHERE ") + seek_sql)
+            params.extend(seek_params)
+
+        query_parts.append(sql.SQL("ORDER BY {sort_col} {sort_dir}").format(
+            sort_col=sort_col,
             sort_dir=sort_order_sql
         ))
         if sort_by != 'studio_id':
-            base_query_parts.append(sql.SQL(", s.studio_id {sort_dir}").format(sort_dir=sort_order_sql))
-
+            query_parts.append(sql.SQL(", found.studio_id {sort_dir}").format(sort_dir=sort_order_sql))
+        if limit is not None:
+            query_parts.append(sql.SQL("LIMIT %s"))
+            params.append(limit)
 
-        query = sql.SQL(" ").join(base_query_parts)
+        query = sql.SQL(" ").join(query_parts)
 
-        print(f"DB: Fetching all studios for admin. Sort: {sort_by} {sort_order_sql_literal}. Search: '{search_term}'")
+        logger.debug("Fetching all studios for admin. Sort: %s %s. Search: '%s'. After: %s", sort_by, sort_order_sql_literal, search_term, after)
         try:
             studios_data = self.execute_query(query, tuple(params) if params else None, fetch_all=True)
             if studios_data is None:
-                print("DB: Failed to fetch studios for admin.")
-                return None
+                logger.error("Failed to fetch studios for admin.")
+                return (None, None) if limit is not None else None
             
             columns = ['studio_id', 'name', 'logo', 'country', 'established_date', 'game_count', 'developer_count']
-            return [dict(zip(columns, row)) for row in studios_data]
+            studios, next_cursor = self._keyset_page(studios_data, columns, limit)
+            return (studios, next_cursor) if limit is not None else studios
         except Exception as e:
-            print(f"DB: Unexpected error fetching studios for admin: {e}")
-            traceback.print_exc()
-            return None
+            logger.exception("Unexpected error fetching studios for admin: %s", e)
+            return (None, None) if limit is not None else None
         
-    def fetch_all_games_for_admin(self, search_term=None, sort_by='title', sort_order='ASC'):
+    def fetch_all_games_for_admin(self, search_term=None, sort_by='title', sort_order='ASC', after=None, limit=None):
+        """Fetches the games of the admin panel. With a limit, returns one keyset page as (rows, next_cursor) like fetch_games_page"""
         conn = self.get_connection()
         if not conn:
-            return None
+            return (None, None) if limit is not None else None
 
         allowed_sort_columns = {'game_id', 'title', 'price', 'status', 'release_date', 'purchase_count'}
         if sort_by not in allowed_sort_columns:
@@ -1416,55 +2472,316 @@ class DatabaseManager:
             sort_order_sql_literal = 'ASC'
         sort_order_sql = sql.SQL(sort_order_sql_literal)
 
+        sort_expr = ADMIN_GAME_SORT_EXPRS.get(sort_by) or sql.Identifier('g', sort_by)
+
         base_query_parts = [
             sql.SQL("""
             SELECT
                 g.game_id, g.title, g.price, g.status, g.release_date, g.image,
-                (SELECT COUNT(pi.purchase_item_id)
-                FROM Purchases_Items pi
-                JOIN Purchases p ON pi.purchase_id = p.purchase_id
-                WHERE pi.game_id = g.game_id AND p.status = 'Completed'
-                ) AS purchase_count
+                g.purchase_count,
+                {sort_expr} AS sort_key, g.game_id AS seek_id
             FROM games g
-            """)
+            """).format(sort_expr=sort_expr)
         ]
         params = []
+        conditions = []
 
         if search_term:
-            base_query_parts.append(sql.SQL("WHERE g.title ILIKE %s"))
+            conditions.append(sql.SQL("g.title ILIKE %s"))
             params.append(f"%{search_term}%")
+        seek_sql, seek_params = self._keyset_seek(
+            sort_expr if sort_by != 'game_id' else None, sql.SQL("g.game_id"), sort_order_sql_literal, after)
+        if seek_sql is not None:
+            conditions.append(seek_sql)
+            params.extend(seek_params)
+        if conditions:
+            base_query_parts.append(sql.SQL("WHERE ") + sql.SQL(" AND ").join(conditions))
         
-        order_by_clause = sql.SQL("ORDER BY {sort_col} {sort_dir}")
-    
-        if sort_by == 'price':
-            nulls_placement = sql.SQL("NULLS FIRST") if sort_order_sql_literal == 'ASC' else sql.SQL("NULLS LAST")
-            primary_order = order_by_clause.format(sort_col=sql.Identifier(sort_by), sort_dir=sort_order_sql)
-            secondary_order_col = sql.Identifier('title')
-            secondary_order_dir = sql.SQL('ASC')
-            base_query_parts.append(sql.SQL(" ").join([primary_order, nulls_placement, sql.SQL(","), secondary_order_col, secondary_order_dir]))
-        elif sort_by == 'game_id': 
-            primary_order = order_by_clause.format(sort_col=sql.Identifier(sort_by), sort_dir=sort_order_sql)
-            base_query_parts.append(primary_order)
-        else: 
-            primary_order = order_by_clause.format(sort_col=sql.Identifier(sort_by), sort_dir=sort_order_sql)
-            secondary_order_col = sql.Identifier('game_id')
-            secondary_order_dir = sql.SQL('ASC') 
-            base_query_parts.append(sql.SQL(" ").join([primary_order, sql.SQL(","), secondary_order_col, secondary_order_dir]))
+        if sort_by == 'game_id':
+            base_query_parts.append(sql.SQL("ORDER BY g.game_id {sort_dir}").format(sort_dir=sort_order_sql))
+        else:
+            base_query_parts.append(sql.SQL("ORDER BY {sort_expr} {sort_dir}, g.game_id {sort_dir}").format(
+                sort_expr=sort_expr, sort_dir=sort_order_sql))
+        if limit is not None:
+            base_query_parts.append(sql.SQL("LIMIT %s"))
+            params.append(limit)
 
         query = sql.SQL(" ").join(base_query_parts)
-        print(f"DB: Fetching all games for admin. Sort: {sort_by} {sort_order_sql_literal}. Search: '{search_term}'")
+        logger.debug("Fetching all games for admin. Sort: %s %s. Search: '%s'. After: %s", sort_by, sort_order_sql_literal, search_term, after)
         
         try:
             games_data = self.execute_query(query, tuple(params) if params else None, fetch_all=True)
-            if games_data is None: return None
+            if games_data is None: return (None, None) if limit is not None else None
             
             columns = ['game_id', 'title', 'price', 'status', 'release_date', 'image', 'purchase_count']
-            return [dict(zip(columns, row)) for row in games_data]
+            games, next_cursor = self._keyset_page(games_data, columns, limit)
+            return (games, next_cursor) if limit is not None else games
+        except Exception as e:
+            logger.exception("Unexpected error fetching games for admin: %s", e)
+            return (None, None) if limit is not None else None
+
+    def fetch_admin_changes(self, kind, since=None, limit=1000):
+        """Returns (checked_at, ids of 'users', 'studios' or 'games' rows modified or deleted after since). checked_at is the snapshot the check saw, passed back as since next time. The ids are None if since is None or more than limit rows changed"""
+        tables = {'users': ('users', 'user_id'), 'studios': ('studios', 'studio_id'), 'games': ('games', 'game_id')}
+        if kind not in tables:
+            logger.error("Unknown admin list '%s' for a change check.", kind)
+            return None, None
+        table, id_column = tables[kind]
+
+        if since is None:
+            row = self.execute_query("SELECT pg_current_snapshot()::text;", fetch_one=True)
+            return (row[0] if row else None), None
+
+        # A row changed if the transaction that wrote it had not committed in the previous check's snapshot;
+        # this follows commit order, so long transactions and bulk loads are not missed. Transactions older than
+        # the snapshot's xmin were all finished then, which lets the modified_xid indexes skip them.
+        # Deleted rows have no modified_xid left, their ids come from the Deleted_Rows tombstones
+        query = sql.SQL("""
+            WITH checked AS (SELECT %s::pg_snapshot AS since)
+            SELECT pg_current_snapshot()::text, ARRAY(
+                SELECT changed.row_id
+                FROM (
+                    SELECT {id_column} AS row_id, modified_xid AS changed_xid
+                    FROM {table}, checked
+                    WHERE modified_xid >= pg_snapshot_xmin(checked.since)
+                      AND NOT pg_visible_in_snapshot(modified_xid, checked.since)
+                    UNION ALL
+                    SELECT row_id, deleted_xid
+                    FROM Deleted_Rows, checked
+                    WHERE table_name = %s AND deleted_xid >= pg_snapshot_xmin(checked.since)
+                      AND NOT pg_visible_in_snapshot(deleted_xid, checked.since)
+                ) changed
+                ORDER BY changed.changed_xid
+                LIMIT %s
+            )
+        """).format(id_column=sql.Identifier(id_column), table=sql.Identifier(table))
+        row = self.execute_query(query, (since, table, limit + 1), fetch_one=True)
+        if not row:
+            logger.error("Failed to check %s for changes.", kind)
+            return None, None
+        checked_at, changed_ids = row
+        logger.debug("%s %s changed since %s", len(changed_ids), kind, since)
+        return checked_at, (changed_ids if len(changed_ids) <= limit else None)
+
+    def _fetch_ranked_rows(self, query, params, columns, what):
+        """Runs an admin search query and returns its rows as dicts"""
+        try:
+            rows = self.execute_query(query, params, fetch_all=True)
+            if rows is None:
+                logger.error("Failed to search %s for admin.", what)
+                return None
+            return [dict(zip(columns, row)) for row in rows]
         except Exception as e:
-            print(f"DB: Unexpected error fetching games for admin: {e}")
-            traceback.print_exc()
+            logger.exception("Unexpected error searching %s for admin: %s", what, e)
             return None
-    
+
+    @staticmethod
+    def _search_order(sort_by, sort_order, allowed_sort_columns, alias, id_column, sort_exprs=None):
+        """ORDER BY of a ranked search: by relevance unless the admin picked a column. sort_exprs maps columns to the expressions the paged list sorts them by"""
+        sort_dir = sql.SQL('DESC' if str(sort_order).upper() == 'DESC' else 'ASC')
+        if sort_by in allowed_sort_columns:
+            col = (sort_exprs or {}).get(sort_by) or sql.Identifier(alias, sort_by)
+            return sql.SQL("ORDER BY {col} {dir}, m.rank DESC, {id_col}").format(
+                col=col, dir=sort_dir, id_col=sql.Identifier(alias, id_column))
+        return sql.SQL("ORDER BY m.rank DESC, {id_col}").format(id_col=sql.Identifier(alias, id_column))
+
+    def search_users_for_admin(self, search_term, sort_by=None, sort_order='ASC', limit=ADMIN_SEARCH_LIMIT):
+        """Finds users by login or email through the trigram indexes, returning at most limit best matches"""
+        search_term = (search_term or '').strip()
+        if not search_term:
+            return self.fetch_all_users_for_admin(None, sort_by or 'username', sort_order)
+        query, params, columns = self._build_users_search(search_term, sort_by, sort_order, limit)
+        logger.debug("Searching users for admin: '%s' (limit %s)", search_term, limit)
+        return self._fetch_ranked_rows(query, params, columns, 'users')
+
+    def _build_users_search(self, search_term, sort_by, sort_order, limit):
+        """Returns the query, parameters and column names of a user search"""
+        like_pattern = f"%{search_term}%"
+        if len(search_term) < MIN_TRIGRAM_TERM_LENGTH:
+            matches = sql.SQL("""
+                SELECT u.user_id, 0 AS rank
+                FROM Users u
+                WHERE u.username ILIKE %s OR u.email ILIKE %s
+                ORDER BY u.username, u.user_id
+                LIMIT %s
+            """)
+            params = [like_pattern, like_pattern, limit]
+        else:
+            # Only the capped candidates are ranked: the nearest matches by the GiST index (KNN) plus some substring matches
+            matches = sql.SQL("""
+                SELECT u.user_id,
+                       GREATEST(word_similarity(%s, u.username), word_similarity(%s, u.email))
+                       + CASE WHEN u.username ILIKE %s THEN 1 ELSE 0 END AS rank
+                FROM (
+                    (SELECT user_id FROM Users WHERE %s <%% username ORDER BY %s <<-> username LIMIT %s)
+                    UNION
+                    (SELECT user_id FROM Users WHERE %s <%% email ORDER BY %s <<-> email LIMIT %s)
+                    UNION
+                    (SELECT user_id FROM Users WHERE username ILIKE %s OR email ILIKE %s LIMIT %s)
+                ) candidates
+                JOIN Users u ON u.user_id = candidates.user_id
+                ORDER BY rank DESC, u.user_id
+                LIMIT %s
+            """)
+            params = [search_term, search_term, f"{search_term}%",
+                      search_term, search_term, limit,
+                      search_term, search_term, limit,
+                      like_pattern, like_pattern, limit,
+                      limit]
+
+        allowed_sort_columns = {'user_id', 'username', 'email', 'registration_date', 'balance', 'owned_games_count', 'total_spent'}
+        query = sql.SQL("""
+            WITH m AS ({matches})
+            SELECT
+                u.user_id, u.username, u.email, u.registration_date, u.balance,
+                u.is_app_admin, u.is_banned,
+                (d.developer_id IS NOT NULL) as is_developer,
+                s.name as developer_studio_name,
+                u.owned_games_count,
+                u.total_spent,
+                m.rank
+            FROM m
+            JOIN Users u ON u.user_id = m.user_id
+            LEFT JOIN Developers d ON d.user_id = u.user_id
+            LEFT JOIN Studios s ON s.studio_id = d.studio_id
+            {order}
+        """).format(matches=matches, order=self._search_order(sort_by, sort_order, allowed_sort_columns, 'u', 'user_id'))
+
+        columns = ['user_id', 'username', 'email', 'registration_date', 'balance',
+                   'is_app_admin', 'is_banned', 'is_developer',
+                   'developer_studio_name', 'owned_games_count', 'total_spent', 'rank']
+        return query, tuple(params), columns
+
+    def search_studios_for_admin(self, search_term, sort_by=None, sort_order='ASC', limit=ADMIN_SEARCH_LIMIT):
+        """Finds studios by name through the trigram index, returning at most limit best matches"""
+        search_term = (search_term or '').strip()
+        if not search_term:
+            return self.fetch_all_studios_for_admin(None, sort_by or 'name', sort_order)
+        query, params, columns = self._build_studios_search(search_term, sort_by, sort_order, limit)
+        logger.debug("Searching studios for admin: '%s' (limit %s)", search_term, limit)
+        return self._fetch_ranked_rows(query, params, columns, 'studios')
+
+    def _build_studios_search(self, search_term, sort_by, sort_order, limit):
+        """Returns the query, parameters and column names of a studio search"""
+        like_pattern = f"%{search_term}%"
+        if len(search_term) < MIN_TRIGRAM_TERM_LENGTH:
+            matches = sql.SQL("""
+                SELECT s.studio_id, 0 AS rank
+                FROM Studios s
+                WHERE s.name ILIKE %s
+                ORDER BY s.name, s.studio_id
+                LIMIT %s
+            """)
+            params = [like_pattern, limit]
+        else:
+            matches = sql.SQL("""
+                SELECT s.studio_id,
+                       word_similarity(%s, s.name) + CASE WHEN s.name ILIKE %s THEN 1 ELSE 0 END AS rank
+                FROM (
+                    (SELECT studio_id FROM Studios WHERE %s <%% name ORDER BY %s <<-> name LIMIT %s)
+                    UNION
+                    (SELECT studio_id FROM Studios WHERE name ILIKE %s LIMIT %s)
+                ) candidates
+                JOIN Studios s ON s.studio_id = candidates.studio_id
+                ORDER BY rank DESC, s.studio_id
+                LIMIT %s
+            """)
+            params = [search_term, f"{search_term}%",
+                      search_term, search_term, limit,
+                      like_pattern, limit,
+                      limit]
+
+        query = sql.SQL("""
+            WITH m AS ({matches})
+            SELECT
+                s.studio_id, s.name, s.logo, s.country, s.established_date,
+                (SELECT COUNT(DISTINCT gs.game_id) FROM Game_Studios gs WHERE gs.studio_id = s.studio_id) as game_count,
+                (SELECT COUNT(d.developer_id) FROM Developers d WHERE d.studio_id = s.studio_id) as developer_count,
+                m.rank
+            FROM m
+            JOIN Studios s ON s.studio_id = m.studio_id
+            {order}
+        """).format(matches=matches, order=self._search_order(sort_by, sort_order, {'studio_id', 'name', 'country', 'established_date'}, 's', 'studio_id'))
+        if sort_by in ('game_count', 'developer_count'):
+            sort_dir = sql.SQL('DESC' if str(sort_order).upper() == 'DESC' else 'ASC')
+            query = sql.SQL("SELECT * FROM ({search}) found ORDER BY {col} {dir}, rank DESC, studio_id").format(
+                search=query, col=sql.Identifier(sort_by), dir=sort_dir)
+
+        columns = ['studio_id', 'name', 'logo', 'country', 'established_date', 'game_count', 'developer_count', 'rank']
+        return query, tuple(params), columns
+
+    def search_games_for_admin(self, search_term, sort_by=None, sort_order='ASC', limit=ADMIN_SEARCH_LIMIT):
+        """Finds games by title (trigram index) or by words of the title and description (full-text index)"""
+        search_term = (search_term or '').strip()
+        if not search_term:
+            return self.fetch_all_games_for_admin(None, sort_by or 'title', sort_order)
+        query, params, columns = self._build_games_search(search_term, sort_by, sort_order, limit)
+        logger.debug("Searching games for admin: '%s' (limit %s)", search_term, limit)
+        return self._fetch_ranked_rows(query, params, columns, 'games')
+
+    def _build_games_search(self, search_term, sort_by, sort_order, limit):
+        """Returns the query, parameters and column names of a game search"""
+        like_pattern = f"%{search_term}%"
+        if len(search_term) < MIN_TRIGRAM_TERM_LENGTH:
+            matches = sql.SQL("""
+                SELECT g.game_id, 0 AS rank
+                FROM Games g
+                WHERE g.title ILIKE %s
+                ORDER BY g.title, g.game_id
+                LIMIT %s
+            """)
+            params = [like_pattern, limit]
+        else:
+            matches = sql.SQL("""
+                SELECT g.game_id,
+                       word_similarity(%s, g.title)
+                       + ts_rank({document}, websearch_to_tsquery('simple', %s))
+                       + CASE WHEN g.title ILIKE %s THEN 1 ELSE 0 END AS rank
+                FROM (
+                    (SELECT game_id FROM Games WHERE %s <%% title ORDER BY %s <<-> title LIMIT %s)
+                    UNION
+                    (SELECT game_id FROM Games WHERE title ILIKE %s LIMIT %s)
+                    UNION
+                    (SELECT g.game_id FROM Games g WHERE {document} @@ websearch_to_tsquery('simple', %s) LIMIT %s)
+                ) candidates
+                JOIN Games g ON g.game_id = candidates.game_id
+                ORDER BY rank DESC, g.game_id
+                LIMIT %s
+            """).format(document=sql.SQL(GAME_SEARCH_DOCUMENT))
+            params = [search_term, search_term, f"{search_term}%",
+                      search_term, search_term, limit,
+                      like_pattern, limit,
+                      search_term, limit,
+                      limit]
+
+        allowed_sort_columns = {'game_id', 'title', 'price', 'status', 'release_date', 'purchase_count'}
+        query = sql.SQL("""
+            WITH m AS ({matches})
+            SELECT
+                g.game_id, g.title, g.price, g.status, g.release_date, g.image,
+                g.purchase_count,
+                m.rank
+            FROM m
+            JOIN Games g ON g.game_id = m.game_id
+            {order}
+        """).format(matches=matches, order=self._search_order(sort_by, sort_order, allowed_sort_columns, 'g', 'game_id', ADMIN_GAME_SORT_EXPRS))
+
+        columns = ['game_id', 'title', 'price', 'status', 'release_date', 'image', 'purchase_count', 'rank']
+        return query, tuple(params), columns
+
+    def stream_admin_search(self, kind, search_term, on_rows, handle=None, sort_by=None, sort_order='ASC',
+                            limit=ADMIN_SEARCH_LIMIT, chunk_size=50):
+        """Streams the matches of an admin search ('users', 'studios' or 'games') to on_rows as lists of dicts until done, timed out or cancelled"""
+        builders = {'users': self._build_users_search, 'studios': self._build_studios_search, 'games': self._build_games_search}
+        search_term = (search_term or '').strip()
+        if kind not in builders or not search_term:
+            logger.error("Cannot stream a search of '%s' for '%s'", kind, search_term)
+            return None
+        query, params, columns = builders[kind](search_term, sort_by, sort_order, limit)
+        logger.debug("Streaming %s search for admin: '%s'", kind, search_term)
+        return self.stream_query(query, params, on_rows, handle, columns, chunk_size, self.search_timeout_ms)
+
+    @instrumented
     def process_developer_status_request(self, notification_id, admin_user_id, approve=True):
         conn = self.get_connection()
         if not conn:
@@ -1501,7 +2818,7 @@ class DatabaseManager:
                             cursor=cur 
                         )
                         if not set_status_success:
-                            print(f"DB: Failed to set developer status for user {target_user_id} during request approval (inside transaction).")
+                            logger.error("Failed to set developer status for user %s during request approval (inside transaction).", target_user_id)
                             conn.rollback() 
                             messagebox.showerror("Помилка", "Не вдалося оновити статус розробника для користувача.", parent=None)
                             return False
@@ -1515,21 +2832,20 @@ class DatabaseManager:
 
                     cur.execute(query_update_notification, params_update)
                     if cur.rowcount != 1:
-                        print(f"DB: Failed to update notification status for ID {notification_id} (inside transaction).")
+                        logger.error("Failed to update notification status for ID %s (inside transaction).", notification_id)
                         conn.rollback()
                         messagebox.showerror("Помилка", "Не вдалося оновити статус сповіщення.", parent=None)
                         return False
 
             success_flag = True
-            print(f"DB: Admin {admin_user_id} processed developer_status_request {notification_id} to '{new_status}' for user {target_user_id}.")
+            logger.debug("Admin %s processed developer_status_request %s to '%s' for user %s.", admin_user_id, notification_id, new_status, target_user_id)
 
         except psycopg2.Error as db_error:
-             print(f"DB: Transaction error processing developer status request {notification_id}: {db_error}")
+             logger.error("Transaction error processing developer status request %s: %s", notification_id, db_error)
              messagebox.showerror("Помилка Транзакції", f"Помилка при обробці запиту: {db_error}", parent=None)
              success_flag = False
         except Exception as e:
-            print(f"DB: Unexpected transaction error processing developer status request {notification_id}: {e}")
-            traceback.print_exc()
+            logger.exception("Unexpected transaction error processing developer status request %s: %s", notification_id, e)
             messagebox.showerror("Неочікувана Помилка", f"Помилка при обробці запиту: {e}", parent=None)
             success_flag = False
 
@@ -1557,19 +2873,19 @@ class DatabaseManager:
         try:
             result = self.execute_query(query, params, fetch_one=True)
             if result and result[0]:
-                print(f"DB: Created developer status request with ID: {result[0]} for user {user_id}")
+                logger.debug("Created developer status request with ID: %s for user %s", result[0], user_id)
                 return True
             else:
-                print(f"DB: Failed to create developer status request for user {user_id}")
+                logger.error("Failed to create developer status request for user %s", user_id)
                 return False
         except Exception as e:
-            print(f"DB: Error creating developer status request for user {user_id}: {e}")
+            logger.error("Error creating developer status request for user %s: %s", user_id, e)
             return False
     
     def has_pending_developer_status_request(self, user_id):
         conn = self.get_connection()
         if not conn:
-            print("DB: Cannot check pending developer status request: No active database connection")
+            logger.error("Cannot check pending developer status request: No active database connection")
             return False
 
         query = sql.SQL("""
@@ -1582,19 +2898,18 @@ class DatabaseManager:
             );
         """)
         params = (user_id,)
-        print(f"DB: Checking for pending developer_status_request for user_id {user_id}...")
+        logger.debug("Checking for pending developer_status_request for user_id %s...", user_id)
         try:
             result = self.execute_query(query, params, fetch_one=True)
             if result:
                 has_pending = result[0]
-                print(f"DB: User {user_id} has pending developer_status_request: {has_pending}")
+                logger.debug("User %s has pending developer_status_request: %s", user_id, has_pending)
                 return has_pending
             else:
-                print(f"DB Warning: Failed to execute pending developer_status_request check for user {user_id}.")
+                logger.warning("Failed to execute pending developer_status_request check for user %s.", user_id)
                 return False
         except Exception as e:
-            print(f"DB: Error checking pending developer_status_request for user {user_id}: {e}")
-            traceback.print_exc()
+            logger.exception("Error checking pending developer_status_request for user %s: %s", user_id, e)
             return False
 
     def fetch_pending_admin_notifications(self, notification_type_filter=None, sort_by='created_at', sort_order='ASC'):
@@ -1642,35 +2957,33 @@ class DatabaseManager:
                        'notification_type', 'message', 'status', 'created_at']
             return [dict(zip(columns, row)) for row in notifications_data]
         except Exception as e:
-            print(f"DB: Error fetching pending admin notifications: {e}")
-            traceback.print_exc()
+            logger.exception("Error fetching pending admin notifications: %s", e)
             return None
         
     def get_user_total_spent(self, user_id):
         conn = self.get_connection()
         if not conn:
-            print("DB: Cannot get total spent: No active database connection")
+            logger.error("Cannot get total spent: No active database connection")
             return None
 
         query = sql.SQL("SELECT calculate_total_spent(%s);")
         params = (user_id,)
 
-        print(f"DB: Calculating total spent for user_id {user_id} using SQL function...")
+        logger.debug("Calculating total spent for user_id %s using SQL function...", user_id)
         try:
             result = self.execute_query(query, params, fetch_one=True)
             if result and result[0] is not None:
                 total_spent = Decimal(str(result[0])).quantize(Decimal("0.01"))
-                print(f"DB: Total spent for user {user_id}: {total_spent}")
+                logger.debug("Total spent for user %s: %s", user_id, total_spent)
                 return total_spent
             else:
-                print(f"DB: Total spent for user {user_id}: 0.00 (or error occurred)")
+                logger.warning("Total spent for user %s: 0.00 (or error occurred)", user_id)
                 return Decimal('0.00')
         except (InvalidOperation, TypeError) as e:
-            print(f"DB: Error converting result to Decimal for user {user_id}: {e}")
+            logger.error("Error converting result to Decimal for user %s: %s", user_id, e)
             return Decimal('0.00')
         except Exception as e:
-            print(f"DB: Unexpected error getting total spent for user {user_id}: {e}")
-            traceback.print_exc()
+            logger.exception("Unexpected error getting total spent for user %s: %s", user_id, e)
             return None
         
     def get_developer_studio_details(self, user_id):
@@ -1685,6 +2998,7 @@ class DatabaseManager:
             return {'studio_id': result[0], 'studio_name': result[1]}
         return None
 
+    @instrumented
     def leave_studio(self, user_id):
         conn = self.get_connection()
         if not conn:
@@ -1724,15 +3038,14 @@ class DatabaseManager:
                 with conn.cursor() as cur:
                     cur.execute(query, (user_id,))
                     if cur.rowcount > 0:
-                        print(f"DB: User {user_id} successfully left studio {studio_id}.")
+                        logger.debug("User %s successfully left studio %s.", user_id, studio_id)
                         return True
                     else:
-                        print(f"DB: User {user_id} was not part of a studio or update failed.")
+                        logger.error("User %s was not part of a studio or update failed.", user_id)
                         return False
         except psycopg2.Error as db_error:
-            print(f"DB Error when user {user_id} trying to leave studio: {db_error}")
+            logger.error("Error when user %s trying to leave studio: %s", user_id, db_error)
             return False
         except Exception as e:
-            print(f"DB Unexpected error when user {user_id} trying to leave studio: {e}")
-            traceback.print_exc()
+            logger.exception("Unexpected error when user %s trying to leave studio: %s", user_id, e)
             return False
\ No newline at end of file
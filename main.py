@@ -2,7 +2,10 @@ import os
 
 from functools import partial
 from ui import LoginWindow, RegistrationWindow, StoreWindow
+from ui.utils import shared_image_cache
 from database_manager import DatabaseManager
+from app_logging import setup_logging_from_config
+from thumbnail_cache import ThumbnailStore
 
 try:
     MAIN_SCRIPT_PATH = os.path.abspath(__file__)
@@ -17,8 +20,19 @@ IMAGE_FOLDER_PATH = os.path.join(RESOURCES_DIR, 'games_icons')
 STUDIO_LOGO_FOLDER_PATH = os.path.join(RESOURCES_DIR, 'studios_icons')
 PLACEHOLDER_IMG_NAME = 'placeholder.png'
 PLACEHOLDER_IMG_PATH = os.path.join(IMAGE_FOLDER_PATH, PLACEHOLDER_IMG_NAME)
+THUMBNAIL_CACHE_DIR = os.path.join(RESOURCES_DIR, '.thumbnails')
 
-db_manager = DatabaseManager('config.json')
+# Created by setup_application(). The password hashing workers import this module again, so nothing is set up at import time
+db_manager = None
+thumbnail_store = None
+
+def setup_application():
+    """Configures logging and creates the database manager and the thumbnail store"""
+    global db_manager, thumbnail_store
+    setup_logging_from_config(CONFIG_PATH)
+    db_manager = DatabaseManager('config.json')
+    thumbnail_store = ThumbnailStore(THUMBNAIL_CACHE_DIR)
+    shared_image_cache.thumbnail_store = thumbnail_store
 
 def start_login_window():
     """Creates and runs the login window"""
@@ -57,6 +71,7 @@ def start_store_window(user_id, is_app_admin):
     
 if __name__ == '__main__':
     print("Application Starting...")
+    setup_application()
     if not os.path.exists(IMAGE_FOLDER_PATH):
         print(f"Warning: Game image folder not found: {IMAGE_FOLDER_PATH}")
     if not os.path.exists(STUDIO_LOGO_FOLDER_PATH):
@@ -64,6 +79,8 @@ if __name__ == '__main__':
     if not os.path.exists(PLACEHOLDER_IMG_PATH):
         print(f"Warning: Placeholder image not found: {PLACEHOLDER_IMG_PATH}")
         
+    db_manager.start_change_listener()
     start_login_window()
     print("Application Closing Down...")
+    thumbnail_store.flush()
     db_manager.close_connection()
\ No newline at end of file
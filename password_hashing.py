@@ -0,0 +1,21 @@
+import bcrypt
+
+# Worker entry points of DatabaseManager's password process pool.
+# Spawned workers import only this module, so it must stay free of side effects and heavy imports
+
+DEFAULT_BCRYPT_ROUNDS = 12
+
+def hash_password(password, rounds=DEFAULT_BCRYPT_ROUNDS):
+    """Hashes a password with bcrypt"""
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+def check_password(password, stored_hash):
+    """Checks a password against a bcrypt hash"""
+    return bcrypt.checkpw(password.encode('utf-8'), stored_hash.encode('utf-8'))
+
+def bcrypt_rounds(stored_hash):
+    """Returns the cost factor stored in a bcrypt hash ($2b$12$...), or None if it cannot be read"""
+    try:
+        return int(stored_hash.split('$')[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
@@ -0,0 +1,166 @@
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+class OperationStats:
+    """Counters and latency histogram of one DatabaseManager operation"""
+    __slots__ = ('count', 'errors', 'rows', 'total_ms', 'max_ms', 'buckets')
+
+    def __init__(self):
+        """Constructor"""
+        self.count = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def percentile(self, pct):
+        """Estimates a latency percentile as the upper bound of the bucket it falls into, capped by the slowest call"""
+        if self.count == 0:
+            return None
+        threshold = pct / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= threshold:
+                return min(LATENCY_BUCKETS_MS[index], round(self.max_ms, 3)) if index < len(LATENCY_BUCKETS_MS) else round(self.max_ms, 3)
+        return round(self.max_ms, 3)
+
+    def as_dict(self):
+        """Returns the statistics as plain data"""
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'rows': self.rows,
+            'total_ms': round(self.total_ms, 3),
+            'avg_ms': round(self.total_ms / self.count, 3) if self.count else None,
+            'max_ms': round(self.max_ms, 3),
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'histogram': {f"<={bound}ms": n for bound, n in zip(LATENCY_BUCKETS_MS, self.buckets)} | {'inf': self.buckets[-1]},
+        }
+
+class QueryMetrics:
+    """Thread-safe per-operation latency histograms, row and error counters, and a log of slow queries with their plans"""
+    def __init__(self, slow_query_ms=200.0, explain_slow_queries=True, max_slow_queries=50, explain_interval=60.0):
+        """Constructor"""
+        self.slow_query_ms = slow_query_ms
+        self.explain_slow_queries = explain_slow_queries
+        self.explain_interval = explain_interval
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._operations = {}
+        self._slow_queries = deque(maxlen=max_slow_queries)
+        self._last_explained = {}
+        self._dump_thread = None
+        self._dump_stop = threading.Event()
+
+    def record(self, operation, elapsed_ms, rows=0, error=False):
+        """Adds one call of an operation to its statistics"""
+        bucket = bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)
+        with self._lock:
+            stats = self._operations.get(operation)
+            if stats is None:
+                stats = self._operations[operation] = OperationStats()
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.buckets[bucket] += 1
+            if elapsed_ms > stats.max_ms:
+                stats.max_ms = elapsed_ms
+            if error:
+                stats.errors += 1
+            elif rows:
+                stats.rows += rows
+
+    def is_slow(self, elapsed_ms):
+        """Tells whether a call took longer than the slow query threshold"""
+        return self.slow_query_ms is not None and elapsed_ms >= self.slow_query_ms
+
+    def should_explain(self, operation):
+        """Rate-limits EXPLAIN captures to one per operation per explain_interval seconds"""
+        if not self.explain_slow_queries:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_explained.get(operation, float('-inf')) < self.explain_interval:
+                return False
+            self._last_explained[operation] = now
+            return True
+
+    def record_slow_query(self, operation, elapsed_ms, query_text, plan=None):
+        """Keeps a slow query (without its parameters) and, if captured, its EXPLAIN output"""
+        logger.warning("Slow query in %s: %.1f ms", operation, elapsed_ms, extra={'operation': operation, 'elapsed_ms': round(elapsed_ms, 3)})
+        with self._lock:
+            self._slow_queries.append({
+                'at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'operation': operation,
+                'elapsed_ms': round(elapsed_ms, 3),
+                'query': query_text,
+                'plan': plan,
+            })
+
+    def snapshot(self):
+        """Returns a copy of all collected statistics"""
+        with self._lock:
+            operations = {name: stats.as_dict() for name, stats in sorted(self._operations.items())}
+            slow_queries = list(self._slow_queries)
+        return {
+            'started_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started_at)),
+            'taken_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'slow_query_ms': self.slow_query_ms,
+            'operations': operations,
+            'slow_queries': slow_queries,
+        }
+
+    def reset(self):
+        """Clears all statistics"""
+        with self._lock:
+            self._operations.clear()
+            self._slow_queries.clear()
+            self._last_explained.clear()
+            self.started_at = time.time()
+
+    def dump(self, path):
+        """Writes a snapshot as JSON, replacing the file atomically"""
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.snapshot(), f, indent=2, ensure_ascii=False, default=str)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error("Could not write query metrics to '%s': %s", path, e)
+
+    def start_periodic_dump(self, path, interval=60.0):
+        """Dumps a snapshot to path every interval seconds from a daemon thread"""
+        if self._dump_thread is not None:
+            return
+        self._dump_stop.clear()
+
+        def _run():
+            while not self._dump_stop.wait(interval):
+                self.dump(path)
+
+        self._dump_thread = threading.Thread(target=_run, name="query-metrics-dump", daemon=True)
+        self._dump_thread.start()
+        logger.info("Query metrics are written to '%s' every %s s", path, interval)
+
+    def stop_periodic_dump(self, path=None):
+        """Stops the periodic dump, writing one last snapshot if a path is given"""
+        if self._dump_thread is not None:
+            self._dump_stop.set()
+            self._dump_thread.join(timeout=5)
+            self._dump_thread = None
+        if path:
+            self.dump(path)
@@ -1,3 +1,9 @@
+/* ### Extensions ### */
+
+-- Trigram indexes behind the admin search bars (DatabaseManager.search_*_for_admin).
+-- They are GiST indexes, so a search reads only the nearest matches (ORDER BY term <<-> column LIMIT n)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 /* ### Studios ### */
 
 CREATE TABLE Studios (
@@ -7,9 +13,13 @@ CREATE TABLE Studios (
 	logo VARCHAR(100) NOT NULL,
 	country VARCHAR(50) NOT NULL,
 	description TEXT NULL,
-	established_date DATE NOT NULL
+	established_date DATE NOT NULL,
+	modified_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+	modified_xid XID8 NOT NULL DEFAULT pg_current_xact_id()
 );
 CREATE INDEX idx_studios_name ON Studios(name);
+CREATE INDEX idx_studios_modified_xid ON Studios(modified_xid);
+CREATE INDEX idx_studios_name_trgm ON Studios USING GIST (name gist_trgm_ops);
 
 SELECT * FROM Studios;
 
@@ -23,10 +33,19 @@ CREATE TABLE Users (
 	registration_date TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
 	balance DECIMAL(10, 2) NOT NULL DEFAULT 0.00,
 	is_app_admin BOOLEAN NOT NULL DEFAULT FALSE,
-	is_banned BOOLEAN NOT NULL DEFAULT FALSE
+	is_banned BOOLEAN NOT NULL DEFAULT FALSE,
+	owned_games_count INT NOT NULL DEFAULT 0,
+	total_spent DECIMAL(10, 2) NOT NULL DEFAULT 0.00,
+	modified_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+	modified_xid XID8 NOT NULL DEFAULT pg_current_xact_id()
 );
 CREATE INDEX idx_users_username ON Users(username);
 CREATE INDEX idx_users_email ON Users(email);
+CREATE INDEX idx_users_username_trgm ON Users USING GIST (username gist_trgm_ops);
+CREATE INDEX idx_users_email_trgm ON Users USING GIST (email gist_trgm_ops);
+CREATE INDEX idx_users_owned_games_count_user_id ON Users(owned_games_count, user_id);
+CREATE INDEX idx_users_total_spent_user_id ON Users(total_spent, user_id);
+CREATE INDEX idx_users_modified_xid ON Users(modified_xid);
 
 SELECT * FROM Users;
 
@@ -106,10 +125,21 @@ CREATE TABLE Games (
 	image VARCHAR(100) NOT NULL,
 	status game_status NOT NULL,
 	created_at DATE NULL DEFAULT CURRENT_DATE,
-	updated_at DATE NULL DEFAULT CURRENT_DATE
+	updated_at DATE NULL DEFAULT CURRENT_DATE,
+	purchase_count INT NOT NULL DEFAULT 0,
+	modified_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+	modified_xid XID8 NOT NULL DEFAULT pg_current_xact_id()
 );
 CREATE INDEX idx_games_status ON Games(status);
 CREATE INDEX idx_games_price ON Games(price);
+CREATE INDEX idx_games_title_game_id ON Games(title, game_id);
+CREATE INDEX idx_games_price_game_id ON Games((COALESCE(price, -1)), game_id);
+CREATE INDEX idx_games_purchase_count_game_id ON Games(purchase_count, game_id);
+CREATE INDEX idx_games_release_date_game_id ON Games((COALESCE(release_date, DATE '0001-01-01')), game_id);
+CREATE INDEX idx_games_modified_xid ON Games(modified_xid);
+CREATE INDEX idx_games_title_trgm ON Games USING GIST (title gist_trgm_ops);
+-- Must match GAME_SEARCH_DOCUMENT in database_manager.py
+CREATE INDEX idx_games_search_document ON Games USING GIN (to_tsvector('simple', title || ' ' || COALESCE(description, '')));
 
 SELECT * FROM Games;
 
@@ -211,6 +241,199 @@ CREATE INDEX idx_purchaseitems_game_id ON Purchases_Items(game_id);
 
 SELECT * FROM Purchases_Items;
 
+/* ### Purchase Counters ### */
+
+-- Games.purchase_count holds the number of completed purchase items of a game.
+-- Users.owned_games_count and Users.total_spent hold the number of distinct games a user
+-- owns and the sum of their completed purchases.
+-- They are maintained by the triggers below so lists can be sorted by them using an index.
+
+-- The owned game count is recounted for the user instead of adjusted by a delta:
+-- row triggers see the changes of the whole statement, so a delta would miscount
+-- statements touching several purchases or items of the same game
+CREATE OR REPLACE FUNCTION recount_user_owned_games(p_user_id INT, p_excluded_purchase_id INT)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF p_user_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    UPDATE Users u
+    SET owned_games_count = owned.game_count
+    FROM (
+        SELECT COUNT(DISTINCT pi.game_id) AS game_count
+        FROM Purchases_Items pi
+        JOIN Purchases p ON pi.purchase_id = p.purchase_id
+        WHERE p.user_id = p_user_id
+          AND p.status = 'Completed'
+          AND (p_excluded_purchase_id IS NULL OR p.purchase_id <> p_excluded_purchase_id)
+    ) owned
+    WHERE u.user_id = p_user_id
+      AND u.owned_games_count <> owned.game_count;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION purchase_items_counter_function()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    purchase_user_id INT;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        SELECT p.user_id INTO purchase_user_id
+        FROM Purchases p
+        WHERE p.purchase_id = OLD.purchase_id AND p.status = 'Completed';
+
+        IF FOUND THEN
+            UPDATE Games SET purchase_count = purchase_count - 1 WHERE game_id = OLD.game_id;
+            PERFORM recount_user_owned_games(purchase_user_id, NULL);
+        END IF;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        SELECT p.user_id INTO purchase_user_id
+        FROM Purchases p
+        WHERE p.purchase_id = NEW.purchase_id AND p.status = 'Completed';
+
+        IF FOUND THEN
+            UPDATE Games SET purchase_count = purchase_count + 1 WHERE game_id = NEW.game_id;
+            PERFORM recount_user_owned_games(purchase_user_id, NULL);
+        END IF;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER purchase_items_counter_trigger
+AFTER INSERT OR DELETE OR UPDATE OF purchase_id, game_id ON Purchases_Items
+FOR EACH ROW
+EXECUTE FUNCTION purchase_items_counter_function();
+
+CREATE OR REPLACE FUNCTION purchases_counter_function()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    old_counted BOOLEAN := FALSE;
+    new_counted BOOLEAN := FALSE;
+    contribution_changed BOOLEAN := TRUE;
+    item RECORD;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        old_counted := OLD.status = 'Completed';
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        new_counted := NEW.status = 'Completed';
+    END IF;
+    IF TG_OP = 'UPDATE' THEN
+        contribution_changed := OLD.user_id IS DISTINCT FROM NEW.user_id
+                                OR OLD.total_amount <> NEW.total_amount;
+    END IF;
+
+    -- Per-game counters only depend on whether the purchase is completed.
+    -- Items removed by ON DELETE CASCADE no longer see their purchase, so they are discounted here
+    IF old_counted <> new_counted THEN
+        FOR item IN
+            SELECT game_id, COUNT(*) AS item_count
+            FROM Purchases_Items
+            WHERE purchase_id = COALESCE(NEW.purchase_id, OLD.purchase_id)
+            GROUP BY game_id
+        LOOP
+            UPDATE Games
+            SET purchase_count = purchase_count + CASE WHEN new_counted THEN item.item_count ELSE -item.item_count END
+            WHERE game_id = item.game_id;
+        END LOOP;
+    END IF;
+
+    IF old_counted AND (NOT new_counted OR contribution_changed) THEN
+        UPDATE Users SET total_spent = total_spent - OLD.total_amount WHERE user_id = OLD.user_id;
+        -- Before a delete the purchase is still there, so it is left out of the count
+        PERFORM recount_user_owned_games(OLD.user_id, CASE WHEN TG_OP = 'DELETE' THEN OLD.purchase_id END);
+    END IF;
+
+    IF new_counted AND (NOT old_counted OR contribution_changed) THEN
+        UPDATE Users SET total_spent = total_spent + NEW.total_amount WHERE user_id = NEW.user_id;
+        PERFORM recount_user_owned_games(NEW.user_id, NULL);
+    END IF;
+
+    IF TG_OP = 'DELETE' THEN
+        RETURN OLD;
+    END IF;
+    RETURN NEW;
+END;
+$$;
+
+CREATE TRIGGER purchases_counter_insert_trigger
+AFTER INSERT ON Purchases
+FOR EACH ROW
+EXECUTE FUNCTION purchases_counter_function();
+
+CREATE TRIGGER purchases_counter_delete_trigger
+BEFORE DELETE ON Purchases
+FOR EACH ROW
+EXECUTE FUNCTION purchases_counter_function();
+
+CREATE TRIGGER purchases_counter_update_trigger
+AFTER UPDATE OF status, user_id, total_amount ON Purchases
+FOR EACH ROW
+EXECUTE FUNCTION purchases_counter_function();
+
+-- Recomputes every counter from scratch, e.g. after a bulk load with triggers disabled
+CREATE OR REPLACE FUNCTION refresh_game_purchase_counts()
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE Games g
+    SET purchase_count = COALESCE(counts.item_count, 0)
+    FROM Games g2
+    LEFT JOIN (
+        SELECT pi.game_id, COUNT(*) AS item_count
+        FROM Purchases_Items pi
+        JOIN Purchases p ON pi.purchase_id = p.purchase_id
+        WHERE p.status = 'Completed'
+        GROUP BY pi.game_id
+    ) counts ON counts.game_id = g2.game_id
+    WHERE g.game_id = g2.game_id
+      AND g.purchase_count IS DISTINCT FROM COALESCE(counts.item_count, 0);
+END;
+$$;
+
+-- Recomputes every user's purchase statistics from scratch
+CREATE OR REPLACE FUNCTION refresh_user_purchase_stats()
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    WITH spent AS (
+        SELECT user_id, SUM(total_amount) AS total_spent
+        FROM Purchases
+        WHERE status = 'Completed' AND user_id IS NOT NULL
+        GROUP BY user_id
+    ),
+    owned AS (
+        SELECT p.user_id, COUNT(DISTINCT pi.game_id) AS owned_games_count
+        FROM Purchases_Items pi
+        JOIN Purchases p ON pi.purchase_id = p.purchase_id
+        WHERE p.status = 'Completed' AND p.user_id IS NOT NULL
+        GROUP BY p.user_id
+    )
+    UPDATE Users u
+    SET owned_games_count = COALESCE(o.owned_games_count, 0),
+        total_spent = COALESCE(sp.total_spent, 0.00)
+    FROM Users u2
+    LEFT JOIN spent sp ON sp.user_id = u2.user_id
+    LEFT JOIN owned o ON o.user_id = u2.user_id
+    WHERE u.user_id = u2.user_id
+      AND (u.owned_games_count <> COALESCE(o.owned_games_count, 0)
+           OR u.total_spent <> COALESCE(sp.total_spent, 0.00));
+END;
+$$;
+
 CREATE TABLE Reviews (
     review_id SERIAL PRIMARY KEY,
     user_id INT NOT NULL,
@@ -333,10 +556,207 @@ END;
 $$;
 
 CREATE TRIGGER update_games_updated_at_trigger
-BEFORE UPDATE ON Games
+BEFORE UPDATE OF title, description, price, release_date, image, status ON Games
 FOR EACH ROW
 EXECUTE FUNCTION update_timestamp_function();
 
+/* ### Change Notifications ### */
+
+-- Every change of data shown by the client is announced on the game_store_changes channel
+-- as a JSON payload {"table", "op", <key columns given as trigger arguments>}.
+-- DatabaseManager listens on it to drop cached rows and refresh the affected parts of the UI.
+
+CREATE OR REPLACE FUNCTION notify_data_change()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    row_data JSONB;
+    payload JSONB;
+    key_column TEXT;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        row_data := to_jsonb(OLD);
+    ELSE
+        row_data := to_jsonb(NEW);
+    END IF;
+
+    payload := jsonb_build_object('table', lower(TG_TABLE_NAME), 'op', TG_OP);
+    FOREACH key_column IN ARRAY TG_ARGV LOOP
+        payload := payload || jsonb_build_object(key_column, row_data -> key_column);
+    END LOOP;
+
+    PERFORM pg_notify('game_store_changes', payload::text);
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER games_notify_trigger
+AFTER INSERT OR DELETE OR UPDATE OF title, description, price, release_date, image, status ON Games
+FOR EACH ROW
+EXECUTE FUNCTION notify_data_change('game_id');
+
+CREATE TRIGGER users_notify_trigger
+AFTER INSERT OR DELETE OR UPDATE OF username, email, balance, is_banned ON Users
+FOR EACH ROW
+EXECUTE FUNCTION notify_data_change('user_id');
+
+CREATE TRIGGER reviews_notify_trigger
+AFTER INSERT OR DELETE OR UPDATE ON Reviews
+FOR EACH ROW
+EXECUTE FUNCTION notify_data_change('review_id', 'game_id');
+
+CREATE TRIGGER reviewcomments_notify_trigger
+AFTER INSERT OR DELETE OR UPDATE ON ReviewComments
+FOR EACH ROW
+EXECUTE FUNCTION notify_data_change('comment_id', 'review_id');
+
+CREATE TRIGGER game_genres_notify_trigger
+AFTER INSERT OR DELETE OR UPDATE ON Game_Genres
+FOR EACH ROW
+EXECUTE FUNCTION notify_data_change('game_id');
+
+CREATE TRIGGER game_platforms_notify_trigger
+AFTER INSERT OR DELETE OR UPDATE ON Game_Platforms
+FOR EACH ROW
+EXECUTE FUNCTION notify_data_change('game_id');
+
+CREATE TRIGGER game_studios_notify_trigger
+AFTER INSERT OR DELETE OR UPDATE ON Game_Studios
+FOR EACH ROW
+EXECUTE FUNCTION notify_data_change('game_id');
+
+CREATE TRIGGER studios_notify_trigger
+AFTER INSERT OR DELETE OR UPDATE OF name, website_url, logo, country, description, established_date ON Studios
+FOR EACH ROW
+EXECUTE FUNCTION notify_data_change('studio_id');
+
+CREATE TRIGGER genres_notify_trigger
+AFTER INSERT OR DELETE OR UPDATE ON Genres
+FOR EACH ROW
+EXECUTE FUNCTION notify_data_change('genre_id');
+
+CREATE TRIGGER platforms_notify_trigger
+AFTER INSERT OR DELETE OR UPDATE ON Platforms
+FOR EACH ROW
+EXECUTE FUNCTION notify_data_change('platform_id');
+
+/* ### Modification Timestamps ### */
+
+-- modified_xid of Users, Studios and Games and the Deleted_Rows table tell the admin panels which rows
+-- changed since their last refresh (DatabaseManager.fetch_admin_changes): it holds the id of the transaction
+-- that last wrote the row, and a row changed since a check if that transaction was not yet committed in
+-- the snapshot the check took. Unlike a timestamp this follows commit order, so long transactions and bulk
+-- COPY loads are never missed (needs PostgreSQL 13 or newer). Changes of Developers and Game_Studios
+-- touch the rows whose studio, developer and game counts they alter.
+
+CREATE OR REPLACE FUNCTION touch_modified_at()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    NEW.modified_at := clock_timestamp();
+    NEW.modified_xid := pg_current_xact_id();
+    RETURN NEW;
+END;
+$$;
+
+CREATE TRIGGER users_touch_trigger
+BEFORE UPDATE ON Users
+FOR EACH ROW
+EXECUTE FUNCTION touch_modified_at();
+
+CREATE TRIGGER studios_touch_trigger
+BEFORE UPDATE ON Studios
+FOR EACH ROW
+EXECUTE FUNCTION touch_modified_at();
+
+CREATE TRIGGER games_touch_trigger
+BEFORE UPDATE ON Games
+FOR EACH ROW
+EXECUTE FUNCTION touch_modified_at();
+
+CREATE OR REPLACE FUNCTION touch_developer_parents()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        UPDATE Users SET modified_at = clock_timestamp() WHERE user_id = OLD.user_id;
+        UPDATE Studios SET modified_at = clock_timestamp() WHERE studio_id = OLD.studio_id;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        UPDATE Users SET modified_at = clock_timestamp() WHERE user_id = NEW.user_id;
+        UPDATE Studios SET modified_at = clock_timestamp() WHERE studio_id = NEW.studio_id;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER developers_touch_parents_trigger
+AFTER INSERT OR DELETE OR UPDATE OF user_id, studio_id ON Developers
+FOR EACH ROW
+EXECUTE FUNCTION touch_developer_parents();
+
+CREATE OR REPLACE FUNCTION touch_game_studio_parents()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        UPDATE Studios SET modified_at = clock_timestamp() WHERE studio_id = OLD.studio_id;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        UPDATE Studios SET modified_at = clock_timestamp() WHERE studio_id = NEW.studio_id;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER game_studios_touch_parents_trigger
+AFTER INSERT OR DELETE OR UPDATE OF game_id, studio_id ON Game_Studios
+FOR EACH ROW
+EXECUTE FUNCTION touch_game_studio_parents();
+
+-- Deleted rows leave no modified_xid behind, so their ids are kept here for a day
+CREATE TABLE Deleted_Rows (
+    table_name VARCHAR(20) NOT NULL,
+    row_id INT NOT NULL,
+    deleted_at TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp(),
+    deleted_xid XID8 NOT NULL DEFAULT pg_current_xact_id()
+);
+CREATE INDEX idx_deleted_rows_table_name_deleted_xid ON Deleted_Rows(table_name, deleted_xid);
+
+CREATE OR REPLACE FUNCTION record_deleted_row()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    DELETE FROM Deleted_Rows
+    WHERE table_name = lower(TG_TABLE_NAME)
+      AND deleted_at < clock_timestamp() - INTERVAL '1 day';
+
+    INSERT INTO Deleted_Rows (table_name, row_id)
+    VALUES (lower(TG_TABLE_NAME), (to_jsonb(OLD) ->> TG_ARGV[0])::INT);
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER users_deleted_trigger
+AFTER DELETE ON Users
+FOR EACH ROW
+EXECUTE FUNCTION record_deleted_row('user_id');
+
+CREATE TRIGGER studios_deleted_trigger
+AFTER DELETE ON Studios
+FOR EACH ROW
+EXECUTE FUNCTION record_deleted_row('studio_id');
+
+CREATE TRIGGER games_deleted_trigger
+AFTER DELETE ON Games
+FOR EACH ROW
+EXECUTE FUNCTION record_deleted_row('game_id');
+
 CREATE TYPE notification_type AS ENUM (
     'developer_status_request'
 );
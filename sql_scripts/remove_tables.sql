@@ -13,6 +13,7 @@ DROP TABLE IF EXISTS Purchases_Items;
 DROP TABLE IF EXISTS Platforms;
 DROP TABLE IF EXISTS Genres;
 DROP TABLE IF EXISTS Game_Genres; 
+DROP TABLE IF EXISTS Deleted_Rows;
 
 DROP TYPE IF EXISTS studio_role_type;
 DROP TYPE IF EXISTS game_status;
@@ -0,0 +1,181 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+
+from PIL import Image
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, 'resources', '.thumbnails')
+INDEX_FILENAME = 'index.json'
+
+# Icon sizes the UI asks for, per resource folder
+DEFAULT_PREWARM_SIZES = {
+    os.path.join(BASE_DIR, 'resources', 'games_icons'): [(64, 64), (48, 48), (160, 160), (300, 180)],
+    os.path.join(BASE_DIR, 'resources', 'studios_icons'): [(64, 64), (128, 128)],
+}
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp')
+
+class ThumbnailStore:
+    """On-disk store of pre-resized images, named by the SHA-256 of the source file and the target size"""
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        """Constructor"""
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.builds = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+        # absolute source path -> {'mtime_ns', 'size', 'sha256'}, so unchanged files are not re-hashed
+        self._index = self._load_index()
+
+    def load(self, source_path, size):
+        """Returns the source image resized to fit size as a PIL image, reading the small stored copy when it exists"""
+        img = Image.open(self.ensure(source_path, size))
+        img.load()
+        return img
+
+    def ensure(self, source_path, size):
+        """Returns the path of the stored thumbnail, building it if the source is new or its content changed"""
+        thumb_path = self._thumbnail_path(self._source_digest(source_path), size)
+        if os.path.exists(thumb_path):
+            with self._lock:
+                self.hits += 1
+            return thumb_path
+
+        img = resize_image(source_path, size)
+        os.makedirs(os.path.dirname(thumb_path), exist_ok=True)
+        tmp_path = f"{thumb_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        img.save(tmp_path, 'PNG')
+        os.replace(tmp_path, thumb_path)
+        with self._lock:
+            self.builds += 1
+        return thumb_path
+
+    def flush(self):
+        """Writes the source index to disk if it changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            index = dict(self._index)
+            self._dirty = False
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        index_path = os.path.join(self.cache_dir, INDEX_FILENAME)
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, index_path)
+
+    def prune(self):
+        """Deletes stored thumbnails whose source no longer exists or has changed. Returns the number of deleted files"""
+        with self._lock:
+            for source_path in [path for path in self._index if not os.path.exists(path)]:
+                del self._index[source_path]
+                self._dirty = True
+            live_digests = {entry['sha256'] for entry in self._index.values()}
+
+        removed = 0
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            for filename in filenames:
+                if filename == INDEX_FILENAME or filename.split('_', 1)[0] in live_digests:
+                    continue
+                os.remove(os.path.join(dirpath, filename))
+                removed += 1
+        return removed
+
+    def _source_digest(self, source_path):
+        """Returns the SHA-256 of the source file. The file is only read again when its mtime or size changed"""
+        key = os.path.abspath(source_path)
+        stat = os.stat(key)
+        with self._lock:
+            entry = self._index.get(key)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry['sha256']
+
+        sha256 = hashlib.sha256()
+        with open(key, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha256.update(chunk)
+        digest = sha256.hexdigest()
+
+        with self._lock:
+            self._index[key] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest}
+            self._dirty = True
+        return digest
+
+    def _thumbnail_path(self, digest, size):
+        """Content-addressed location of a thumbnail: <cache_dir>/<first two hash chars>/<hash>_<width>x<height>.png"""
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}_{size[0]}x{size[1]}.png")
+
+    def _load_index(self):
+        """Reads the source index, starting empty if it is missing or unreadable"""
+        index_path = os.path.join(self.cache_dir, INDEX_FILENAME)
+        try:
+            with open(index_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+def resize_image(source_path, size):
+    """Opens an image file and resizes it to fit size, keeping the aspect ratio"""
+    img = Image.open(source_path)
+    if img.mode != 'RGBA':
+        img = img.convert('RGBA')
+    img.thumbnail(size, Image.Resampling.LANCZOS)
+    return img
+
+def parse_size(text):
+    """Parses a WIDTHxHEIGHT argument"""
+    try:
+        width, height = text.lower().split('x')
+        return int(width), int(height)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid size '{text}', expected WIDTHxHEIGHT")
+
+def prewarm(store, folder_sizes):
+    """Builds the thumbnails of every image in the folders at the given sizes. Returns the number of failed files"""
+    failed = 0
+    for folder, sizes in folder_sizes.items():
+        if not os.path.isdir(folder):
+            print(f"Skipping missing folder: {folder}")
+            continue
+        filenames = sorted(name for name in os.listdir(folder) if name.lower().endswith(IMAGE_EXTENSIONS))
+        print(f"--- {folder}: {len(filenames)} images, sizes {', '.join(f'{w}x{h}' for w, h in sizes)} ---")
+        for filename in filenames:
+            for size in sizes:
+                try:
+                    store.ensure(os.path.join(folder, filename), size)
+                except Exception as e:
+                    print(f"Error creating thumbnail for '{filename}' at {size[0]}x{size[1]}: {e}")
+                    failed += 1
+    return failed
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-builds the on-disk icon thumbnails used by the store UI")
+    parser.add_argument('folders', nargs='*', help="Image folders to process (default: resources/games_icons and resources/studios_icons)")
+    parser.add_argument('--size', action='append', type=parse_size, dest='sizes',
+                        help="Thumbnail size as WIDTHxHEIGHT, can be repeated (default: the sizes the UI uses for each folder)")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Where thumbnails are stored")
+    parser.add_argument('--prune', action='store_true', help="Delete thumbnails of sources that changed or no longer exist")
+    args = parser.parse_args()
+
+    if args.folders:
+        sizes = args.sizes or sorted({size for folder_sizes in DEFAULT_PREWARM_SIZES.values() for size in folder_sizes})
+        folder_sizes = {folder: sizes for folder in args.folders}
+    elif args.sizes:
+        folder_sizes = {folder: args.sizes for folder in DEFAULT_PREWARM_SIZES}
+    else:
+        folder_sizes = DEFAULT_PREWARM_SIZES
+
+    store = ThumbnailStore(args.cache_dir)
+    failed = prewarm(store, folder_sizes)
+    if args.prune:
+        print(f"Removed {store.prune()} stale thumbnails")
+    store.flush()
+    print(f"Thumbnails ready in '{args.cache_dir}': {store.builds} built, {store.hits} already up to date, {failed} failed")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
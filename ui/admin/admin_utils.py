@@ -1,20 +1,46 @@
+import queue
 import tkinter as tk
+from collections import deque
 from tkinter import ttk
-from ..utils import setup_text_widget_editing 
+from ..utils import setup_text_widget_editing, stream_in_background, run_in_background
+from database_manager import QueryHandle
 
-def create_search_bar(parent_frame, load_list_command, original_bg="white", custom_button_style="TButton"):
+LOADING_ROW_IID = '__loading__'
+SEARCH_DEBOUNCE_MS = 300
+ADMIN_PAGE_SIZE = 200
+
+def create_search_bar(parent_frame, load_list_command, original_bg="white", custom_button_style="TButton", incremental=False, debounce_ms=SEARCH_DEBOUNCE_MS):
     search_bar_frame = ttk.Frame(parent_frame, style='TFrame')
     search_bar_frame.grid_columnconfigure(1, weight=1)
 
     search_label = ttk.Label(search_bar_frame, text="Пошук:", background=original_bg)
     search_label.pack(side=tk.LEFT, padx=(0,5))
 
-    search_entry = ttk.Entry(search_bar_frame, width=30)
+    search_var = tk.StringVar(search_bar_frame)
+    search_entry = ttk.Entry(search_bar_frame, width=30, textvariable=search_var)
+    search_entry.search_var = search_var
     setup_text_widget_editing(search_entry)
     search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-    search_entry.bind("<Return>", lambda e, cmd=load_list_command: cmd())
 
-    search_button = ttk.Button(search_bar_frame, text="Знайти", command=load_list_command, style=custom_button_style)
+    pending_job = [None]
+
+    def _run_now(event=None):
+        if pending_job[0] is not None:
+            search_entry.after_cancel(pending_job[0])
+            pending_job[0] = None
+        load_list_command()
+
+    def _run_later(*_):
+        # Typing restarts the countdown, so only the term the admin pauses on is searched
+        if pending_job[0] is not None:
+            search_entry.after_cancel(pending_job[0])
+        pending_job[0] = search_entry.after(debounce_ms, _run_now)
+
+    search_entry.bind("<Return>", _run_now)
+    if incremental:
+        search_var.trace_add('write', _run_later)
+
+    search_button = ttk.Button(search_bar_frame, text="Знайти", command=_run_now, style=custom_button_style)
     search_button.pack(side=tk.LEFT, padx=(5,0))
     
     return search_entry, search_button, search_bar_frame
@@ -35,6 +61,10 @@ def setup_treeview_with_scrollbar(parent_frame, columns_config, on_select_callba
 
     vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
     tree.configure(yscrollcommand=vsb.set)
+    tree.scrollbar = vsb
+    # Data of the shown rows by iid, and whether they are the whole result, for sort_loaded_rows
+    tree.row_data = {}
+    tree.rows_complete = False
     vsb.pack(side='right', fill='y')
     tree.pack(side='left', fill='both', expand=True)
 
@@ -55,4 +85,315 @@ def update_treeview_sort_indicators(treeview_widget, clicked_col_id, current_sor
     if clicked_col_id in treeview_widget['columns']:
         arrow = ' ▲' if is_asc else ' ▼'
         current_heading_text = treeview_widget.heading(clicked_col_id, 'text')
-        treeview_widget.heading(clicked_col_id, text=current_heading_text + arrow)
\ No newline at end of file
+        treeview_widget.heading(clicked_col_id, text=current_heading_text + arrow)
+
+
+SEARCH_STATUS_TEXT = {
+    'timeout': "Пошук не встиг завершитися. Уточніть запит.",
+    'failed': "Не вдалося виконати пошук",
+}
+
+
+def show_treeview_loading(treeview_widget, text="Завантаження..."):
+    clear_treeview(treeview_widget)
+    show_treeview_status(treeview_widget, text)
+
+
+def show_treeview_status(treeview_widget, text):
+    """Adds a grey status row after the rows the Treeview already shows"""
+    if treeview_widget.exists(LOADING_ROW_IID):
+        treeview_widget.delete(LOADING_ROW_IID)
+    values = [''] * len(treeview_widget['columns'])
+    if values:
+        values[min(1, len(values) - 1)] = text
+    treeview_widget.tag_configure('loading', foreground='grey')
+    treeview_widget.insert('', tk.END, iid=LOADING_ROW_IID, values=values, tags=('loading',))
+
+
+def clear_treeview(treeview_widget):
+    for i in treeview_widget.get_children():
+        treeview_widget.delete(i)
+    if hasattr(treeview_widget, 'row_data'):
+        treeview_widget.row_data.clear()
+        treeview_widget.rows_complete = False
+
+
+def sort_loaded_rows(treeview_widget, sort_by, ascending, iid_key, sort_value=None):
+    """Re-orders the shown rows by a column of their data without a query. Returns False if the rows are only part of the result"""
+    if not getattr(treeview_widget, 'rows_complete', False):
+        return False
+    row_data = treeview_widget.row_data
+    sort_value = sort_value or (lambda row: row.get(sort_by))
+
+    def _key(iid):
+        row = row_data.get(iid, {})
+        value = sort_value(row)
+        if isinstance(value, str):
+            value = value.casefold()
+        # Like PostgreSQL: NULLs after every value in ascending order and before them in descending order
+        return (value is None, value if value is not None else 0, row.get(iid_key) or 0)
+
+    iids = [iid for iid in treeview_widget.get_children() if iid in row_data]
+    for index, iid in enumerate(sorted(iids, key=_key, reverse=not ascending)):
+        treeview_widget.move(iid, '', index)
+    return True
+
+
+def stream_search_into_treeview(widget, db_manager, treeview_widget, kind, search_term, sort_by, sort_order,
+                                row_values, iid_key, on_done=None, on_error=None):
+    handle = QueryHandle()
+    chunks = queue.SimpleQueue()
+    future = db_manager.submit('stream_admin_search', kind, search_term, chunks.put,
+                               handle=handle, sort_by=sort_by, sort_order=sort_order)
+    received_rows = [False]
+
+    def _on_chunk(rows):
+        if handle.cancelled: return
+        if not received_rows[0]:
+            clear_treeview(treeview_widget)
+            received_rows[0] = True
+        for row in rows:
+            iid = str(row.get(iid_key))
+            if not treeview_widget.exists(iid):
+                treeview_widget.insert('', tk.END, iid=iid, values=row_values(row))
+                treeview_widget.row_data[iid] = row
+
+    def _on_done(row_count):
+        if handle.cancelled: return
+        if not received_rows[0]:
+            clear_treeview(treeview_widget)
+        # The server sorts the capped set of best matches, so sorting them here gives the same order
+        treeview_widget.rows_complete = row_count is not None
+        if row_count is None:
+            # As-you-type searches report problems inline; the next keystroke replaces the row
+            status = handle.status or 'failed'
+            show_treeview_status(treeview_widget, SEARCH_STATUS_TEXT.get(status, SEARCH_STATUS_TEXT['failed']))
+            if on_error:
+                on_error(status)
+        elif on_done:
+            on_done()
+
+    def _on_failed(error):
+        if handle.cancelled: return
+        clear_treeview(treeview_widget)
+        show_treeview_status(treeview_widget, SEARCH_STATUS_TEXT['failed'])
+        if on_error:
+            on_error(error)
+
+    stream_in_background(widget, future, chunks, _on_chunk, _on_done, _on_failed)
+    return handle
+
+
+def reconcile_treeview(treeview_widget, rows, row_values, iid_key):
+    """Makes the Treeview show rows in the given order touching only rows that changed, so selection and scroll position survive. Returns the number of Tk changes"""
+    new_iids = [str(row.get(iid_key)) for row in rows]
+    wanted = set(new_iids)
+    existing = treeview_widget.get_children()
+    stale = [iid for iid in existing if iid not in wanted]
+    if stale:
+        treeview_widget.delete(*stale)
+    row_data = getattr(treeview_widget, 'row_data', {})
+    for iid in stale:
+        row_data.pop(iid, None)
+    row_data.update(zip(new_iids, rows))
+    current = [iid for iid in existing if iid in wanted]
+    present = set(current)
+
+    changes = len(stale)
+    for index, (iid, row) in enumerate(zip(new_iids, rows)):
+        values = row_values(row)
+        if iid not in present:
+            treeview_widget.insert('', index, iid=iid, values=values)
+            current.insert(index, iid)
+            present.add(iid)
+            changes += 1
+            continue
+        if tuple(str(v) for v in treeview_widget.item(iid, 'values')) != tuple(str(v) for v in values):
+            treeview_widget.item(iid, values=values)
+            changes += 1
+        if index >= len(current) or current[index] != iid:
+            current.remove(iid)
+            current.insert(index, iid)
+            treeview_widget.move(iid, '', index)
+            changes += 1
+    return changes
+
+
+class PagedTreeview:
+    """Fills a Treeview page by page with keyset paging as the user scrolls, keeping at most max_pages pages of rows in the widget"""
+    def __init__(self, widget, treeview_widget, fetch_page, row_values, iid_key,
+                 page_size=ADMIN_PAGE_SIZE, max_pages=10, on_loaded=None, on_error=None, edge_threshold=0.1, fetch_changes=None):
+        """fetch_page(after, limit) returns a Future of (rows, next_cursor), fetch_changes(since) a Future of (checked_at, changed ids or None)"""
+        self.widget = widget
+        self.tree = treeview_widget
+        self.fetch_page = fetch_page
+        self.row_values = row_values
+        self.iid_key = iid_key
+        self.page_size = page_size
+        self.max_pages = max(2, max_pages)
+        self.on_loaded = on_loaded
+        self.on_error = on_error
+        self.edge_threshold = edge_threshold
+        self.fetch_changes = fetch_changes
+
+        # Each loaded page is [after, iids, next_cursor]; dropped_above keeps (cursor, row count) of the pages scrolled off the top
+        self._pages = deque()
+        self._dropped_above = []
+        self._request = None
+        self._active = False
+        self._synced_at = None
+        self._changes_request = None
+        self.tree.configure(yscrollcommand=self._on_yview_change)
+
+    @property
+    def is_complete(self):
+        """Tells whether every row of the result is in the Treeview"""
+        return (self._active and self._request is None and bool(self._pages)
+                and not self._dropped_above and self._pages[-1][2] is None)
+
+    def reload(self):
+        """Drops the loaded rows and requests the first page"""
+        self._active = True
+        self._pages.clear()
+        self._dropped_above = []
+        show_treeview_loading(self.tree)
+        self._request_page(None, self._on_first_page)
+        self._check_changes(None)
+
+    def refresh(self):
+        """Brings the loaded rows up to date: asks which rows changed since the last check and re-reads the loaded range only if any did"""
+        if not self._active or not self._pages or self._request is not None:
+            self.reload()
+            return
+        if self.fetch_changes is None or self._synced_at is None:
+            self._refresh_window()
+            return
+        self._check_changes(self._synced_at)
+
+    def _check_changes(self, since):
+        if self.fetch_changes is None:
+            return
+        future = self.fetch_changes(since)
+        self._changes_request = future
+        run_in_background(self.widget, future,
+                          on_success=lambda result, f=future, s=since: self._on_changes_checked(f, s, result))
+
+    def _on_changes_checked(self, future, since, result):
+        if future is not self._changes_request or not self._active: return
+        self._changes_request = None
+        checked_at, changed_ids = result if result else (None, None)
+        if checked_at is None:
+            if since is not None:
+                self._refresh_window()
+            return
+        self._synced_at = checked_at
+        if since is not None and changed_ids != []:
+            self._refresh_window()
+
+    def _refresh_window(self):
+        if not self._pages or self._request is not None: return
+        loaded_rows = sum(len(page[1]) for page in self._pages)
+        self._request_page(self._pages[0][0], self._on_window_reloaded, limit=max(loaded_rows, self.page_size))
+
+    def _on_window_reloaded(self, after, rows, next_cursor):
+        # The re-read range becomes one page; it is dropped and fetched again as a whole like any other page
+        changes = reconcile_treeview(self.tree, rows, self.row_values, self.iid_key)
+        self._pages = deque([[after, [str(row.get(self.iid_key)) for row in rows], next_cursor]])
+        print(f"UI: Admin list refreshed with {changes} row change(s)")
+
+    def stop(self):
+        """Stops paging, ignoring responses still in flight (e.g. while the Treeview shows search results)"""
+        self._active = False
+        self._request = None
+        self._changes_request = None
+        self._synced_at = None
+        self._pages.clear()
+        self._dropped_above = []
+        self.tree.rows_complete = False
+
+    def _request_page(self, after, on_page, limit=None):
+        future = self.fetch_page(after, limit or self.page_size)
+        self._request = future
+        run_in_background(self.widget, future,
+                          on_success=lambda result, f=future, a=after: self._on_page_result(f, a, result, on_page),
+                          on_error=lambda error, f=future: self._on_page_failed(f, error))
+
+    def _on_page_result(self, future, after, result, on_page):
+        if future is not self._request or not self._active: return
+        self._request = None
+        rows, next_cursor = result if result else (None, None)
+        if rows is None:
+            self._report_failure(None)
+            return
+        on_page(after, rows, next_cursor)
+        self.tree.rows_complete = self.is_complete
+        if self.on_loaded:
+            self.on_loaded()
+
+    def _on_page_failed(self, future, error):
+        if future is not self._request or not self._active: return
+        self._request = None
+        self._report_failure(error)
+
+    def _report_failure(self, error):
+        if not self._pages:
+            clear_treeview(self.tree)
+        if self.on_error:
+            self.on_error(error)
+
+    def _insert_rows(self, rows, index):
+        iids = []
+        for row in rows:
+            iid = str(row.get(self.iid_key))
+            if self.tree.exists(iid):
+                continue
+            self.tree.insert('', index, iid=iid, values=self.row_values(row))
+            self.tree.row_data[iid] = row
+            if index != tk.END:
+                index += 1
+            iids.append(iid)
+        return iids
+
+    def _delete_rows(self, iids):
+        # Rows may already be gone, e.g. removed by a live update
+        existing = [iid for iid in iids if self.tree.exists(iid)]
+        if existing:
+            self.tree.delete(*existing)
+        for iid in iids:
+            self.tree.row_data.pop(iid, None)
+
+    def _on_first_page(self, after, rows, next_cursor):
+        clear_treeview(self.tree)
+        self._pages.append([after, self._insert_rows(rows, tk.END), next_cursor])
+
+    def _on_next_page(self, after, rows, next_cursor):
+        self._pages.append([after, self._insert_rows(rows, tk.END), next_cursor])
+        if len(self._pages) > self.max_pages:
+            dropped_after, dropped_iids, _ = self._pages.popleft()
+            # A page re-read by refresh() can hold more than page_size rows, so it is fetched again with its own size
+            self._dropped_above.append((dropped_after, max(len(dropped_iids), self.page_size)))
+            self._delete_rows(dropped_iids)
+            # The rows above the view are gone, so move the view up by as many rows to keep showing the same ones
+            self.tree.yview_scroll(-len(dropped_iids), 'units')
+
+    def _on_previous_page(self, after, rows, next_cursor):
+        self._dropped_above.pop()
+        iids = self._insert_rows(rows, 0)
+        self._pages.appendleft([after, iids, next_cursor])
+        self.tree.yview_scroll(len(iids), 'units')
+        if len(self._pages) > self.max_pages:
+            _, dropped_iids, _ = self._pages.pop()
+            # The new last page still knows the cursor of the dropped one, so it is fetched again on the way down
+            self._delete_rows(dropped_iids)
+
+    def _on_yview_change(self, first, last):
+        scrollbar = getattr(self.tree, 'scrollbar', None)
+        if scrollbar is not None:
+            scrollbar.set(first, last)
+        if not self._active or self._request is not None or not self._pages:
+            return
+        if float(last) >= 1 - self.edge_threshold and self._pages[-1][2] is not None:
+            self._request_page(self._pages[-1][2], self._on_next_page)
+        elif float(first) <= self.edge_threshold and self._dropped_above:
+            dropped_after, dropped_count = self._dropped_above[-1]
+            self._request_page(dropped_after, self._on_previous_page, limit=dropped_count)
@@ -3,8 +3,8 @@ from tkinter import ttk, messagebox
 import datetime
 from functools import partial
 
-from ..utils import format_price_display 
-from .admin_utils import create_search_bar, setup_treeview_with_scrollbar, update_treeview_sort_indicators
+from ..utils import format_price_display, run_in_background
+from .admin_utils import create_search_bar, setup_treeview_with_scrollbar, update_treeview_sort_indicators, show_treeview_loading, stream_search_into_treeview, PagedTreeview, reconcile_treeview, sort_loaded_rows
 
 class AdminGameManagementPanel(ttk.Frame):
     def __init__(self, parent, db_manager, store_window_ref, fonts, colors, styles, **kwargs):
@@ -23,9 +23,17 @@ class AdminGameManagementPanel(ttk.Frame):
         
         self.search_entry = None
         self.games_tree = None
+        self._games_pages = None
+        self._search_term = ""
+        self._games_search = None
 
         self._setup_ui()
 
+        # Only the '*' event of a bulk data load reaches this handler; other clients' edits show up on "Оновити"
+        live_updates = getattr(self.store_window_ref, 'live_updates', None)
+        if live_updates is not None:
+            live_updates.subscribe(self, (), self._on_data_reloaded)
+
     def _setup_ui(self):
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -34,7 +42,8 @@ class AdminGameManagementPanel(ttk.Frame):
             parent_frame=self,
             load_list_command=self.load_games_list,
             original_bg=self.original_bg,
-            custom_button_style=self.custom_button_style
+            custom_button_style=self.custom_button_style,
+            incremental=True
         )
         self.search_entry = search_entry_widget
         search_bar_actual_frame.grid(row=0, column=0, sticky='ew', pady=(0,10), padx=5)
@@ -56,6 +65,11 @@ class AdminGameManagementPanel(ttk.Frame):
             on_select_callback=self._on_game_select,
             on_double_click_callback=self._on_game_double_click
         )
+        self._games_pages = PagedTreeview(
+            self, self.games_tree, self._fetch_games_page, self._game_row_values, 'game_id',
+            on_loaded=self._on_game_select, on_error=self._on_games_load_failed,
+            fetch_changes=lambda since: self.db_manager.submit('fetch_admin_changes', 'games', since)
+        )
 
         action_frame = ttk.Frame(self, style='TFrame')
         action_frame.grid(row=2, column=0, sticky='ew', pady=(10,5), padx=5)
@@ -78,72 +92,112 @@ class AdminGameManagementPanel(ttk.Frame):
                 self.current_sort_column_db_key,
                 self.current_sort_order_asc
             )
-        self.load_games_list()
+        if not sort_loaded_rows(self.games_tree, self.current_sort_column_db_key, self.current_sort_order_asc, 'game_id',
+                                sort_value=self._game_sort_value):
+            self.load_games_list()
 
     def load_games_list(self):
         if not self.games_tree: return
 
-        for i in self.games_tree.get_children():
-            self.games_tree.delete(i)
+        if self._games_search is not None:
+            self._games_search.cancel()
+            self._games_search = None
+
+        show_treeview_loading(self.games_tree)
 
         search_term = self.search_entry.get().strip() if self.search_entry else ""
+        if search_term != self._search_term:
+            # A new search is shown by relevance; clearing it restores the default order
+            self._search_term = search_term
+            self.current_sort_column_db_key = None if search_term else 'title'
+            self.current_sort_order_asc = True
+            update_treeview_sort_indicators(self.games_tree, None, None, True)
         sort_order_str = 'ASC' if self.current_sort_order_asc else 'DESC'
         
-        games_data = self.db_manager.fetch_all_games_for_admin(
-            search_term=search_term,
+        if search_term:
+            # Matches are streamed in while the query runs; the next keystroke cancels it
+            self._games_pages.stop()
+            self._games_search = stream_search_into_treeview(
+                self, self.db_manager, self.games_tree, 'games', search_term,
+                self.current_sort_column_db_key, sort_order_str, self._game_row_values, 'game_id',
+                on_done=self._on_game_select, on_error=self._on_games_search_failed
+            )
+            return
+
+        self._games_pages.reload()
+
+    def _fetch_games_page(self, after, limit):
+        return self.db_manager.submit(
+            'fetch_all_games_for_admin',
             sort_by=self.current_sort_column_db_key,
-            sort_order=sort_order_str
+            sort_order='ASC' if self.current_sort_order_asc else 'DESC',
+            after=after,
+            limit=limit
         )
 
-        if games_data:
-            for item_data in games_data:
-                game_id = item_data.get('game_id')
-                title = item_data.get('title', 'N/A')
-                price = item_data.get('price')
-                # status_val = item_data.get('status', 'N/A') # Статус не використовується
-                release_date_raw = item_data.get('release_date')
-                purchase_count = item_data.get('purchase_count', 0)
-                
-                release_date_display = "N/A"
-                if release_date_raw:
-                    try:
-                        date_obj_to_format = None
-                        if isinstance(release_date_raw, str):
-                            date_part_str = release_date_raw.split(' ')[0]
-                            date_obj_to_format = datetime.datetime.strptime(date_part_str, '%Y-%m-%d').date()
-                        elif isinstance(release_date_raw, datetime.datetime):
-                            date_obj_to_format = release_date_raw.date()
-                        elif isinstance(release_date_raw, datetime.date):
-                            date_obj_to_format = release_date_raw
-                        
-                        if date_obj_to_format:
-                            release_date_display = date_obj_to_format.strftime('%d-%m-%Y')
-                        elif release_date_raw: 
-                            release_date_display = str(release_date_raw)
-                    except ValueError:
-                        release_date_display = str(release_date_raw) if release_date_raw else "N/A"
-                    except Exception:
-                        release_date_display = "Error" if release_date_raw else "N/A"
-                
-                current_columns = self.games_tree['columns']
-                values_list = []
-                if 'game_id' in current_columns: values_list.append(game_id if game_id is not None else "N/A")
-                if 'title' in current_columns: values_list.append(title)
-                if 'price' in current_columns: values_list.append(format_price_display(price))
-                # if 'status' in current_columns: values_list.append(status_val) # Статус не додається
-                if 'release_date' in current_columns: values_list.append(release_date_display)
-                if 'purchase_count' in current_columns: values_list.append(purchase_count)
+    def _on_games_search_failed(self, error):
+        # The search shows its own status row in the list; a dialog would interrupt typing
+        print(f"UI Error searching games: {error}")
+
+    def _on_data_reloaded(self, event):
+        if event.get('table') == '*':
+            self.load_games_list()
+
+    def _on_games_load_failed(self, error):
+        print(f"UI Error fetching games for admin: {error}")
+        messagebox.showerror("Помилка", f"Не вдалося завантажити ігри: {error or 'помилка бази даних'}", parent=self)
+
+    def _game_sort_value(self, item_data):
+        sort_by = self.current_sort_column_db_key
+        if sort_by == 'price':
+            # Same as COALESCE(g.price, -1) of fetch_all_games_for_admin: games without a price come first
+            price = item_data.get('price')
+            return price if price is not None else -1
+        if sort_by == 'release_date':
+            # Same as COALESCE(g.release_date, DATE '0001-01-01'): games without a release date come first
+            release_date = item_data.get('release_date')
+            return release_date if release_date is not None else datetime.date.min
+        return item_data.get(sort_by)
+
+    def _game_row_values(self, item_data):
+        game_id = item_data.get('game_id')
+        title = item_data.get('title', 'N/A')
+        price = item_data.get('price')
+        # status_val = item_data.get('status', 'N/A') # Статус не використовується
+        release_date_raw = item_data.get('release_date')
+        purchase_count = item_data.get('purchase_count', 0)
+        
+        release_date_display = "N/A"
+        if release_date_raw:
+            try:
+                date_obj_to_format = None
+                if isinstance(release_date_raw, str):
+                    date_part_str = release_date_raw.split(' ')[0]
+                    date_obj_to_format = datetime.datetime.strptime(date_part_str, '%Y-%m-%d').date()
+                elif isinstance(release_date_raw, datetime.datetime):
+                    date_obj_to_format = release_date_raw.date()
+                elif isinstance(release_date_raw, datetime.date):
+                    date_obj_to_format = release_date_raw
                 
-                values = tuple(values_list)
-
-                game_id_val = item_data.get('game_id')
-                iid_val = str(game_id_val) if game_id_val is not None else None
-                if iid_val:
-                    self.games_tree.insert('', tk.END, values=values, iid=iid_val)
-                else:
-                    self.games_tree.insert('', tk.END, values=values)
-
-        self._on_game_select()
+                if date_obj_to_format:
+                    release_date_display = date_obj_to_format.strftime('%d-%m-%Y')
+                elif release_date_raw: 
+                    release_date_display = str(release_date_raw)
+            except ValueError:
+                release_date_display = str(release_date_raw) if release_date_raw else "N/A"
+            except Exception:
+                release_date_display = "Error" if release_date_raw else "N/A"
+        
+        current_columns = self.games_tree['columns']
+        values_list = []
+        if 'game_id' in current_columns: values_list.append(game_id if game_id is not None else "N/A")
+        if 'title' in current_columns: values_list.append(title)
+        if 'price' in current_columns: values_list.append(format_price_display(price))
+        # if 'status' in current_columns: values_list.append(status_val) # Статус не додається
+        if 'release_date' in current_columns: values_list.append(release_date_display)
+        if 'purchase_count' in current_columns: values_list.append(purchase_count)
+        
+        return tuple(values_list)
 
     def _on_game_select(self, event=None):
         pass 
@@ -172,4 +226,19 @@ class AdminGameManagementPanel(ttk.Frame):
             
     def refresh_panel_content(self):
         print("AdminGameManagementPanel: Refreshing content...")
-        self.load_games_list()
\ No newline at end of file
+        search_term = self.search_entry.get().strip() if self.search_entry else ""
+        if search_term != self._search_term:
+            self.load_games_list()
+        elif search_term:
+            future = self.db_manager.submit(
+                'search_games_for_admin', search_term,
+                sort_by=self.current_sort_column_db_key,
+                sort_order='ASC' if self.current_sort_order_asc else 'DESC'
+            )
+            run_in_background(self, future, on_success=self._reconcile_search_results)
+        else:
+            self._games_pages.refresh()
+
+    def _reconcile_search_results(self, rows):
+        if rows is None or not self.games_tree: return
+        reconcile_treeview(self.games_tree, rows, self._game_row_values, 'game_id')
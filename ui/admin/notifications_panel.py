@@ -3,8 +3,8 @@ from tkinter import ttk, messagebox, simpledialog
 import datetime
 from functools import partial
 
-from .admin_utils import create_search_bar, setup_treeview_with_scrollbar, update_treeview_sort_indicators
-from ..utils import format_datetime_display
+from .admin_utils import create_search_bar, setup_treeview_with_scrollbar, update_treeview_sort_indicators, show_treeview_loading, clear_treeview, sort_loaded_rows
+from ..utils import format_datetime_display, run_in_background
 
 class AdminNotificationsPanel(ttk.Frame):
     def __init__(self, parent, db_manager, store_window_ref, fonts, colors, styles, **kwargs):
@@ -20,6 +20,7 @@ class AdminNotificationsPanel(ttk.Frame):
         self.current_sort_order_asc = True 
 
         self.notifications_tree = None
+        self._notifications_request = None
         self.approve_button = None
         self.reject_button = None
 
@@ -80,18 +81,32 @@ class AdminNotificationsPanel(ttk.Frame):
                 self.current_sort_column_db_key,
                 self.current_sort_order_asc
             )
-        self.load_notifications()
+        if not sort_loaded_rows(self.notifications_tree, self.current_sort_column_db_key, self.current_sort_order_asc, 'notification_id'):
+            self.load_notifications()
 
     def load_notifications(self):
         if not self.notifications_tree: return
 
-        for i in self.notifications_tree.get_children():
-            self.notifications_tree.delete(i)
+        show_treeview_loading(self.notifications_tree)
 
-        notifications_data = self.db_manager.fetch_pending_admin_notifications(
+        future = self.db_manager.submit(
+            'fetch_pending_admin_notifications',
             sort_by=self.current_sort_column_db_key,
             sort_order='ASC' if self.current_sort_order_asc else 'DESC'
         )
+        self._notifications_request = future
+        run_in_background(self, future,
+                          on_success=lambda data, f=future: self._populate_notifications(f, data),
+                          on_error=lambda error, f=future: self._on_notifications_load_failed(f, error))
+
+    def _on_notifications_load_failed(self, future, error):
+        if future is not self._notifications_request: return
+        clear_treeview(self.notifications_tree)
+        messagebox.showerror("Помилка", f"Не вдалося завантажити сповіщення: {error}", parent=self)
+
+    def _populate_notifications(self, future, notifications_data):
+        if future is not self._notifications_request or not self.notifications_tree: return
+        clear_treeview(self.notifications_tree)
 
         if notifications_data:
             for notif in notifications_data:
@@ -109,8 +124,10 @@ class AdminNotificationsPanel(ttk.Frame):
                 iid_val = str(notif_id_val) if notif_id_val is not None else None
                 if iid_val:
                     self.notifications_tree.insert('', tk.END, values=values, iid=iid_val, tags=(notif.get('notification_type'),))
+                    self.notifications_tree.row_data[iid_val] = notif
                 else:
                     self.notifications_tree.insert('', tk.END, values=values, tags=(notif.get('notification_type'),))
+            self.notifications_tree.rows_complete = True
 
         self._on_notification_select()
 
@@ -3,8 +3,8 @@ from tkinter import ttk, messagebox, simpledialog
 from functools import partial
 import datetime
 
-from ..utils import setup_text_widget_editing # setup_text_widget_editing з загальних utils
-from .admin_utils import create_search_bar, setup_treeview_with_scrollbar, update_treeview_sort_indicators
+from ..utils import setup_text_widget_editing, run_in_background # setup_text_widget_editing з загальних utils
+from .admin_utils import create_search_bar, setup_treeview_with_scrollbar, update_treeview_sort_indicators, show_treeview_loading, stream_search_into_treeview, PagedTreeview, reconcile_treeview, sort_loaded_rows
 
 class AdminStudioManagementPanel(ttk.Frame):
     def __init__(self, parent, db_manager, store_window_ref, fonts, colors, styles, **kwargs):
@@ -23,9 +23,17 @@ class AdminStudioManagementPanel(ttk.Frame):
         
         self.search_entry = None
         self.studios_tree = None
+        self._studios_pages = None
+        self._search_term = ""
+        self._studios_search = None
 
         self._setup_ui()
 
+        # Only the '*' event of a bulk data load reaches this handler; other clients' edits show up on "Оновити"
+        live_updates = getattr(self.store_window_ref, 'live_updates', None)
+        if live_updates is not None:
+            live_updates.subscribe(self, (), self._on_data_reloaded)
+
     def _setup_ui(self):
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -34,7 +42,8 @@ class AdminStudioManagementPanel(ttk.Frame):
             parent_frame=self,
             load_list_command=self.load_studios_list,
             original_bg=self.original_bg,
-            custom_button_style=self.custom_button_style
+            custom_button_style=self.custom_button_style,
+            incremental=True
         )
         self.search_entry = search_entry_widget
         search_bar_actual_frame.grid(row=0, column=0, sticky='ew', pady=(0,10), padx=5)
@@ -57,6 +66,11 @@ class AdminStudioManagementPanel(ttk.Frame):
             on_select_callback=self._on_studio_select,
             on_double_click_callback=self._on_studio_double_click
         )
+        self._studios_pages = PagedTreeview(
+            self, self.studios_tree, self._fetch_studios_page, self._studio_row_values, 'studio_id',
+            on_loaded=self._on_studio_select, on_error=self._on_studios_load_failed,
+            fetch_changes=lambda since: self.db_manager.submit('fetch_admin_changes', 'studios', since)
+        )
 
         action_frame = ttk.Frame(self, style='TFrame')
         action_frame.grid(row=2, column=0, sticky='ew', pady=(10,5), padx=5)
@@ -79,63 +93,92 @@ class AdminStudioManagementPanel(ttk.Frame):
                 self.current_sort_column_db_key,
                 self.current_sort_order_asc
             )
-        self.load_studios_list()
+        if not sort_loaded_rows(self.studios_tree, self.current_sort_column_db_key, self.current_sort_order_asc, 'studio_id'):
+            self.load_studios_list()
 
     def load_studios_list(self):
         if not self.studios_tree: return
 
-        for i in self.studios_tree.get_children():
-            self.studios_tree.delete(i)
+        if self._studios_search is not None:
+            self._studios_search.cancel()
+            self._studios_search = None
+
+        show_treeview_loading(self.studios_tree)
 
         search_term = self.search_entry.get().strip() if self.search_entry else ""
+        if search_term != self._search_term:
+            # A new search is shown by relevance; clearing it restores the default order
+            self._search_term = search_term
+            self.current_sort_column_db_key = None if search_term else 'name'
+            self.current_sort_order_asc = True
+            update_treeview_sort_indicators(self.studios_tree, None, None, True)
         sort_order_str = 'ASC' if self.current_sort_order_asc else 'DESC'
         
-        studios_data = self.db_manager.fetch_all_studios_for_admin(
-            search_term=search_term,
+        if search_term:
+            # Matches are streamed in while the query runs; the next keystroke cancels it
+            self._studios_pages.stop()
+            self._studios_search = stream_search_into_treeview(
+                self, self.db_manager, self.studios_tree, 'studios', search_term,
+                self.current_sort_column_db_key, sort_order_str, self._studio_row_values, 'studio_id',
+                on_done=self._on_studio_select, on_error=self._on_studios_search_failed
+            )
+            return
+
+        self._studios_pages.reload()
+
+    def _fetch_studios_page(self, after, limit):
+        return self.db_manager.submit(
+            'fetch_all_studios_for_admin',
             sort_by=self.current_sort_column_db_key,
-            sort_order=sort_order_str
+            sort_order='ASC' if self.current_sort_order_asc else 'DESC',
+            after=after,
+            limit=limit
         )
 
-        if studios_data:
-            for studio in studios_data:
-                est_date_raw = studio.get('established_date')
-                est_date_display = "N/A"
-
-                if est_date_raw:
-                    try:
-                        date_obj_to_format = None
-                        if isinstance(est_date_raw, str):
-                            date_part_str = est_date_raw.split(' ')[0]
-                            date_obj_to_format = datetime.datetime.strptime(date_part_str, '%Y-%m-%d').date()
-                        elif isinstance(est_date_raw, datetime.datetime): 
-                            date_obj_to_format = est_date_raw.date()
-                        elif isinstance(est_date_raw, datetime.date): 
-                            date_obj_to_format = est_date_raw
-                        
-                        if date_obj_to_format: 
-                            est_date_display = date_obj_to_format.strftime('%d-%m-%Y')
-                        elif est_date_raw:
-                            est_date_display = str(est_date_raw)
-                    except ValueError:
-                        est_date_display = str(est_date_raw) if est_date_raw else "N/A"
-                    except Exception:
-                        est_date_display = "Error" if est_date_raw else "N/A"
+    def _on_studios_search_failed(self, error):
+        # The search shows its own status row in the list; a dialog would interrupt typing
+        print(f"UI Error searching studios: {error}")
+
+    def _on_data_reloaded(self, event):
+        if event.get('table') == '*':
+            self.load_studios_list()
+
+    def _on_studios_load_failed(self, error):
+        print(f"UI Error fetching studios for admin: {error}")
+        messagebox.showerror("Помилка", f"Не вдалося завантажити студії: {error or 'помилка бази даних'}", parent=self)
+
+    def _studio_row_values(self, studio):
+        est_date_raw = studio.get('established_date')
+        est_date_display = "N/A"
+
+        if est_date_raw:
+            try:
+                date_obj_to_format = None
+                if isinstance(est_date_raw, str):
+                    date_part_str = est_date_raw.split(' ')[0]
+                    date_obj_to_format = datetime.datetime.strptime(date_part_str, '%Y-%m-%d').date()
+                elif isinstance(est_date_raw, datetime.datetime): 
+                    date_obj_to_format = est_date_raw.date()
+                elif isinstance(est_date_raw, datetime.date): 
+                    date_obj_to_format = est_date_raw
                 
-                values = (
-                    studio.get('studio_id', "N/A"),
-                    studio.get('name', 'N/A'),
-                    studio.get('country', 'N/A'),
-                    est_date_display,
-                    studio.get('game_count', 0),
-                    studio.get('developer_count', 0)
-                )
-                studio_id_val = studio.get('studio_id')
-                iid_val = str(studio_id_val) if studio_id_val is not None else None
-                if iid_val:
-                    self.studios_tree.insert('', tk.END, values=values, iid=iid_val)
-                else:
-                    self.studios_tree.insert('', tk.END, values=values)
-        self._on_studio_select()
+                if date_obj_to_format: 
+                    est_date_display = date_obj_to_format.strftime('%d-%m-%Y')
+                elif est_date_raw:
+                    est_date_display = str(est_date_raw)
+            except ValueError:
+                est_date_display = str(est_date_raw) if est_date_raw else "N/A"
+            except Exception:
+                est_date_display = "Error" if est_date_raw else "N/A"
+        
+        return (
+            studio.get('studio_id', "N/A"),
+            studio.get('name', 'N/A'),
+            studio.get('country', 'N/A'),
+            est_date_display,
+            studio.get('game_count', 0),
+            studio.get('developer_count', 0)
+        )
 
     def _on_studio_select(self, event=None):
         pass
@@ -159,4 +202,19 @@ class AdminStudioManagementPanel(ttk.Frame):
     
     def refresh_panel_content(self):
         print("AdminStudioManagementPanel: Refreshing content...")
-        self.load_studios_list()
\ No newline at end of file
+        search_term = self.search_entry.get().strip() if self.search_entry else ""
+        if search_term != self._search_term:
+            self.load_studios_list()
+        elif search_term:
+            future = self.db_manager.submit(
+                'search_studios_for_admin', search_term,
+                sort_by=self.current_sort_column_db_key,
+                sort_order='ASC' if self.current_sort_order_asc else 'DESC'
+            )
+            run_in_background(self, future, on_success=self._reconcile_search_results)
+        else:
+            self._studios_pages.refresh()
+
+    def _reconcile_search_results(self, rows):
+        if rows is None or not self.studios_tree: return
+        reconcile_treeview(self.studios_tree, rows, self._studio_row_values, 'studio_id')
@@ -3,8 +3,8 @@ from tkinter import ttk, messagebox, simpledialog
 import decimal
 import traceback
 
-from ..utils import format_price_display, CustomAskStringDialog 
-from .admin_utils import create_search_bar, setup_treeview_with_scrollbar, update_treeview_sort_indicators
+from ..utils import format_price_display, CustomAskStringDialog, run_in_background
+from .admin_utils import create_search_bar, setup_treeview_with_scrollbar, update_treeview_sort_indicators, show_treeview_loading, stream_search_into_treeview, PagedTreeview, reconcile_treeview, sort_loaded_rows
 
 class AdminUserManagementPanel(ttk.Frame):
     def __init__(self, parent, db_manager, store_window_ref, fonts, colors, styles, **kwargs):
@@ -23,9 +23,17 @@ class AdminUserManagementPanel(ttk.Frame):
 
         self.search_entry = None
         self.users_tree = None
+        self._users_pages = None
+        self._search_term = ""
+        self._users_search = None
+        self._insert_refresh_job = None
 
         self._setup_ui()
 
+        live_updates = getattr(self.store_window_ref, 'live_updates', None)
+        if live_updates is not None:
+            live_updates.subscribe(self, ('users',), self._on_user_changed)
+
     def _setup_ui(self):
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -34,7 +42,8 @@ class AdminUserManagementPanel(ttk.Frame):
             parent_frame=self,
             load_list_command=self.load_users_list,
             original_bg=self.original_bg,
-            custom_button_style=self.custom_button_style
+            custom_button_style=self.custom_button_style,
+            incremental=True
         )
         self.search_entry = search_entry_widget
         search_bar_actual_frame.grid(row=0, column=0, sticky='ew', pady=(0,10), padx=5)
@@ -60,6 +69,11 @@ class AdminUserManagementPanel(ttk.Frame):
             columns_config=user_columns_config,
             on_select_callback=self._on_user_select
         )
+        self._users_pages = PagedTreeview(
+            self, self.users_tree, self._fetch_users_page, self._user_row_values, 'user_id',
+            on_loaded=self._on_user_select, on_error=self._on_users_load_failed,
+            fetch_changes=lambda since: self.db_manager.submit('fetch_admin_changes', 'users', since)
+        )
 
         action_frame = ttk.Frame(self, style='TFrame')
         action_frame.grid(row=2, column=0, sticky='ew', pady=(10,5), padx=5)
@@ -90,66 +104,117 @@ class AdminUserManagementPanel(ttk.Frame):
                 self.current_sort_column_db_key,
                 self.current_sort_order_asc
             )
-        self.load_users_list()
+        if not sort_loaded_rows(self.users_tree, self.current_sort_column_db_key, self.current_sort_order_asc, 'user_id'):
+            self.load_users_list()
 
     def load_users_list(self):
         if not self.users_tree: return
 
-        for i in self.users_tree.get_children():
-            self.users_tree.delete(i)
+        if self._users_search is not None:
+            self._users_search.cancel()
+            self._users_search = None
+
+        show_treeview_loading(self.users_tree)
 
         search_term = self.search_entry.get().strip() if self.search_entry else ""
+        if search_term != self._search_term:
+            # A new search is shown by relevance; clearing it restores the default order
+            self._search_term = search_term
+            self.current_sort_column_db_key = None if search_term else 'username'
+            self.current_sort_order_asc = True
+            update_treeview_sort_indicators(self.users_tree, None, None, True)
         sort_order = 'ASC' if self.current_sort_order_asc else 'DESC'
         sort_key = self.current_sort_column_db_key
         if sort_key == 'owned_games':
             sort_key = 'owned_games_count'
 
-        users_data = None
-        try:
-            users_data = self.db_manager.fetch_all_users_for_admin(
-                search_term=search_term,
-                sort_by=sort_key,
-                sort_order=sort_order
+        if search_term:
+            # Matches are streamed in while the query runs; the next keystroke cancels it
+            self._users_pages.stop()
+            self._users_search = stream_search_into_treeview(
+                self, self.db_manager, self.users_tree, 'users', search_term,
+                sort_key, sort_order, self._user_row_values, 'user_id',
+                on_done=self._on_user_select, on_error=self._on_users_search_failed
             )
-        except Exception as e:
-             print(f"UI Error fetching users for admin: {e}")
-             traceback.print_exc()
-             messagebox.showerror("Помилка", f"Не вдалося завантажити користувачів: {e}", parent=self)
-             return
+            return
+
+        self._users_pages.reload()
+
+    def _fetch_users_page(self, after, limit):
+        sort_key = self.current_sort_column_db_key
+        if sort_key == 'owned_games':
+            sort_key = 'owned_games_count'
+        return self.db_manager.submit(
+            'fetch_all_users_for_admin',
+            sort_by=sort_key,
+            sort_order='ASC' if self.current_sort_order_asc else 'DESC',
+            after=after,
+            limit=limit
+        )
 
-        if users_data:
-            for user in users_data:
-                studio_name = user.get('developer_studio_name', '---') if user.get('is_developer') else '---'
-                owned_games = user.get('owned_games_count', 0)
-                balance_val = user.get('balance')
-                balance_display = f"{balance_val:.2f}₴" if balance_val is not None else "N/A"
-                total_spent_val = user.get('total_spent')
-                total_spent_display = f"{total_spent_val:.2f}₴" if total_spent_val is not None else "0.00₴"
-
-                values = (
-                    user.get('user_id', 'N/A'),
-                    user.get('username', 'N/A'),
-                    user.get('email', 'N/A'),
-                    "Так" if user.get('is_developer') else "Ні",
-                    studio_name,
-                    owned_games,
-                    balance_display,
-                    total_spent_display,
-                    "Так" if user.get('is_app_admin') else "Ні",
-                    "Так" if user.get('is_banned') else "Ні",
-                )
-                user_id_val = user.get('user_id')
-                iid_val = str(user_id_val) if user_id_val is not None else None
-                try:
-                    if iid_val:
-                        self.users_tree.insert('', tk.END, values=values, iid=iid_val)
-                    else:
-                        self.users_tree.insert('', tk.END, values=values)
-                except Exception as tree_error:
-                     print(f"Error inserting row into Treeview: {tree_error}")
-                     print(f"Data causing error: {values}")
-                     continue
+    def _on_users_search_failed(self, error):
+        # The search shows its own status row in the list; a dialog would interrupt typing
+        print(f"UI Error searching users: {error}")
+
+    def _on_users_load_failed(self, error):
+        print(f"UI Error fetching users for admin: {error}")
+        messagebox.showerror("Помилка", f"Не вдалося завантажити користувачів: {error or 'помилка бази даних'}", parent=self)
+
+    def _user_row_values(self, user):
+        studio_name = user.get('developer_studio_name', '---') if user.get('is_developer') else '---'
+        owned_games = user.get('owned_games_count', 0)
+        balance_val = user.get('balance')
+        balance_display = f"{balance_val:.2f}₴" if balance_val is not None else "N/A"
+        total_spent_val = user.get('total_spent')
+        total_spent_display = f"{total_spent_val:.2f}₴" if total_spent_val is not None else "0.00₴"
+
+        return (
+            user.get('user_id', 'N/A'),
+            user.get('username', 'N/A'),
+            user.get('email', 'N/A'),
+            "Так" if user.get('is_developer') else "Ні",
+            studio_name,
+            owned_games,
+            balance_display,
+            total_spent_display,
+            "Так" if user.get('is_app_admin') else "Ні",
+            "Так" if user.get('is_banned') else "Ні",
+        )
 
+    def _on_user_changed(self, event):
+        if event.get('table') == '*':
+            self.load_users_list()
+            return
+        if event.get('op') == 'INSERT':
+            # Where a new user belongs depends on the sort and search, so the shown rows are re-read once per batch
+            if self._insert_refresh_job is None:
+                self._insert_refresh_job = self.after_idle(self._refresh_after_insert)
+            return
+        user_id = event.get('user_id')
+        if not self.users_tree or not self.users_tree.exists(str(user_id)):
+            return
+        if event.get('op') == 'DELETE':
+            self.users_tree.delete(str(user_id))
+            self.users_tree.row_data.pop(str(user_id), None)
+            self._on_user_select()
+            return
+        self._refresh_user_row(user_id)
+
+    def _refresh_after_insert(self):
+        self._insert_refresh_job = None
+        self.refresh_panel_content()
+
+    def _refresh_user_row(self, user_id):
+        future = self.db_manager.submit('fetch_all_users_for_admin', user_ids=[user_id])
+        run_in_background(self, future, on_success=self._patch_user_rows)
+
+    def _patch_user_rows(self, users_data):
+        if not users_data or not self.users_tree: return
+        for user in users_data:
+            iid = str(user.get('user_id'))
+            if self.users_tree.exists(iid):
+                self.users_tree.item(iid, values=self._user_row_values(user))
+                self.users_tree.row_data[iid] = user
         self._on_user_select()
 
     def _on_user_select(self, event=None):
@@ -256,7 +321,7 @@ class AdminUserManagementPanel(ttk.Frame):
             success = self.db_manager.set_user_ban_status(user_id_to_toggle, new_ban_status, admin_current_user_id)
             if success:
                 messagebox.showinfo("Успіх", f"Користувача '{username_to_toggle}' успішно {action_verb}но.", parent=self)
-                self.load_users_list()
+                self._refresh_user_row(user_id_to_toggle)
 
     def _admin_add_funds_to_user(self):
         if not self.users_tree: return
@@ -322,10 +387,25 @@ class AdminUserManagementPanel(ttk.Frame):
 
             if success:
                 messagebox.showinfo("Успіх", f"Кошти успішно нараховано користувачеві '{target_username}'.", parent=self)
-                self.load_users_list()
+                self._refresh_user_row(target_user_id)
             else:
                  print(f"add_funds returned False for user {target_user_id}")
     
     def refresh_panel_content(self):
         print("AdminUserManagementPanel: Refreshing content...")
-        self.load_users_list()
\ No newline at end of file
+        search_term = self.search_entry.get().strip() if self.search_entry else ""
+        if search_term != self._search_term:
+            self.load_users_list()
+        elif search_term:
+            future = self.db_manager.submit(
+                'search_users_for_admin', search_term,
+                sort_by=self.current_sort_column_db_key,
+                sort_order='ASC' if self.current_sort_order_asc else 'DESC'
+            )
+            run_in_background(self, future, on_success=self._reconcile_search_results)
+        else:
+            self._users_pages.refresh()
+
+    def _reconcile_search_results(self, rows):
+        if rows is None or not self.users_tree: return
+        reconcile_treeview(self.users_tree, rows, self._user_row_values, 'user_id')
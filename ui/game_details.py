@@ -39,28 +39,38 @@ class GameDetailView(tk.Frame):
         self.store_window_ref = store_window_ref
 
         self.can_edit = False
-        if self.user_id and self.game_id:
-            try:
-                self.can_edit = self.db_manager.check_game_edit_permission(self.user_id, self.game_id)
-                print(f"GameDetailView: User {self.user_id} can edit game {self.game_id}: {self.can_edit}")
-            except Exception as e:
-                print(f"Error checking edit permission in GameDetailView init: {e}")
-
+        self.is_owned = None
         self.genre_names = []
         self.platform_names = []
         self.developer_names = []
         self.publisher_names = []
-        if self.game_id is not None:
-            try:
-                self.genre_names = self.db_manager.fetch_game_genres(self.game_id)
-                self.platform_names = self.db_manager.fetch_game_platforms(self.game_id)
-                self.developer_names = self.db_manager.fetch_game_studios_by_role(self.game_id, 'Developer')
-                self.publisher_names = self.db_manager.fetch_game_studios_by_role(self.game_id, 'Publisher')
-            except AttributeError as ae:
-                print(f"AttributeError fetching game details (maybe method missing?): {ae}")
-            except Exception as e:
-                print(f"Error fetching genres/platforms/studios during GameDetailView init: {e}")
-                traceback.print_exc()
+
+        if self.game_data and 'genres' in self.game_data:
+            self.can_edit = bool(self.game_data.get('can_edit')) and self.user_id is not None
+            self.is_owned = bool(self.game_data.get('is_owned')) if self.user_id is not None else False
+            self.genre_names = list(self.game_data.get('genres') or [])
+            self.platform_names = list(self.game_data.get('platforms') or [])
+            self.developer_names = list(self.game_data.get('developers') or [])
+            self.publisher_names = list(self.game_data.get('publishers') or [])
+        else:
+            if self.user_id and self.game_id:
+                try:
+                    self.can_edit = self.db_manager.check_game_edit_permission(self.user_id, self.game_id)
+                except Exception as e:
+                    print(f"Error checking edit permission in GameDetailView init: {e}")
+
+            if self.game_id is not None:
+                try:
+                    self.genre_names = self.db_manager.fetch_game_genres(self.game_id)
+                    self.platform_names = self.db_manager.fetch_game_platforms(self.game_id)
+                    self.developer_names = self.db_manager.fetch_game_studios_by_role(self.game_id, 'Developer')
+                    self.publisher_names = self.db_manager.fetch_game_studios_by_role(self.game_id, 'Publisher')
+                except AttributeError as ae:
+                    print(f"AttributeError fetching game details (maybe method missing?): {ae}")
+                except Exception as e:
+                    print(f"Error fetching genres/platforms/studios during GameDetailView init: {e}")
+                    traceback.print_exc()
+        print(f"GameDetailView: User {self.user_id} can edit game {self.game_id}: {self.can_edit}")
 
         self.ui_font = self.fonts.get('ui', ("Verdana", 10))
         self.title_font = self.fonts.get('title', ("Verdana", 16, "bold"))
@@ -102,10 +112,17 @@ class GameDetailView(tk.Frame):
         self.price_buy_frame = None
         self.review_text_widget = None
         self.reviews_display_text = None
+        self._reviews_request = None
+        self._game_info_request = None
+        self._shown_review_ids = set()
 
         self._setup_ui()
         self._load_reviews()
 
+        live_updates = getattr(self.store_window_ref, 'live_updates', None)
+        if live_updates is not None:
+            live_updates.subscribe(self, ('games', 'reviews', 'reviewcomments'), self._on_data_changed)
+
         self.bind("<Configure>", lambda e: self.after_idle(lambda: self._update_wraplengths(e.width)))
 
     def _update_wraplengths(self, container_width):
@@ -448,14 +465,33 @@ class GameDetailView(tk.Frame):
         self.reviews_display_text.tag_configure("no_reviews", foreground=no_reviews_color, justify=tk.CENTER, font=no_reviews_font)
 
 
-        reviews_data_from_db = None
-        try:
-            reviews_data_from_db = self.db_manager.fetch_game_reviews(self.game_id)
-        except Exception as e:
-            print(f"Error fetching reviews from DB: {e}")
-            self.reviews_display_text.insert(tk.END, f"Помилка завантаження рецензій: {e}", "no_reviews")
-            self.reviews_display_text.config(state=tk.DISABLED)
+        self.reviews_display_text.insert(tk.END, "Завантаження рецензій...", "no_reviews")
+        self.reviews_display_text.config(state=tk.DISABLED)
+
+        future = self.db_manager.submit('fetch_game_reviews_with_comments', self.game_id)
+        self._reviews_request = future
+        run_in_background(self.reviews_display_text, future,
+                          on_success=lambda reviews, f=future: self._render_reviews(f, reviews),
+                          on_error=lambda error, f=future: self._on_reviews_failed(f, error))
+
+    def _on_reviews_failed(self, future, error):
+        """Shows an error message in the reviews area when loading reviews failed"""
+        if future is not self._reviews_request or not self.reviews_display_text.winfo_exists():
             return
+        print(f"Error fetching reviews from DB: {error}")
+        self.reviews_display_text.config(state=tk.NORMAL)
+        self.reviews_display_text.delete('1.0', tk.END)
+        self.reviews_display_text.insert(tk.END, f"Помилка завантаження рецензій: {error}", "no_reviews")
+        self.reviews_display_text.config(state=tk.DISABLED)
+
+    def _render_reviews(self, future, reviews_data_from_db):
+        """Displays loaded reviews and their comments, ignoring responses superseded by a newer request"""
+        if future is not self._reviews_request or not self.reviews_display_text.winfo_exists():
+            return
+
+        self.reviews_display_text.config(state=tk.NORMAL)
+        self.reviews_display_text.delete('1.0', tk.END)
+        self._shown_review_ids = {review[0] for review in reviews_data_from_db or [] if isinstance(review, (list, tuple)) and review}
 
         if reviews_data_from_db is None:
             self.reviews_display_text.insert(tk.END, "Не вдалося завантажити рецензії (DB повернув None)...", "no_reviews")
@@ -465,21 +501,14 @@ class GameDetailView(tk.Frame):
             num_reviews = len(reviews_data_from_db)
             for i, review in enumerate(reviews_data_from_db):
                 try:
-                    if isinstance(review, (list, tuple)) and len(review) >= 4:
-                        review_id, user, text, date_obj = review[:4]
+                    if isinstance(review, (list, tuple)) and len(review) >= 5:
+                        review_id, user, text, date_obj, comments_data = review[:5]
                         date_str = date_obj.strftime('%d %b, %Y @ %H:%M') if date_obj else "Невідома дата"
 
                         self.reviews_display_text.insert(tk.END, f"{user}\n", "review_author")
                         self.reviews_display_text.insert(tk.END, f"Опубліковано: {date_str}\n", "review_date")
                         self.reviews_display_text.insert(tk.END, f"{text or '[Порожня рецензія]'}\n", "review_text")
 
-                        comments_data = None
-                        try:
-                            comments_data = self.db_manager.fetch_review_comments(review_id)
-                        except Exception as ce:
-                            print(f"Error fetching comments for review {review_id}: {ce}")
-                            self.reviews_display_text.insert(tk.END, "[Помилка завантаження коментарів]\n", "comment_text")
-
                         if comments_data:
                             self.reviews_display_text.insert(tk.END, "Коментарі:\n", "comment_header")
                             for c_idx, comment in enumerate(comments_data):
@@ -515,6 +544,36 @@ class GameDetailView(tk.Frame):
         self.reviews_display_text.config(state=tk.DISABLED)
         self.reviews_display_text.yview_moveto(0)
 
+    def _on_data_changed(self, event):
+        """Reloads the part of the page a change made elsewhere affects: the game info or the reviews"""
+        table = event.get('table')
+        if table == 'games' and event.get('game_id') == self.game_id and event.get('op') != 'DELETE':
+            self._reload_game_info()
+        elif table == 'reviews' and event.get('game_id') == self.game_id:
+            self._load_reviews()
+            self._reload_game_info()
+        elif table == 'reviewcomments' and event.get('review_id') in self._shown_review_ids:
+            self._load_reviews()
+
+    def _reload_game_info(self):
+        """Fetches the game again in the background and updates its title, price and description in place"""
+        future = self.db_manager.submit('fetch_game_page', self.game_id, self.user_id)
+        self._game_info_request = future
+        run_in_background(self, future, on_success=lambda game_data, f=future: self._show_game_info(f, game_data))
+
+    def _show_game_info(self, future, game_data):
+        """Shows reloaded game data, ignoring responses superseded by a newer request"""
+        if future is not self._game_info_request or not game_data:
+            return
+        self.game_data = game_data
+        if self.title_label and self.title_label.winfo_exists():
+            self.title_label.config(text=game_data.get('title', 'Назва невідома'))
+        if self.review_count_label and self.review_count_label.winfo_exists():
+            self.review_count_label.config(text=f"Відгуків: {game_data.get('review_count', 0)}")
+        if self.desc_content_label and self.desc_content_label.winfo_exists():
+            self.desc_content_label.config(text=game_data.get('description') or "Не вказано")
+        self._build_price_buy_content()
+
     def _prompt_add_comment(self, target_review_id):
         """Opens a simple dialog to ask the user for comment text"""
         if self.user_id is None:
@@ -600,6 +659,7 @@ class GameDetailView(tk.Frame):
                 if success:
                      action_past = "додано до" if is_free else "придбано та додано до"
                      messagebox.showinfo("Успіх", f"Гру '{title}' успішно {action_past} вашої бібліотеки!", parent=self)
+                     self.is_owned = None
                      self._build_price_buy_content()
                      if self.store_window_ref and hasattr(self.store_window_ref, 'refresh_user_info_display'):
                          self.store_window_ref.refresh_user_info_display()
@@ -622,12 +682,15 @@ class GameDetailView(tk.Frame):
         for widget in self.price_buy_frame.winfo_children():
             widget.destroy()
 
-        is_owned = False
-        try:
-            if self.user_id is not None and self.game_id is not None:
-                is_owned = self.db_manager.check_ownership(self.user_id, self.game_id)
-        except Exception as e:
-            print(f"Error checking ownership: {e}")
+        is_owned = self.is_owned
+        if is_owned is None:
+            is_owned = False
+            try:
+                if self.user_id is not None and self.game_id is not None:
+                    is_owned = self.db_manager.check_ownership(self.user_id, self.game_id)
+            except Exception as e:
+                print(f"Error checking ownership: {e}")
+            self.is_owned = is_owned
 
         if is_owned:
             owned_label = tk.Label(self.price_buy_frame, text="✔ У бібліотеці", font=self.detail_font, bg=self.original_bg, fg="green")
@@ -793,11 +856,7 @@ class GameDetailView(tk.Frame):
         if success:
              messagebox.showinfo("Успіх", "Зміни успішно збережено!", parent=self.store_window_ref)
              dialog.destroy()
-             if self.store_window_ref and hasattr(self.store_window_ref, 'refresh_current_tab'):
-                 print("Triggering StoreWindow refresh after edit.")
-                 self.store_window_ref.after(50, self.store_window_ref.refresh_current_tab)
-             else:
-                  print("Cannot refresh store window - reference missing.")
+             self._reload_game_info()
         else:
              print("UI: Failed to save edits (DB error likely shown).")
              price_widget.focus_set()
\ No newline at end of file
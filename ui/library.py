@@ -47,38 +47,31 @@ class LibraryTab:
         self.right_frame.grid_columnconfigure(0, weight=1)
         self.paned_window.add(self.right_frame, minsize=min_right_width, stretch="always")
 
+        self.library_list = None
+        self._library_request = None
         self.library_canvas = None
         self.library_list_frame = None
-        self._game_widgets_library = []
 
         self._display_placeholder_details()
         self.load_library_games()
 
-    def _create_library_entry(self, parent, game_data):
-        """Creates a tk.Frame widget representing a single game in the library list"""
-        try:
-            game_id, title, _, _, image_filename = game_data
-        except (ValueError, TypeError):
-            print(f"LibraryTab Error: Invalid game data format: {game_data}")
-            return None
-
+    def _create_library_row(self, parent):
+        """Creates an empty, reusable tk.Frame row for the virtualized library list"""
         entry_frame = tk.Frame(parent, background=self.original_bg, cursor="hand2")
+        entry_frame.item_data = None
 
         icon_label = tk.Label(entry_frame, background=self.original_bg, cursor="hand2")
-        tk_image = load_image_cached(self._image_references, image_filename,
-                                    self.image_folder_path, self.list_icon_size,
-                                    self.placeholder_image_list)
-        if tk_image:
-            icon_label.config(image=tk_image)
-            icon_label.image = tk_image
-        else:
-            icon_label.config(text="?", font=self.ui_font, width=int(self.list_icon_size[0]/6), height=int(self.list_icon_size[1]/12), relief="solid", borderwidth=1)
         icon_label.pack(side=tk.LEFT, padx=5, pady=3)
 
-        title_label = tk.Label(entry_frame, text=title, font=self.title_font_list, anchor="w", background=self.original_bg, cursor="hand2")
+        title_label = tk.Label(entry_frame, font=self.title_font_list, anchor="w", background=self.original_bg, cursor="hand2")
         title_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
 
-        click_handler = partial(self._on_game_select, game_id)
+        entry_frame.icon_label = icon_label
+        entry_frame.title_label = title_label
+
+        def click_handler(event=None, frm=entry_frame):
+            if frm.item_data:
+                self._on_game_select(frm.item_data[0])
 
         entry_frame.bind("<Enter>",
                         lambda e, frm=entry_frame, hb=self.hover_bg, ob=self.original_bg, ign=[icon_label]:
@@ -86,19 +79,40 @@ class LibraryTab:
         entry_frame.bind("<Leave>",
                         lambda e, frm=entry_frame, ob=self.original_bg, ign=[icon_label]:
                         remove_hover_effect(frm, ob, ign))
-        entry_frame.bind("<Button-1>", click_handler)
-
 
-        widgets_to_set_cursor = [icon_label, title_label]
-        for widget in widgets_to_set_cursor:
-            if widget and widget.winfo_exists():
-                try:
-                    widget.config(cursor="hand2")
-                    widget.bind("<Button-1>", click_handler)
-                except tk.TclError: pass
+        for widget in [entry_frame, icon_label, title_label]:
+            widget.bind("<Button-1>", click_handler)
 
         return entry_frame
 
+    def _bind_library_row(self, entry_frame, game_data):
+        """Fills a recycled library row with the data of one game"""
+        try:
+            game_id, title, _, _, image_filename = game_data
+        except (ValueError, TypeError):
+            print(f"LibraryTab Error: Invalid game data format: {game_data}")
+            return
+
+        entry_frame.item_data = game_data
+        tk_image = load_image_async(self._image_references, entry_frame, image_filename,
+                                    self.image_folder_path, self.list_icon_size,
+                                    lambda img, row=entry_frame, data=game_data: self._set_library_row_icon(row, img, data),
+                                    self.placeholder_image_list)
+        self._set_library_row_icon(entry_frame, tk_image)
+
+        entry_frame.title_label.config(text=title)
+
+    def _set_library_row_icon(self, entry_frame, tk_image, expected_data=None):
+        """Shows an icon (or the text fallback) in a library row. Skipped if the row has been rebound to another item meanwhile"""
+        if expected_data is not None and entry_frame.item_data is not expected_data:
+            return
+        if tk_image:
+            entry_frame.icon_label.config(image=tk_image, text="", width=0, height=0, relief=tk.FLAT, borderwidth=0)
+            entry_frame.icon_label.image = tk_image
+        else:
+            entry_frame.icon_label.config(image="", text="?", font=self.ui_font, width=int(self.list_icon_size[0]/6), height=int(self.list_icon_size[1]/12), relief="solid", borderwidth=1)
+            entry_frame.icon_label.image = None
+
     def _on_game_select(self, game_id, event=None):
         """Handles the click event on a game entry in the library list"""
         print(f"Library: Selected game ID: {game_id}")
@@ -134,7 +148,7 @@ class LibraryTab:
         detail_img_label = tk.Label(self.right_frame, background=self.original_bg)
         img_filename = game_data.get('image')
         tk_detail_image = load_image_cached(
-            cache_dict=self._image_references,
+            cache=self._image_references,
             image_filename=img_filename,
             folder_path=self.image_folder_path,
             size=self.detail_icon_size,
@@ -162,31 +176,42 @@ class LibraryTab:
 
     def load_library_games(self):
         """
-        Fetches the list of purchased games for the user and populates the
-        left list pane using the create_scrollable_list utility.
+        Requests the list of purchased games for the user in the background
+        and shows it in the virtualized list of the left pane once loaded.
         """
         print("LibraryTab: Loading library games...")
-        games_data = []
-        try:
-            games_data = self.db_manager.fetch_purchased_games(self.user_id)
-            print(f"DEBUG LibraryTab: Fetched {len(games_data) if games_data else 0} games.")
-        except AttributeError:
-            print("DB Error: fetch_purchased_games method missing.")
-            games_data = None
-        except Exception as e:
-            print(f"DB Error fetching purchased games: {e}")
-            games_data = None
-
-        self.library_canvas, self.library_list_frame, self._game_widgets_library = create_scrollable_list(
-            parent=self.library_list_container,
-            item_creation_func=self._create_library_entry,
-            item_data_list=games_data,
-            bg_color=self.original_bg,
-            placeholder_text="Ваша бібліотека порожня.",
-            placeholder_font=self.ui_font,
-            item_pack_config={'fill': tk.X, 'pady': 0}
-        )
-        print(f"LibraryTab: List updated. Widgets created: {len(self._game_widgets_library)}")
+        if not self.library_list or not self.library_list.winfo_exists():
+            self.library_list = VirtualizedList(
+                self.library_list_container,
+                row_factory=self._create_library_row,
+                row_binder=self._bind_library_row,
+                row_height=self.list_icon_size[1] + 6,
+                bg_color=self.original_bg,
+                placeholder_text="Ваша бібліотека порожня.",
+                placeholder_font=self.ui_font,
+                row_padding=(0, 0)
+            )
+            self.library_list.pack(fill=tk.BOTH, expand=True)
+            self.library_canvas = self.library_list.canvas
+            self.library_list_frame = self.library_list.canvas
+
+        self.library_list.set_placeholder_text("Завантаження бібліотеки...")
+        self.library_list.set_items([])
+
+        future = self.db_manager.submit('fetch_purchased_games', self.user_id)
+        self._library_request = future
+        run_in_background(self.library_list, future,
+                          on_success=lambda games_data, f=future: self._on_library_loaded(f, games_data),
+                          on_error=lambda error, f=future: self._on_library_loaded(f, None))
+
+    def _on_library_loaded(self, future, games_data):
+        """Shows the purchased games once they are loaded, ignoring responses superseded by a newer request"""
+        if future is not self._library_request:
+            return
+        print(f"DEBUG LibraryTab: Fetched {len(games_data) if games_data else 0} games.")
+        self.library_list.set_placeholder_text()
+        self.library_list.set_items(games_data)
+        print(f"LibraryTab: List updated. Showing {len(self.library_list.items)} games.")
     
     def after(self, ms, func):
         """Wrapper for the parent widget's 'after' method"""
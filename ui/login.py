@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
-from .utils import center_window, setup_text_widget_editing
+from .utils import center_window, setup_text_widget_editing, run_in_background
 
 class LoginWindow(tk.Tk):
     """The login window for user authentication"""
@@ -57,6 +57,8 @@ class LoginWindow(tk.Tk):
 
     def submit_login(self):
         """Check the fields to log in"""
+        if str(self.login_button['state']) == tk.DISABLED:
+            return
         username = self.login_entry.get()
         password = self.password_entry.get()
 
@@ -64,7 +66,17 @@ class LoginWindow(tk.Tk):
             messagebox.showwarning("Вхід", "Ви не ввели логін та пароль!", parent=self)
             return
 
-        validation_result = self.db_manager.validate_user(username, password)
+        self.login_button.config(state=tk.DISABLED, text="Вхід...")
+        self.config(cursor="watch")
+        future = self.db_manager.submit('validate_user', username, password)
+        run_in_background(self, future,
+                          on_success=self._on_login_validated,
+                          on_error=lambda error: self._on_login_validated(None))
+
+    def _on_login_validated(self, validation_result):
+        """Finishes the login once the credentials were checked in the background"""
+        self.login_button.config(state=tk.NORMAL, text="Увійти")
+        self.config(cursor="")
 
         if validation_result:
             user_id, is_app_admin_status = validation_result 
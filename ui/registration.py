@@ -2,7 +2,7 @@ import tkinter as tk
 import re
 
 from tkinter import messagebox, ttk
-from .utils import center_window, setup_text_widget_editing
+from .utils import center_window, setup_text_widget_editing, run_in_background
 
 class RegistrationWindow(tk.Tk):
     """The user registration window. Allows users to create a new account"""
@@ -68,8 +68,10 @@ class RegistrationWindow(tk.Tk):
         self.protocol("WM_DELETE_WINDOW", self.on_close)
         
     def submit_registration(self):
-        """Validates user input and attempts to register the user via the DatabaseManager"""
+        """Validates user input, hashes the password in the background and then registers the user via the DatabaseManager"""
         messagebox_title = "Реєстрація"
+        if str(self.registration_button['state']) == tk.DISABLED:
+            return
 
         username = self.login_entry.get().strip()
         email = self.email_entry.get().strip()
@@ -127,11 +129,25 @@ class RegistrationWindow(tk.Tk):
             return
 
         print(f"UI: Attempting to register user: {username}")
-        if self.db_manager.register_user(username, email, password):
-            messagebox.showinfo(messagebox_title, "Реєстрація успішна! Тепер ви можете увійти.", parent=self)
+        self.registration_button.config(state=tk.DISABLED, text="Реєстрація...")
+        run_in_background(
+            self,
+            self.db_manager.hash_password_async(password),
+            lambda password_hash: self._on_password_hashed(username, email, password_hash),
+            self._on_password_hashing_failed
+        )
+
+    def _on_password_hashed(self, username, email, password_hash):
+        """Stores the new user once the password hash is ready"""
+        self.registration_button.config(state=tk.NORMAL, text="Зареєструватись")
+        if self.db_manager.register_user(username, email, password_hash=password_hash):
+            messagebox.showinfo("Реєстрація", "Реєстрація успішна! Тепер ви можете увійти.", parent=self)
             self.go_to_login()
-        else:
-            pass
+
+    def _on_password_hashing_failed(self, error):
+        """Re-enables the form if the password could not be hashed"""
+        self.registration_button.config(state=tk.NORMAL, text="Зареєструватись")
+        messagebox.showerror("Реєстрація", "Не вдалося обробити пароль. Спробуйте ще раз.", parent=self)
         
     def go_to_login(self):
         """Destroy self and call the function to open login window"""
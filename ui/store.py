@@ -24,10 +24,9 @@ class StoreWindow(tk.Tk):
         self.is_app_admin = is_app_admin
         self.username = "User"
         self.current_balance = decimal.Decimal('0.00')
-        self._image_references = {}
+        self._image_references = shared_image_cache
         self.placeholder_image = None
         self.placeholder_image_detail = None
-        self._game_widgets_store = []
         self.is_developer = False
         self.studios_tab_instance = None
         self.admin_user_management_panel_instance = None
@@ -62,9 +61,14 @@ class StoreWindow(tk.Tk):
         self.balance_label = None
         self.user_dropdown_menu = None
 
+        self.store_list = None
         self.store_canvas = None
         self.store_inner_frame = None
-        self._game_widgets_store = []
+        self.store_page_size = 50
+        self._store_next_cursor = None
+        self._store_page_loading = False
+        self._store_request = None
+        self.live_updates = LiveUpdates(self, db_manager)
 
         self.original_bg = "white"
         self.hover_bg = "#f0f0f0"
@@ -254,6 +258,7 @@ class StoreWindow(tk.Tk):
         refresh_button.grid(row=2, column=0, pady=10)
 
         self.load_games_store()
+        self._setup_live_updates()
 
         self.bind_all("<MouseWheel>", self._on_mousewheel, add='+')
         self.bind_all("<Button-4>", self._on_mousewheel, add='+')
@@ -288,7 +293,7 @@ class StoreWindow(tk.Tk):
             self.detail_view_instance = None
 
         try:
-            game_details = self.db_manager.fetch_game_details(game_id)
+            game_details = self.db_manager.fetch_game_page(game_id, self.current_user_id)
             if not game_details:
                  messagebox.showwarning("Не знайдено", f"Гра з ID {game_id} не знайдена.")
                  self._show_notebook_view(); return
@@ -360,14 +365,14 @@ class StoreWindow(tk.Tk):
         print("Loading and caching placeholders...")
         if self.placeholder_image_path and os.path.exists(self.placeholder_image_path):
             self.placeholder_image = load_image_cached(
-                cache_dict=self._image_references,
+                cache=self._image_references,
                 image_filename=self.placeholder_image_name,
                 folder_path=self.image_folder, 
                 size=list_size,
                 placeholder_image=None 
             )
             self.placeholder_image_detail = load_image_cached(
-                cache_dict=self._image_references,
+                cache=self._image_references,
                 image_filename=self.placeholder_image_name,
                 folder_path=self.image_folder,
                 size=detail_size,
@@ -472,49 +477,34 @@ class StoreWindow(tk.Tk):
 
         return "break"
 
-    def _create_game_entry(self, parent, game_data):
-        """Creates a tk.Frame widget representing a single game in the store list"""
-        try:
-            game_id, title, _, price, image_filename, purchase_count = game_data[:6]
-        except (ValueError, TypeError) as e:
-            print(f"Error unpacking game data in _create_game_entry: {game_data}, Error: {e}")
-            return None
-
+    def _create_game_row(self, parent):
+        """Creates an empty, reusable tk.Frame row for the virtualized store list"""
         entry_frame = tk.Frame(parent, borderwidth=1, relief=tk.FLAT, background=self.original_bg, cursor="hand2")
+        entry_frame.item_data = None
 
         icon_label = tk.Label(entry_frame, background=self.original_bg, cursor="hand2")
-        tk_image = load_image_cached(
-            cache_dict=self._image_references,
-            image_filename=image_filename,
-            folder_path=self.image_folder,
-            size=self.list_icon_size,
-            placeholder_image=self.placeholder_image
-        )
-        if tk_image:
-            icon_label.config(image=tk_image)
-            icon_label.image = tk_image
-        else:
-            icon_label.config(text="?", font=self.fonts['ui'], width=int(self.list_icon_size[0]/8), height=int(self.list_icon_size[1]/16), relief="solid", borderwidth=1)
         icon_label.pack(side=tk.LEFT, padx=5, pady=5)
 
         text_frame = tk.Frame(entry_frame, background=self.original_bg, cursor="hand2")
         text_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5, pady=5)
 
-        title_label = tk.Label(text_frame, text=title or "Без назви", font=self.fonts['list_title'], anchor="w", justify=tk.LEFT, background=self.original_bg, cursor="hand2")
+        title_label = tk.Label(text_frame, font=self.fonts['list_title'], anchor="w", justify=tk.LEFT, background=self.original_bg, cursor="hand2")
         title_label.pack(fill=tk.X, pady=(0, 2))
 
         price_purchase_frame = tk.Frame(text_frame, background=self.original_bg, cursor="hand2")
         price_purchase_frame.pack(fill=tk.X)
-        price_text = format_price_display(price)
-        price_label = tk.Label(price_purchase_frame, text=price_text, font=self.fonts['ui'], anchor="w", justify=tk.LEFT, background=self.original_bg, cursor="hand2")
+        price_label = tk.Label(price_purchase_frame, font=self.fonts['ui'], anchor="w", justify=tk.LEFT, background=self.original_bg, cursor="hand2")
         price_label.pack(side=tk.LEFT, anchor='w')
+        purchase_label = tk.Label(price_purchase_frame, font=self.fonts['comment'], fg='grey', anchor="e", justify=tk.RIGHT, background=self.original_bg, cursor="hand2")
 
-        purchase_label = None
-        if isinstance(purchase_count, int) and purchase_count > 0:
-            purchase_label = tk.Label(price_purchase_frame, text=f"Покупок: {purchase_count}", font=self.fonts['comment'], fg='grey', anchor="e", justify=tk.RIGHT, background=self.original_bg, cursor="hand2")
-            purchase_label.pack(side=tk.RIGHT, anchor='e', padx=(10, 0))
+        entry_frame.icon_label = icon_label
+        entry_frame.title_label = title_label
+        entry_frame.price_label = price_label
+        entry_frame.purchase_label = purchase_label
 
-        click_handler = partial(self._show_detail_view, game_id)
+        def click_handler(event=None, frm=entry_frame):
+            if frm.item_data:
+                self._show_detail_view(frm.item_data[0])
 
         entry_frame.bind("<Enter>",
                         lambda e, frm=entry_frame, hb=self.hover_bg, ob=self.original_bg, ign=[icon_label]:
@@ -522,50 +512,180 @@ class StoreWindow(tk.Tk):
         entry_frame.bind("<Leave>",
                         lambda e, frm=entry_frame, ob=self.original_bg, ign=[icon_label]:
                         remove_hover_effect(frm, ob, ign))
-        entry_frame.bind("<Button-1>", click_handler)
-
-        widgets_to_set_cursor = [icon_label, text_frame, title_label, price_purchase_frame, price_label]
-        if purchase_label:
-            widgets_to_set_cursor.append(purchase_label)
 
-        for widget in widgets_to_set_cursor:
-            if widget and widget.winfo_exists():
-                try:
-                    widget.config(cursor="hand2")
-                    widget.bind("<Button-1>", click_handler)
-                except tk.TclError: pass
+        for widget in [entry_frame, icon_label, text_frame, title_label, price_purchase_frame, price_label, purchase_label]:
+            widget.bind("<Button-1>", click_handler)
 
         return entry_frame
-    
+
+    def _bind_game_row(self, entry_frame, game_data):
+        """Fills a recycled store row with the data of one game"""
+        try:
+            game_id, title, _, price, image_filename, purchase_count = game_data[:6]
+        except (ValueError, TypeError) as e:
+            print(f"Error unpacking game data in _bind_game_row: {game_data}, Error: {e}")
+            return
+
+        entry_frame.item_data = game_data
+        tk_image = load_image_async(
+            cache=self._image_references,
+            widget=entry_frame,
+            image_filename=image_filename,
+            folder_path=self.image_folder,
+            size=self.list_icon_size,
+            on_ready=lambda img, row=entry_frame, data=game_data: self._set_game_row_icon(row, img, data),
+            placeholder_image=self.placeholder_image
+        )
+        self._set_game_row_icon(entry_frame, tk_image)
+
+        entry_frame.title_label.config(text=title or "Без назви")
+        entry_frame.price_label.config(text=format_price_display(price))
+
+        if isinstance(purchase_count, int) and purchase_count > 0:
+            entry_frame.purchase_label.config(text=f"Покупок: {purchase_count}")
+            entry_frame.purchase_label.pack(side=tk.RIGHT, anchor='e', padx=(10, 0))
+        else:
+            entry_frame.purchase_label.pack_forget()
+
+    def _set_game_row_icon(self, entry_frame, tk_image, expected_data=None):
+        """Shows an icon (or the text fallback) in a store row. Skipped if the row has been rebound to another item meanwhile"""
+        if expected_data is not None and entry_frame.item_data is not expected_data:
+            return
+        if tk_image:
+            entry_frame.icon_label.config(image=tk_image, text="", width=0, height=0, relief=tk.FLAT, borderwidth=0)
+            entry_frame.icon_label.image = tk_image
+        else:
+            entry_frame.icon_label.config(image="", text="?", font=self.fonts['ui'], width=int(self.list_icon_size[0]/8), height=int(self.list_icon_size[1]/16), relief="solid", borderwidth=1)
+            entry_frame.icon_label.image = None
+
     def load_games_store(self):
-        """Fetches game data based on current sort settings and populates the store list using the create_scrollable_list utility"""
+        """Requests the first page of games based on current sort settings in the background and shows a loading state until it arrives. Next pages are loaded on scroll"""
         print(f"Loading store games. Sort by: {self.current_sort_key}, Reverse: {self.current_sort_reverse}")
         db_sort_key = self.current_sort_key
         db_sort_order = 'DESC' if self.current_sort_reverse else 'ASC'
 
-        games_data_from_db = []
-        try:
-            games_data_from_db = self.db_manager.fetch_all_games(
-                sort_by=db_sort_key,
-                sort_order=db_sort_order
+        if not self.store_list or not self.store_list.winfo_exists():
+            self.store_list = VirtualizedList(
+                self.store_list_container,
+                row_factory=self._create_game_row,
+                row_binder=self._bind_game_row,
+                row_height=self.list_icon_size[1] + 12,
+                bg_color=self.original_bg,
+                placeholder_text="В магазині поки немає ігор.",
+                placeholder_font=self.fonts['ui'],
+                on_scroll_end=self._load_next_store_page
             )
-        except AttributeError:
-            messagebox.showerror("Помилка", "Функція fetch_all_games не реалізована або не приймає параметри сортування в DB Manager.")
-            games_data_from_db = None
-        except Exception as e:
-            messagebox.showerror("Помилка бази даних", f"Не вдалося завантажити список ігор:\n{e}")
-            traceback.print_exc()
-            games_data_from_db = None
-
-        self.store_canvas, self.store_inner_frame, self._game_widgets_store = create_scrollable_list(
-            parent=self.store_list_container,
-            item_creation_func=self._create_game_entry,
-            item_data_list=games_data_from_db,
-            bg_color=self.original_bg,
-            placeholder_text="В магазині поки немає ігор.",
-            placeholder_font=self.fonts['ui']
+            self.store_list.grid(row=0, column=0, sticky='nsew')
+            self.store_canvas = self.store_list.canvas
+            self.store_inner_frame = self.store_list.canvas
+
+        self._store_next_cursor = None
+        self._store_page_loading = True
+        self.store_list.set_placeholder_text("Завантаження ігор...")
+        self.store_list.set_items([])
+
+        future = self.db_manager.submit(
+            'fetch_games_page', sort_by=db_sort_key, sort_order=db_sort_order, limit=self.store_page_size
         )
-        print(f"Store list created/updated. Found {len(self._game_widgets_store)} game widgets.")
+        self._store_request = future
+        run_in_background(self.store_list, future,
+                          on_success=lambda result, f=future: self._on_store_page_loaded(f, result, replace=True),
+                          on_error=lambda error, f=future: self._on_store_page_failed(f, error))
+
+    def _load_next_store_page(self):
+        """Requests the next page of games after the last loaded one. It is appended to the store list when it arrives"""
+        if self._store_next_cursor is None or self._store_page_loading:
+            return
+        if not self.store_list or not self.store_list.winfo_exists():
+            return
+
+        self._store_page_loading = True
+        db_sort_order = 'DESC' if self.current_sort_reverse else 'ASC'
+        future = self.db_manager.submit(
+            'fetch_games_page', sort_by=self.current_sort_key, sort_order=db_sort_order,
+            after=self._store_next_cursor, limit=self.store_page_size
+        )
+        self._store_request = future
+        run_in_background(self.store_list, future,
+                          on_success=lambda result, f=future: self._on_store_page_loaded(f, result, replace=False),
+                          on_error=lambda error, f=future: self._on_store_page_failed(f, error))
+
+    def _on_store_page_loaded(self, future, result, replace):
+        """Shows a page of games that finished loading, ignoring responses superseded by a newer request"""
+        if future is not self._store_request:
+            return
+        self._store_page_loading = False
+        games_page, next_cursor = result
+        self.store_list.set_placeholder_text()
+        if games_page is None:
+            if replace:
+                self.store_list.set_placeholder_text("Не вдалося завантажити список ігор.")
+            return
+
+        self._store_next_cursor = next_cursor
+        if replace:
+            self.store_list.set_items(games_page)
+            print(f"Store list created/updated. Showing {len(self.store_list.items)} games.")
+        else:
+            self.store_list.append_items(games_page)
+            print(f"Store list extended. Showing {len(self.store_list.items)} games.")
+
+    def _on_store_page_failed(self, future, error):
+        """Reports a failed store page request"""
+        if future is not self._store_request:
+            return
+        self._store_page_loading = False
+        self.store_list.set_placeholder_text("Не вдалося завантажити список ігор.")
+        messagebox.showerror("Помилка бази даних", f"Не вдалося завантажити список ігор:\n{error}")
+
+    def _setup_live_updates(self):
+        """Patches the rows and labels affected by changes other clients make, instead of reloading whole lists"""
+        self.live_updates.subscribe(self, ('games',), self._on_game_changed)
+        self.live_updates.subscribe(self, ('users',), self._on_user_changed)
+
+    def _on_game_changed(self, event):
+        """Refreshes the store row of a changed game. A reload event refreshes the whole active tab"""
+        if event.get('table') == '*':
+            self.refresh_current_tab()
+            return
+        game_id = event.get('game_id')
+        if not self.store_list or not self.store_list.winfo_exists():
+            return
+        if not any(item[0] == game_id for item in self.store_list.items):
+            return
+        future = self.db_manager.submit('fetch_store_rows', [game_id])
+        run_in_background(self.store_list, future,
+                          on_success=lambda rows, gid=game_id: self._patch_store_row(gid, rows))
+
+    def _patch_store_row(self, game_id, rows):
+        """Replaces the store list item of one game with fresh data, or removes it if the game was deleted"""
+        if rows is None or not self.store_list or not self.store_list.winfo_exists():
+            return
+        for index, item in enumerate(self.store_list.items):
+            if item[0] == game_id:
+                if rows:
+                    self.store_list.update_item(index, rows[0])
+                else:
+                    self.store_list.remove_item(index)
+                return
+
+    def _on_user_changed(self, event):
+        """Updates the username and balance shown in the top bar when the current user's row changed"""
+        if event.get('user_id') != self.current_user_id or event.get('op') == 'DELETE':
+            return
+        future = self.db_manager.submit('fetch_user_info', self.current_user_id)
+        run_in_background(self, future, on_success=self._show_user_info)
+
+    def _show_user_info(self, user_data):
+        """Shows freshly fetched username and balance in the user info panel"""
+        if not user_data:
+            return
+        self.username = user_data.get('username', self.username)
+        self.current_balance = user_data.get('balance', self.current_balance)
+        if self.username_label and self.username_label.winfo_exists():
+            self.username_label.config(text=self.username)
+        if self.balance_label and self.balance_label.winfo_exists():
+            self.balance_label.config(text=f"{self.current_balance:.2f}₴")
 
     def load_games_library(self):
         """Triggers a refresh of the library tab view"""
@@ -1288,7 +1408,16 @@ class StoreWindow(tk.Tk):
                 if self.studios_tab_instance:
                     self.studios_tab_instance.refresh_content()
     
+    def destroy(self):
+        """Stops live updates and drops the cached images before the window is destroyed"""
+        if self.live_updates is not None:
+            self.live_updates.close()
+            self.live_updates = None
+        # The PhotoImages belong to this Tk interpreter, so a window opened after logout cannot reuse them
+        self._image_references.clear()
+        super().destroy()
+
     def on_close(self):
         """Handles the window close event"""
-        self._image_references.clear()
+        print(f"UI: Image cache stats: {self._image_references.stats()}")
         self.destroy()
\ No newline at end of file
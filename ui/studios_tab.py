@@ -27,7 +27,7 @@ class StudiosTab(tk.Frame):
         self.custom_button_style = styles.get('custom_button', 'TButton')
         self.list_icon_size = (64, 64)
 
-        self._image_references = getattr(store_window_ref, '_image_references', {})
+        self._image_references = getattr(store_window_ref, '_image_references', shared_image_cache)
         self.placeholder_image_list = getattr(store_window_ref, 'placeholder_image', None)
         self.studio_logo_folder = getattr(store_window_ref, 'studio_logo_folder', None)
         self.placeholder_image_name = getattr(store_window_ref, 'placeholder_image_name', 'placeholder.png')
@@ -37,77 +37,81 @@ class StudiosTab(tk.Frame):
         self.main_content_area.grid_rowconfigure(0, weight=1)
         self.main_content_area.grid_columnconfigure(0, weight=1)
 
+        self.studios_list = None
+        self._studios_request = None
         self.studios_canvas = None
         self.studios_inner_frame = None
-        self._studio_widgets = []
 
         self._setup_ui()
         
     def _setup_ui(self):
-        """Fetches the list of all studios from the database and populates the main content area using the create_scrollable_list utility"""
+        """Requests the list of all studios in the background and shows it in the virtualized list of the main content area once loaded"""
         print("StudiosTab: Loading studios list...")
-        studios_data = None
-        try:
-            studios_data = self.db_manager.fetch_all_studios(sort_by='name', sort_order='ASC')
-        except AttributeError:
-            messagebox.showerror("Помилка", "Функція fetch_all_studios не реалізована в DB Manager.", parent=self)
-            studios_data = None
-        except Exception as e:
-            messagebox.showerror("Помилка бази даних", f"Не вдалося завантажити список студій:\n{e}", parent=self)
-            traceback.print_exc()
-            studios_data = None
-
-        self.studios_canvas, self.studios_inner_frame, self._studio_widgets = create_scrollable_list(
-            parent=self.main_content_area,
-            item_creation_func=self._create_studio_entry,
-            item_data_list=studios_data,
-            bg_color=self.original_bg,
-            placeholder_text="На платформі ще немає зареєстрованих студій.",
-            placeholder_font=self.fonts['ui'],
-            item_pack_config={'fill': tk.X, 'pady': 2, 'padx': 2}
-        )
-        print(f"Studios list created/updated. Found {len(self._studio_widgets)} studio widgets.")
+        if not self.studios_list or not self.studios_list.winfo_exists():
+            self.studios_list = VirtualizedList(
+                self.main_content_area,
+                row_factory=self._create_studio_row,
+                row_binder=self._bind_studio_row,
+                row_height=self.list_icon_size[1] + 12,
+                bg_color=self.original_bg,
+                placeholder_text="На платформі ще немає зареєстрованих студій.",
+                placeholder_font=self.fonts['ui']
+            )
+            self.studios_list.grid(row=0, column=0, sticky='nsew')
+            self.studios_canvas = self.studios_list.canvas
+            self.studios_inner_frame = self.studios_list.canvas
+
+        self.studios_list.set_placeholder_text("Завантаження студій...")
+        self.studios_list.set_items([])
+
+        future = self.db_manager.submit('fetch_all_studios', sort_by='name', sort_order='ASC')
+        self._studios_request = future
+        run_in_background(self.studios_list, future,
+                          on_success=lambda studios_data, f=future: self._on_studios_loaded(f, studios_data),
+                          on_error=lambda error, f=future: self._on_studios_load_failed(f, error))
+
+    def _on_studios_loaded(self, future, studios_data):
+        """Shows the studios once they are loaded, ignoring responses superseded by a newer request"""
+        if future is not self._studios_request:
+            return
+        self.studios_list.set_placeholder_text()
+        self.studios_list.set_items([studio for studio in (studios_data or []) if studio.get('studio_id') is not None])
+        print(f"Studios list created/updated. Showing {len(self.studios_list.items)} studios.")
+
+    def _on_studios_load_failed(self, future, error):
+        """Reports a failed studios request"""
+        if future is not self._studios_request:
+            return
+        self.studios_list.set_placeholder_text()
+        self.studios_list.set_items([])
+        messagebox.showerror("Помилка бази даних", f"Не вдалося завантажити список студій:\n{error}", parent=self)
             
-    def _create_studio_entry(self, parent, studio_data):
-        """Creates a tk.Frame widget representing a single studio in the list"""
-        studio_id = studio_data.get('studio_id')
-        name = studio_data.get('name', 'Невідома студія')
-        logo_filename = studio_data.get('logo')
-        country = studio_data.get('country', 'Невідомо')
-
-        if studio_id is None: return None
-
+    def _create_studio_row(self, parent):
+        """Creates an empty, reusable tk.Frame row for the virtualized studios list"""
         entry_frame = tk.Frame(parent, borderwidth=1, relief=tk.FLAT, background=self.original_bg, cursor="hand2")
+        entry_frame.item_data = None
 
         icon_label = tk.Label(entry_frame, background=self.original_bg, cursor="hand2")
-        tk_image = load_image_cached(
-            cache_dict=self._image_references,
-            image_filename=logo_filename,
-            folder_path=self.studio_logo_folder,
-            size=self.list_icon_size,
-            placeholder_image=self.placeholder_image_list
-        )
-
-        if tk_image:
-            icon_label.config(image=tk_image)
-            icon_label.image = tk_image
-        else:
-            icon_label.config(text="?", font=self.fonts['ui'], width=int(self.list_icon_size[0]/8), height=int(self.list_icon_size[1]/16), relief="solid", borderwidth=1)
         icon_label.pack(side=tk.LEFT, padx=5, pady=5)
 
         text_frame = tk.Frame(entry_frame, background=self.original_bg, cursor="hand2")
         text_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5, pady=5)
 
-        name_label = tk.Label(text_frame, text=name,
+        name_label = tk.Label(text_frame,
                             font=self.fonts.get('list_title', ("Verdana", 12, "bold")),
                             anchor="w", justify=tk.LEFT, background=self.original_bg, cursor="hand2")
         name_label.pack(fill=tk.X, pady=(0, 2))
 
-        country_label = tk.Label(text_frame, text=f"Країна: {country}",
-                                font=self.fonts['ui'], anchor="w", justify=tk.LEFT, background=self.original_bg, cursor="hand2")
+        country_label = tk.Label(text_frame, font=self.fonts['ui'], anchor="w", justify=tk.LEFT, background=self.original_bg, cursor="hand2")
         country_label.pack(fill=tk.X)
 
-        click_handler = partial(self._on_studio_select, name)
+        entry_frame.icon_label = icon_label
+        entry_frame.name_label = name_label
+        entry_frame.country_label = country_label
+
+        def click_handler(event=None, frm=entry_frame):
+            if frm.item_data:
+                self._on_studio_select(frm.item_data.get('name', 'Невідома студія'))
 
         entry_frame.bind("<Enter>",
                         lambda e, frm=entry_frame, hb=self.hover_bg, ob=self.original_bg, ign=[icon_label]:
@@ -115,21 +119,44 @@ class StudiosTab(tk.Frame):
         entry_frame.bind("<Leave>",
                         lambda e, frm=entry_frame, ob=self.original_bg, ign=[icon_label]:
                         remove_hover_effect(frm, ob, ign))
-        entry_frame.bind("<Button-1>", click_handler)
 
-        widgets_to_set_cursor = [
-            icon_label, text_frame, name_label, country_label
-        ]
-
-        for widget in widgets_to_set_cursor:
-            if widget and widget.winfo_exists():
-                try:
-                    widget.config(cursor="hand2")
-                    widget.bind("<Button-1>", click_handler)
-                except tk.TclError: pass
+        for widget in [entry_frame, icon_label, text_frame, name_label, country_label]:
+            widget.bind("<Button-1>", click_handler)
 
         return entry_frame
 
+    def _bind_studio_row(self, entry_frame, studio_data):
+        """Fills a recycled studios row with the data of one studio"""
+        entry_frame.item_data = studio_data
+        name = studio_data.get('name', 'Невідома студія')
+        logo_filename = studio_data.get('logo')
+        country = studio_data.get('country', 'Невідомо')
+
+        tk_image = load_image_async(
+            cache=self._image_references,
+            widget=entry_frame,
+            image_filename=logo_filename,
+            folder_path=self.studio_logo_folder,
+            size=self.list_icon_size,
+            on_ready=lambda img, row=entry_frame, data=studio_data: self._set_studio_row_icon(row, img, data),
+            placeholder_image=self.placeholder_image_list
+        )
+        self._set_studio_row_icon(entry_frame, tk_image)
+
+        entry_frame.name_label.config(text=name)
+        entry_frame.country_label.config(text=f"Країна: {country}")
+
+    def _set_studio_row_icon(self, entry_frame, tk_image, expected_data=None):
+        """Shows a logo (or the text fallback) in a studios row. Skipped if the row has been rebound to another item meanwhile"""
+        if expected_data is not None and entry_frame.item_data is not expected_data:
+            return
+        if tk_image:
+            entry_frame.icon_label.config(image=tk_image, text="", width=0, height=0, relief=tk.FLAT, borderwidth=0)
+            entry_frame.icon_label.image = tk_image
+        else:
+            entry_frame.icon_label.config(image="", text="?", font=self.fonts['ui'], width=int(self.list_icon_size[0]/8), height=int(self.list_icon_size[1]/16), relief="solid", borderwidth=1)
+            entry_frame.icon_label.image = None
+
     def _on_studio_select(self, studio_name, event=None):
         """Handles the click event on a studio entry in the list"""
         print(f"StudiosTab: Selected studio: {studio_name}")
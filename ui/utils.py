@@ -2,12 +2,19 @@ import tkinter as tk
 import screeninfo
 import pyautogui
 import os
+import time
+import queue
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date 
 
 from tkinter import ttk, scrolledtext, Toplevel 
 from PIL import Image, ImageTk
 from decimal import Decimal, InvalidOperation
 
+from thumbnail_cache import resize_image
+
 def center_window(self, width, height):
     """Centers a Tkinter window on the primary monitor"""
     try:
@@ -102,95 +109,265 @@ def setup_text_widget_editing(widget):
 
     widget.bind("<FocusOut>", _clear_selection_on_focus_out)
     
-def create_scrollable_list(parent, item_creation_func, item_data_list,
-                             bg_color="white", placeholder_text="Список порожній.",
-                             placeholder_font=("Verdana", 10), placeholder_fg="grey",
-                             item_pack_config=None):
-    """Creates a scrollable area within the parent widget and populates it with items generated by item_creation_func"""
-    if item_pack_config is None:
-        item_pack_config = {'fill': tk.X, 'pady': 2, 'padx': 2}
-
-    for widget in parent.winfo_children():
-        widget.destroy()
-
-    canvas_scrollbar_frame = tk.Frame(parent, bg=bg_color)
-    canvas_scrollbar_frame.pack(fill=tk.BOTH, expand=True)
-
-    canvas = tk.Canvas(canvas_scrollbar_frame, borderwidth=0, background=bg_color, highlightthickness=0)
-    scrollbar = ttk.Scrollbar(canvas_scrollbar_frame, orient="vertical", command=canvas.yview)
-    inner_frame = tk.Frame(canvas, background=bg_color)
-
-    canvas.configure(yscrollcommand=scrollbar.set)
-    scrollbar.pack(side="right", fill="y")
-    canvas.pack(side="left", fill="both", expand=True)
-    canvas_frame_id = canvas.create_window((0, 0), window=inner_frame, anchor="nw")
-
-    def _on_inner_frame_configure(event=None):
-        """Updates the canvas scroll region when the inner frame's size changes"""
-        if canvas.winfo_exists(): 
-            canvas.after_idle(lambda: canvas.configure(scrollregion=canvas.bbox("all")))
-
-    def _on_inner_canvas_configure(event):
-        """Updates the width of the inner frame when the canvas width changes"""
-        if canvas.winfo_exists():
-            canvas_width = event.width
-            canvas.itemconfig(canvas_frame_id, width=canvas_width)
-            canvas.after_idle(lambda: canvas.configure(scrollregion=canvas.bbox("all")))
-
-    def _on_inner_mousewheel(event):
-        """Handles mouse wheel events on the canvas and inner frame"""
-        if not canvas.winfo_exists(): return
-        if event.num == 4: delta = -1
-        elif event.num == 5: delta = 1
-        else:
-            try: delta = -1 if event.delta > 0 else 1
-            except AttributeError: return
-        canvas.yview_scroll(delta, "units")
-        return "break"
+class VirtualizedList(tk.Frame):
+    """A scrollable list that keeps a small pool of recycled row widgets and rebinds item data to them as the viewport moves"""
+    def __init__(self, parent, row_factory, row_binder, row_height,
+                 bg_color="white", placeholder_text="Список порожній.",
+                 placeholder_font=("Verdana", 10), placeholder_fg="grey",
+                 row_padding=(2, 2), on_scroll_end=None, scroll_end_threshold=0.9, **kwargs):
+        """Initializes the list. row_factory(parent) builds an empty row widget, row_binder(row, item_data) fills it with data"""
+        super().__init__(parent, bg=bg_color, **kwargs)
+        self.row_factory = row_factory
+        self.row_binder = row_binder
+        self.row_height = row_height
+        self.row_padx, self.row_pady = row_padding
+        self.slot_height = row_height + 2 * self.row_pady
+        self.placeholder_text = placeholder_text
+        self.on_scroll_end = on_scroll_end
+        self.scroll_end_threshold = scroll_end_threshold
+
+        self.items = []
+        self._rows = []
+        self._row_windows = []
+        self._row_indices = []
+        self._canvas_width = 1
+
+        self.canvas = tk.Canvas(self, borderwidth=0, background=bg_color, highlightthickness=0,
+                                yscrollincrement=max(1, self.slot_height // 2))
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yview_change)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self._placeholder_id = self.canvas.create_text(
+            0, 20, text=placeholder_text, font=placeholder_font, fill=placeholder_fg, anchor="n", state="hidden"
+        )
+
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        self._bind_mousewheel(self.canvas)
+
+    def set_items(self, items):
+        """Replaces all items of the list and scrolls back to the top"""
+        self.items = list(items) if items else []
+        self._row_indices = [None] * len(self._rows)
+        self.canvas.yview_moveto(0)
+        self._update_scrollregion()
+        self._refresh_visible_rows()
+
+    def append_items(self, items):
+        """Adds items to the end of the list without touching the ones already shown"""
+        if not items:
+            return
+        self.items.extend(items)
+        self._update_scrollregion()
+        self._refresh_visible_rows()
+
+    def set_placeholder_text(self, text=None):
+        """Changes the text shown while the list is empty (e.g. a loading message). None restores the default text"""
+        self.canvas.itemconfig(self._placeholder_id, text=text if text is not None else self.placeholder_text)
+
+    def update_item(self, index, item_data):
+        """Replaces the data of one item and rebinds its row if it is currently visible"""
+        if not 0 <= index < len(self.items):
+            return
+        self.items[index] = item_data
+        for row_pos, row_index in enumerate(self._row_indices):
+            if row_index == index:
+                self.row_binder(self._rows[row_pos], item_data)
+
+    def remove_item(self, index):
+        """Removes one item, keeping the scroll position"""
+        if not 0 <= index < len(self.items):
+            return
+        del self.items[index]
+        self._row_indices = [None] * len(self._rows)
+        self._update_scrollregion()
+        self._refresh_visible_rows()
+
+    def _bind_mousewheel(self, widget):
+        """Binds the list's mouse wheel handler to a widget and all its descendants"""
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(sequence, self._on_mousewheel)
+        for child in widget.winfo_children():
+            self._bind_mousewheel(child)
+
+    def _on_mousewheel(self, event):
+        """Scrolls the list by mouse wheel"""
+        return handle_mouse_wheel_event(event, self.canvas)
+
+    def _on_canvas_configure(self, event):
+        """Resizes row windows to the canvas width and grows the row pool to cover the visible height"""
+        self._canvas_width = max(1, event.width)
+        row_width = max(1, self._canvas_width - 2 * self.row_padx)
+        for window_id in self._row_windows:
+            self.canvas.itemconfig(window_id, width=row_width)
+        self.canvas.coords(self._placeholder_id, self._canvas_width // 2, 20)
+
+        needed_rows = event.height // self.slot_height + 2
+        while len(self._rows) < needed_rows:
+            row = self.row_factory(self.canvas)
+            window_id = self.canvas.create_window(
+                self.row_padx, 0, window=row, anchor="nw",
+                width=row_width, height=self.row_height, state="hidden"
+            )
+            self._bind_mousewheel(row)
+            self._rows.append(row)
+            self._row_windows.append(window_id)
+            self._row_indices.append(None)
+
+        self._update_scrollregion()
+        self._refresh_visible_rows()
+
+    def _update_scrollregion(self):
+        """Sets the scroll region to the full virtual height of the list"""
+        total_height = len(self.items) * self.slot_height
+        self.canvas.configure(scrollregion=(0, 0, self._canvas_width, max(total_height, 1)))
+        self.canvas.itemconfig(self._placeholder_id, state="hidden" if self.items else "normal")
+
+    def _refresh_visible_rows(self):
+        """Moves pooled rows to the visible item slots and rebinds the ones that now show different items"""
+        if not self.canvas.winfo_exists():
+            return
+        pool_size = len(self._rows)
+        first_index = max(0, int(self.canvas.canvasy(0)) // self.slot_height)
+        for item_index in range(first_index, first_index + pool_size):
+            row_pos = item_index % pool_size
+            row = self._rows[row_pos]
+            window_id = self._row_windows[row_pos]
+            if item_index >= len(self.items):
+                self.canvas.itemconfig(window_id, state="hidden")
+                self._row_indices[row_pos] = None
+                continue
+            if self._row_indices[row_pos] != item_index:
+                self.row_binder(row, self.items[item_index])
+                self._row_indices[row_pos] = item_index
+            self.canvas.coords(window_id, self.row_padx, item_index * self.slot_height + self.row_pady)
+            self.canvas.itemconfig(window_id, state="normal")
+
+    def _on_yview_change(self, first, last):
+        """Updates the scrollbar, repositions rows and requests more items near the bottom of the list"""
+        self.scrollbar.set(first, last)
+        self._refresh_visible_rows()
+        if self.on_scroll_end and self.items and float(last) >= self.scroll_end_threshold:
+            self.canvas.after_idle(self.on_scroll_end)
+
+def run_in_background(widget, future, on_success, on_error=None, poll_interval_ms=30):
+    """Waits for a Future from the Tk main loop via after() and calls on_success/on_error on the main thread once it is done"""
+    def _poll():
+        try:
+            if not widget.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        if not future.done():
+            widget.after(poll_interval_ms, _poll)
+            return
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            print(f"UI: Background task failed: {error}")
+            if on_error:
+                on_error(error)
+            return
+        on_success(future.result())
+
+    widget.after(poll_interval_ms, _poll)
+    return future
+
+def stream_in_background(widget, future, chunks, on_chunk, on_done=None, on_error=None, poll_interval_ms=30):
+    """Like run_in_background, but also hands every chunk the worker puts into the chunks queue to on_chunk on the main thread as it arrives"""
+    def _poll():
+        try:
+            if not widget.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        done = future.done()
+        while True:
+            try:
+                chunk = chunks.get_nowait()
+            except queue.Empty:
+                break
+            on_chunk(chunk)
+        if not done:
+            widget.after(poll_interval_ms, _poll)
+            return
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            print(f"UI: Background task failed: {error}")
+            if on_error:
+                on_error(error)
+            return
+        if on_done:
+            on_done(future.result())
+
+    widget.after(poll_interval_ms, _poll)
+    return future
+
+class LiveUpdates:
+    """Hands database change events from the listener thread to Tk widgets on the main thread, merging duplicates that arrive together"""
+    def __init__(self, root, db_manager, drain_interval_ms=250):
+        """Subscribes to the change events of db_manager and starts draining them from the main loop of root"""
+        self.root = root
+        self.drain_interval_ms = drain_interval_ms
+        self._events = queue.SimpleQueue()
+        self._handlers = []
+        self._unsubscribe = db_manager.subscribe_changes(self._events.put)
+        self._drain_job = self.root.after(self.drain_interval_ms, self._drain)
+
+    def subscribe(self, widget, tables, handler):
+        """Calls handler(event) on the main thread for changes of the given tables while widget exists. A '*' (reload) event reaches every handler"""
+        self._handlers.append((widget, frozenset(tables), handler))
+
+    def close(self):
+        """Stops receiving events"""
+        self._unsubscribe()
+        if self._drain_job is not None:
+            try:
+                self.root.after_cancel(self._drain_job)
+            except tk.TclError:
+                pass
+            self._drain_job = None
+
+    def _drain(self):
+        """Dispatches the events received since the last drain"""
+        self._drain_job = None
+        events = {}
+        while True:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                break
+            events[tuple(sorted(event.items()))] = event
+
+        if events:
+            live_handlers = []
+            for widget, tables, handler in self._handlers:
+                try:
+                    if not widget.winfo_exists():
+                        continue
+                except tk.TclError:
+                    continue
+                live_handlers.append((widget, tables, handler))
+            self._handlers = live_handlers
+
+            for event in events.values():
+                for _, tables, handler in live_handlers:
+                    if event.get('table') == '*' or event.get('table') in tables:
+                        # One failing handler must not stop the others or the next drain
+                        try:
+                            handler(event)
+                        except Exception as e:
+                            print(f"UI: Live update handler failed: {e}")
+                            traceback.print_exc()
 
-    inner_frame.bind("<Configure>", _on_inner_frame_configure)
-    canvas.bind('<Configure>', _on_inner_canvas_configure)
-
-    for widget in [canvas, inner_frame]:
-        widget.bind("<MouseWheel>", _on_inner_mousewheel)
-        widget.bind("<Button-4>", _on_inner_mousewheel)
-        widget.bind("<Button-5>", _on_inner_mousewheel)
-
-    list_widgets = []
-    if not item_data_list:
-        placeholder_label = tk.Label(inner_frame, text=placeholder_text,
-                                     font=placeholder_font, fg=placeholder_fg, bg=bg_color)
-        placeholder_label.pack(pady=20)
-        placeholder_label.bind("<MouseWheel>", _on_inner_mousewheel)
-        placeholder_label.bind("<Button-4>", _on_inner_mousewheel)
-        placeholder_label.bind("<Button-5>", _on_inner_mousewheel)
-    else:
-        for item_data in item_data_list:
-            item_widget = item_creation_func(inner_frame, item_data)
-            if item_widget:
-                item_widget.pack(**item_pack_config)
-                list_widgets.append(item_widget)
-                item_widget.bind("<MouseWheel>", _on_inner_mousewheel)
-                item_widget.bind("<Button-4>", _on_inner_mousewheel)
-                item_widget.bind("<Button-5>", _on_inner_mousewheel)
-                for child in item_widget.winfo_children():
-                    if isinstance(child, tk.Frame):
-                         for grandchild in child.winfo_children():
-                              grandchild.bind("<MouseWheel>", _on_inner_mousewheel)
-                              grandchild.bind("<Button-4>", _on_inner_mousewheel)
-                              grandchild.bind("<Button-5>", _on_inner_mousewheel)
-                    else:
-                        child.bind("<MouseWheel>", _on_inner_mousewheel)
-                        child.bind("<Button-4>", _on_inner_mousewheel)
-                        child.bind("<Button-5>", _on_inner_mousewheel)
-
-
-    inner_frame.update_idletasks()
-    if canvas.winfo_exists():
-        canvas.configure(scrollregion=canvas.bbox("all"))
-        canvas.yview_moveto(0)
-
-    return canvas, inner_frame, list_widgets
+        try:
+            self._drain_job = self.root.after(self.drain_interval_ms, self._drain)
+        except tk.TclError:
+            pass
 
 def handle_mouse_wheel_event(event, canvas):
     """Handles a mouse wheel event specifically for scrolling a given canvas"""
@@ -269,34 +446,227 @@ def remove_hover_effect(widget, original_bg, ignore_widgets=None):
         pass
 
     
-def load_image_cached(cache_dict, image_filename, folder_path, size, placeholder_image=None):
-    """Loads an image, resizes using thumbnail"""
-    if not image_filename or not folder_path:
-        return placeholder_image
-
-    cache_key = f"{folder_path}_{image_filename}_{size[0]}x{size[1]}"
-    if cache_key in cache_dict:
-        return cache_dict[cache_key]
-
-    full_path = os.path.join(folder_path, image_filename)
+class ImageCache:
+    """Shared LRU cache of resized PhotoImages, bounded by the decoded size of the images in bytes"""
+    ENTRY_OVERHEAD_BYTES = 256
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, revalidate_interval=2.0, decode_workers=4, drain_interval_ms=15,
+                 thumbnail_store=None):
+        """Constructor. thumbnail_store is an optional object whose load(path, size) returns an already resized PIL image"""
+        self.max_bytes = max_bytes
+        self.thumbnail_store = thumbnail_store
+        self.revalidate_interval = revalidate_interval
+        self.decode_workers = decode_workers
+        self.drain_interval_ms = drain_interval_ms
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # key -> [image or None, size in bytes, file mtime or None, last validation time]
+        self._entries = OrderedDict()
+        # key -> callbacks waiting for an image that is being decoded
+        self._pending = {}
+        self._decoded = queue.Queue()
+        self._drain_scheduled = False
+        # Root whose main loop runs the pending drain
+        self._drain_root = None
+        self._executor = None
+
+    def get(self, full_path, size):
+        """Returns (True, image) if the image is cached and still fresh, otherwise (False, None). image is None for missing files"""
+        key = (full_path, size[0], size[1])
+        entry = self._entries.get(key)
+        if entry is not None and self._is_fresh(key, entry):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+        return False, None
+
+    def load(self, full_path, size):
+        """Returns the cached PhotoImage of the file at that size, decoding it on a miss. Missing or broken files return None"""
+        found, photo_img = self.get(full_path, size)
+        if found:
+            return photo_img
 
-    if os.path.exists(full_path):
+        self.misses += 1
+        mtime, pil_img = self._decode_file(full_path, size)
+        return self._store_decoded((full_path, size[0], size[1]), pil_img, mtime)
+
+    def load_async(self, widget, full_path, size, on_ready):
+        """Returns (True, image) on a cache hit. On a miss decodes the file on a worker thread, then creates the PhotoImage on the main thread and calls on_ready(image)"""
+        found, photo_img = self.get(full_path, size)
+        if found:
+            return True, photo_img
+
+        key = (full_path, size[0], size[1])
+        waiting = self._pending.get(key)
+        if waiting is not None:
+            waiting.append(on_ready)
+            return False, None
+
+        self.misses += 1
+        self._pending[key] = [on_ready]
+        future = self._get_executor().submit(self._decode_file, full_path, size)
+        future.add_done_callback(lambda f, key=key: self._decoded.put((key, f)))
+        self._schedule_drain(widget.winfo_toplevel())
+        return False, None
+
+    def clear(self):
+        """Drops every cached image and forgets the decodes still in flight. Called when the window owning the images is destroyed"""
+        self._entries.clear()
+        self.current_bytes = 0
+        self._pending.clear()
+        self._decoded = queue.Queue()
+        self._drain_scheduled = False
+        self._drain_root = None
+
+    def stats(self):
+        """Returns the cache counters and memory usage"""
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
+
+    def _get_executor(self):
+        """Lazily starts the decoding thread pool"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.decode_workers, thread_name_prefix="image-decode")
+        return self._executor
+
+    def _decode_file(self, full_path, size):
+        """Reads and resizes a file. Runs on a worker thread and never touches Tk. Returns (mtime, PIL image or None)"""
+        mtime = self._file_mtime(full_path)
+        if mtime is None:
+            return None, None
+        if self.thumbnail_store is not None:
+            try:
+                return mtime, self.thumbnail_store.load(full_path, size)
+            except Exception as e:
+                print(f"Error reading thumbnail of '{full_path}', decoding the original: {e}")
         try:
-            img = Image.open(full_path)
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
-            img.thumbnail(size, Image.Resampling.LANCZOS)
-            photo_img = ImageTk.PhotoImage(img)
-            cache_dict[cache_key] = photo_img
-            return photo_img
+            return mtime, resize_image(full_path, size)
         except Exception as e:
             print(f"Error loading/processing image '{full_path}': {e}")
-            cache_dict[cache_key] = placeholder_image
-            return placeholder_image
-    else:
-        cache_dict[cache_key] = placeholder_image 
+            return mtime, None
+
+    def _store_decoded(self, key, pil_img, mtime):
+        """Creates the PhotoImage of a decoded image on the main thread and caches it"""
+        photo_img = None
+        if pil_img is not None:
+            try:
+                photo_img = ImageTk.PhotoImage(pil_img)
+            except Exception as e:
+                print(f"Error creating image for '{key[0]}': {e}")
+        self._store(key, photo_img, mtime)
+        return photo_img
+
+    def _schedule_drain(self, root):
+        """Makes sure the main loop picks up finished decodes soon"""
+        # A drain scheduled on another root never runs once that root is destroyed, so this root takes over
+        if self._drain_scheduled and root is self._drain_root:
+            return
+        try:
+            root.after(self.drain_interval_ms, self._drain, root)
+            self._drain_scheduled = True
+            self._drain_root = root
+        except tk.TclError:
+            self._pending.clear()
+            self._drain_scheduled = False
+            self._drain_root = None
+
+    def _drain(self, root):
+        """Turns the finished decodes into PhotoImages and hands them to the rows waiting for them"""
+        if root is not self._drain_root:
+            return
+        self._drain_scheduled = False
+        while True:
+            try:
+                key, future = self._decoded.get_nowait()
+            except queue.Empty:
+                break
+            waiting = self._pending.pop(key, None)
+            if waiting is None:
+                continue
+            mtime, pil_img = future.result()
+            photo_img = self._store_decoded(key, pil_img, mtime)
+            for on_ready in waiting:
+                try:
+                    on_ready(photo_img)
+                except tk.TclError:
+                    pass
+
+        if self._pending:
+            self._schedule_drain(root)
+
+    def _is_fresh(self, key, entry):
+        """Checks at most once per revalidate_interval whether the file changed, appeared or disappeared on disk"""
+        now = time.monotonic()
+        if now - entry[3] < self.revalidate_interval:
+            return True
+        entry[3] = now
+        if self._file_mtime(key[0]) == entry[2]:
+            return True
+        self._remove(key)
+        self.invalidations += 1
+        return False
+
+    def _store(self, key, photo_img, mtime):
+        """Adds an entry and evicts the least recently used ones until the cache fits its budget"""
+        self._remove(key)
+        nbytes = self.ENTRY_OVERHEAD_BYTES
+        if photo_img is not None:
+            nbytes += photo_img.width() * photo_img.height() * 4
+        self._entries[key] = [photo_img, nbytes, mtime, time.monotonic()]
+        self.current_bytes += nbytes
+
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted[1]
+            self.evictions += 1
+
+    def _remove(self, key):
+        """Removes an entry if it is cached"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry[1]
+
+    @staticmethod
+    def _file_mtime(full_path):
+        """Returns the modification time of the file, or None if it does not exist"""
+        try:
+            return os.stat(full_path).st_mtime_ns
+        except OSError:
+            return None
+
+shared_image_cache = ImageCache()
+
+def load_image_cached(cache, image_filename, folder_path, size, placeholder_image=None):
+    """Loads an image through an ImageCache, resizes using thumbnail. Returns placeholder_image if the file is missing or broken"""
+    if not image_filename or not folder_path:
+        return placeholder_image
+
+    photo_img = cache.load(os.path.join(folder_path, image_filename), size)
+    return photo_img if photo_img is not None else placeholder_image
+
+def load_image_async(cache, widget, image_filename, folder_path, size, on_ready, placeholder_image=None):
+    """Returns the cached image, or placeholder_image while the file is decoded in the background. on_ready(image) is then called on the main thread"""
+    if not image_filename or not folder_path:
         return placeholder_image
 
+    found, photo_img = cache.load_async(
+        widget, os.path.join(folder_path, image_filename), size,
+        lambda img: on_ready(img if img is not None else placeholder_image)
+    )
+    if found and photo_img is not None:
+        return photo_img
+    return placeholder_image
+
 def format_price_display(price_value):
     """Formats a price value for display"""
     if price_value is None:
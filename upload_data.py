@@ -1,12 +1,14 @@
-import bcrypt
+import argparse
 import decimal
 import random
 import datetime
-import timedelta
+import psycopg2.sql as sql
 
-from database_manager import DatabaseManager
+from database_manager import DatabaseManager, hash_password
+from app_logging import setup_logging_from_config
 
-db_manager = DatabaseManager()
+# Created in __main__ from --config, so only the chosen database is connected
+db_manager = None
 
 def main():
     print("-------------------------")
@@ -44,82 +46,85 @@ def main():
         if command == 1:
             users_data = [
                 # --- Terraria --- #
-                ("Redigit", "redigit@gmail.com", hash_password("Redigit"), "2009-06-17", False), # have special rights in the game page
-                ("Cenx", "Cenx@gmail.com", hash_password("Cenx"), "2013-08-05", False), # have special rights in the game page
-                ("Loki", "Loki@gmail.com", hash_password("Loki"), "2012-07-02", False),
-                ("FoodBarbarian", "FoodBarbarian@gmail.com", hash_password("FoodBarbarian"), "2014-09-03", False),
+                ("Redigit", "redigit@gmail.com", "Redigit", "2009-06-17", False), # have special rights in the game page
+                ("Cenx", "Cenx@gmail.com", "Cenx", "2013-08-05", False), # have special rights in the game page
+                ("Loki", "Loki@gmail.com", "Loki", "2012-07-02", False),
+                ("FoodBarbarian", "FoodBarbarian@gmail.com", "FoodBarbarian", "2014-09-03", False),
                 
                 # --- Don't Starve Together  --- #
-                ("MatthewMarteinsson", "MatthewMarteinsson@gmail.com", hash_password("MatthewMarteinsson"), "2011-03-26", False), # have special rights in the oxygen not included page
-                ("BryceDoig", "BryceDoig@gmail.com", hash_password("BryceDoig"), "2013-05-11", False), # have special rights in the don't starve together page
-                ("AlexSavin", "AlexSavin@gmail.com", hash_password("AlexSavin"), "2014-03-21", False),
+                ("MatthewMarteinsson", "MatthewMarteinsson@gmail.com", "MatthewMarteinsson", "2011-03-26", False), # have special rights in the oxygen not included page
+                ("BryceDoig", "BryceDoig@gmail.com", "BryceDoig", "2013-05-11", False), # have special rights in the don't starve together page
+                ("AlexSavin", "AlexSavin@gmail.com", "AlexSavin", "2014-03-21", False),
                 
                 # --- Astroneer --- #
-                ("AaronBiddlecom", "AaronBiddlecom@gmail.com", hash_password("AaronBiddlecom"), "2011-11-01", False),
-                ("AdamBromell", "AdamBromell@gmail.com", hash_password("AdamBromell"), "2012-12-16", False),
-                ("AndreMaguire", "AndreMaguire@gmail.com", hash_password("AndreMaguire"), "2011-09-28", False),
+                ("AaronBiddlecom", "AaronBiddlecom@gmail.com", "AaronBiddlecom", "2011-11-01", False),
+                ("AdamBromell", "AdamBromell@gmail.com", "AdamBromell", "2012-12-16", False),
+                ("AndreMaguire", "AndreMaguire@gmail.com", "AndreMaguire", "2011-09-28", False),
                 
                 # --- Factorio --- #
-                ("MichalKovarik", "MichalKovarik@gmail.com", hash_password("MichalKovarik"), "2012-02-09", False),
-                ("Tomax", "Tomax@gmail.com", hash_password("Tomax"), "2013-05-30", False), # have special rights in the game page
-                ("DanStevens", "DanStevens@gmail.com", hash_password("DanStevens"), "2014-01-07", False),
+                ("MichalKovarik", "MichalKovarik@gmail.com", "MichalKovarik", "2012-02-09", False),
+                ("Tomax", "Tomax@gmail.com", "Tomax", "2013-05-30", False), # have special rights in the game page
+                ("DanStevens", "DanStevens@gmail.com", "DanStevens", "2014-01-07", False),
                 
                 # --- Stardew Valley --- #
-                ("EricBarone", "EricBarone@gmail.com", hash_password("EricBarone"), "2015-02-15", False), # have special rights in the game page
+                ("EricBarone", "EricBarone@gmail.com", "EricBarone", "2015-02-15", False), # have special rights in the game page
                 
                 # --- Sid Meier's Civilization VI --- #
-                ("EdBeach", "EdBeach@gmail.com", hash_password("EdBeach"), "2010-08-09", False),
-                ("DennisShirk", "DennisShirk@gmail.com", hash_password("DennisShirk"), "2010-09-14", False), # have special rights in the game page
-                ("AndrewFrederiksen", "AndrewFrederiksen@gmail.com", hash_password("AndrewFrederiksen"), "2010-09-21", False),
+                ("EdBeach", "EdBeach@gmail.com", "EdBeach", "2010-08-09", False),
+                ("DennisShirk", "DennisShirk@gmail.com", "DennisShirk", "2010-09-14", False), # have special rights in the game page
+                ("AndrewFrederiksen", "AndrewFrederiksen@gmail.com", "AndrewFrederiksen", "2010-09-21", False),
                 
-                ("ChristophHartmann", "ChristophHartmann@gmail.com", hash_password("ChristophHartmann"), "2008-04-12", False),
-                ("JohnChowanec", "JohnChowanec@gmail.com", hash_password("JohnChowanec"), "2008-05-03", False),
-                ("MelissaMiller", "MelissaMiller@gmail.com", hash_password("MelissaMiller"), "2008-07-06", False),
+                ("ChristophHartmann", "ChristophHartmann@gmail.com", "ChristophHartmann", "2008-04-12", False),
+                ("JohnChowanec", "JohnChowanec@gmail.com", "JohnChowanec", "2008-05-03", False),
+                ("MelissaMiller", "MelissaMiller@gmail.com", "MelissaMiller", "2008-07-06", False),
             
                 # --- Marvel Rivals --- #
-                ("ThaddeusSasser", "ThaddeusSasser@gmail.com", hash_password("ThaddeusSasser"), "2013-05-15", False),
-                ("James", "James@gmail.com", hash_password("James"), "2017-07-05", False), # have special rights in the game page
-                ("GuangyunChen", "GuangyunChen@gmail.com", hash_password("GuangyunChen"), "2018-10-29", False),
+                ("ThaddeusSasser", "ThaddeusSasser@gmail.com", "ThaddeusSasser", "2013-05-15", False),
+                ("James", "James@gmail.com", "James", "2017-07-05", False), # have special rights in the game page
+                ("GuangyunChen", "GuangyunChen@gmail.com", "GuangyunChen", "2018-10-29", False),
                 
                 # --- Hades II --- #
-                ("WillTurnbull", "WillTurnbull@gmail.com", hash_password("WillTurnbull"), "2015-01-19", False), # have special rights in the game page
-                ("AmirRao", "AmirRao@gmail.com", hash_password("AmirRao"), "2015-04-02", False),
-                ("GregKasavin", "GregKasavin@gmail.com", hash_password("GregKasavin"), "2016-01-04", False),
+                ("WillTurnbull", "WillTurnbull@gmail.com", "WillTurnbull", "2015-01-19", False), # have special rights in the game page
+                ("AmirRao", "AmirRao@gmail.com", "AmirRao", "2015-04-02", False),
+                ("GregKasavin", "GregKasavin@gmail.com", "GregKasavin", "2016-01-04", False),
                 
                 # --- Project Odyssey --- #
-                ("DanHay", "DanHay@gmail.com", hash_password("DanHay"), "2011-01-10", False),
-                ("RimaBrek", "RimaBrek@gmail.com", hash_password("RimaBrek"), "2011-03-14", False), # have special rights in the game page
-                ("ClementMarcou", "ClementMarcou@gmail.com", hash_password("ClementMarcou"), "2011-05-09", False),
+                ("DanHay", "DanHay@gmail.com", "DanHay", "2011-01-10", False),
+                ("RimaBrek", "RimaBrek@gmail.com", "RimaBrek", "2011-03-14", False), # have special rights in the game page
+                ("ClementMarcou", "ClementMarcou@gmail.com", "ClementMarcou", "2011-05-09", False),
                 
                 # --- The Elder Scrolls VI --- #
-                ("CraigLafferty", "CraigLafferty@gmail.com", hash_password("CraigLafferty"), "2009-10-24", False),
-                ("MarkLampert", "MarkLampert@gmail.com", hash_password("MarkLampert"), "2008-09-11", False),
-                ("AshleyCheng", "AshleyCheng@gmail.com", hash_password("AshleyCheng"), "2010-12-27", False),
+                ("CraigLafferty", "CraigLafferty@gmail.com", "CraigLafferty", "2009-10-24", False),
+                ("MarkLampert", "MarkLampert@gmail.com", "MarkLampert", "2008-09-11", False),
+                ("AshleyCheng", "AshleyCheng@gmail.com", "AshleyCheng", "2010-12-27", False),
                 
                 # --- Star citizen --- #
-                ("ChrisRoberts", "ChrisRoberts@gmail.com", hash_password("ChrisRoberts"), "2014-06-13", False),
-                ("PedroCamacho", "PedroCamacho@gmail.com", hash_password("PedroCamacho"), "2015-02-18", False), # have special rights in the game page
+                ("ChrisRoberts", "ChrisRoberts@gmail.com", "ChrisRoberts", "2014-06-13", False),
+                ("PedroCamacho", "PedroCamacho@gmail.com", "PedroCamacho", "2015-02-18", False), # have special rights in the game page
                 
                 # --- Deep down --- #
-                ("KenzoTsujimoto", "KenzoTsujimoto@gmail.com", hash_password("KenzoTsujimoto"), "2009-01-09", False), # have special rights in the game page
-                ("TokuroFujiwara", "TokuroFujiwara@gmail.com", hash_password("TokuroFujiwara"), "2010-08-07", False),
+                ("KenzoTsujimoto", "KenzoTsujimoto@gmail.com", "KenzoTsujimoto", "2009-01-09", False), # have special rights in the game page
+                ("TokuroFujiwara", "TokuroFujiwara@gmail.com", "TokuroFujiwara", "2010-08-07", False),
                 
                 # --- Hearts of Iron IV --- #
-                ("JohanAndersson", "JohanAndersson@gmail.com", hash_password("JohanAndersson"), "2015-03-04", False),
-                ("DanLind", "DanLind@gmail.com", hash_password("DanLind"), "2015-06-05", False), # have special rights in the game page
-                ("LindaKiby", "LindaKiby@gmail.com", hash_password("LindaKiby"), "2014-03-12", False),
+                ("JohanAndersson", "JohanAndersson@gmail.com", "JohanAndersson", "2015-03-04", False),
+                ("DanLind", "DanLind@gmail.com", "DanLind", "2015-06-05", False), # have special rights in the game page
+                ("LindaKiby", "LindaKiby@gmail.com", "LindaKiby", "2014-03-12", False),
                 
                 # --- Geometry Dash --- #
-                ("RobTop", "RobTop@gmail.com", hash_password("RobTop"), "2011-04-18", False), # have special rights in the game page
+                ("RobTop", "RobTop@gmail.com", "RobTop", "2011-04-18", False), # have special rights in the game page
                 
                 # --- Admin --- #
-                ("Admin", "Admin@gmail.com", hash_password("Admin"), "2006-03-27", True),
+                ("Admin", "Admin@gmail.com", "Admin", "2006-03-27", True),
             ]
             
+            print("--- Hashing Passwords ---")
+            password_hashes = db_manager.hash_passwords(password for _, _, password, _, _ in users_data)
+            users_data = [(username, email, password_hash, registration_date, is_app_admin)
+                          for (username, email, _, registration_date, is_app_admin), password_hash in zip(users_data, password_hashes)]
+
             print("--- Inserting Users Data ---")
-            insert_query = "INSERT INTO Users (username, email, password_hash, registration_date, is_app_admin) VALUES (%s, %s, %s, %s, %s);"
-            
-            db_manager.execute_many_query(insert_query, users_data)
+            db_manager.copy_rows("users", ("username", "email", "password_hash", "registration_date", "is_app_admin"), users_data)
             
             print("--- The Data is Successfully Inserted ---")
             break
@@ -172,9 +177,7 @@ def main():
             ]
             
             print("--- Inserting Studios Data ---")
-            insert_query = "INSERT INTO Studios (name, website_url, logo, country, description, established_date) VALUES (%s, %s, %s, %s, %s, %s);"
-            
-            db_manager.execute_many_query(insert_query, studios_data)
+            db_manager.copy_rows("studios", ("name", "website_url", "logo", "country", "description", "established_date"), studios_data)
             
             print("--- The Data is Successfully Inserted ---")
             break
@@ -251,9 +254,7 @@ def main():
             ]
             
             print("--- Inserting Developers Data ---")
-            insert_query = "INSERT INTO Developers (user_id, studio_id, contact_email, role) VALUES (%s, %s, %s, %s);"
-            
-            db_manager.execute_many_query(insert_query, developers_data)
+            db_manager.copy_rows("developers", ("user_id", "studio_id", "contact_email", "role"), developers_data)
             
             print("--- The Data is Successfully Inserted ---")
             break;
@@ -306,9 +307,7 @@ def main():
             ]
             
             print("--- Inserting Games Data ---")
-            insert_query = "INSERT INTO Games (title, description, price, release_date, image, status, created_at, updated_at) VALUES (%s, %s, %s, %s, %s, %s, %s, %s);"
-            
-            db_manager.execute_many_query(insert_query, games_data)
+            db_manager.copy_rows("games", ("title", "description", "price", "release_date", "image", "status", "created_at", "updated_at"), games_data)
             
             print("--- The Data is Successfully Inserted ---")
             break;
@@ -325,8 +324,7 @@ def main():
             genres_data = [(name,) for name in genre_names]
             
             print("--- Inserting Genres Data ---")
-            insert_query = "INSERT INTO Genres (name) VALUES (%s);"
-            db_manager.execute_many_query(insert_query, genres_data)
+            db_manager.copy_rows("genres", ("name",), genres_data)
             break
         
         elif command == 6:
@@ -337,8 +335,7 @@ def main():
             platforms_data = [(name,) for name in platform_names]
             
             print("--- Inserting Platforms Data ---")
-            insert_query = "INSERT INTO Platforms (name) VALUES (%s);"
-            db_manager.execute_many_query(insert_query, platforms_data)
+            db_manager.copy_rows("platforms", ("name",), platforms_data)
             break
         
         elif command == 7:
@@ -351,8 +348,7 @@ def main():
             ]
             
             print("--- Inserting Game_Genres Data ---")
-            insert_query = "INSERT INTO Game_Genres (game_id, genre_id) VALUES (%s, %s);"
-            db_manager.execute_many_query(insert_query, game_genres)
+            db_manager.copy_rows("game_genres", ("game_id", "genre_id"), game_genres)
             break
         
         elif command == 8:
@@ -362,8 +358,7 @@ def main():
             ]
             
             print("--- Inserting Game_Platforms Data ---")
-            insert_query = "INSERT INTO Game_Platforms (game_id, platform_id) VALUES (%s, %s);"
-            db_manager.execute_many_query(insert_query, game_platforms)
+            db_manager.copy_rows("game_platforms", ("game_id", "platform_id"), game_platforms)
             break
         
         elif command == 9:
@@ -373,8 +368,7 @@ def main():
             ]
             
             print("--- Inserting Developers_Games Data ---")
-            insert_query = "INSERT INTO Developers_Games (developer_id, game_id) VALUES (%s, %s);"
-            db_manager.execute_many_query(insert_query, developer_games)
+            db_manager.copy_rows("developers_games", ("developer_id", "game_id"), developer_games)
             break
             
         elif command == 10:
@@ -387,8 +381,7 @@ def main():
             ]
             
             print("--- Inserting Game_Studios Data ---")
-            insert_query = "INSERT INTO Game_Studios (game_id, studio_id, role) VALUES (%s, %s, %s);"
-            db_manager.execute_many_query(insert_query, game_studios)
+            db_manager.copy_rows("game_studios", ("game_id", "studio_id", "role"), game_studios)
             break
             
         elif command == 11:
@@ -413,8 +406,7 @@ def main():
             ]
 
             print("--- Inserting Reviews ---")
-            insert_query = "INSERT INTO Reviews (user_id, game_id, review_text, review_date) VALUES (%s, %s, %s, %s) RETURNING review_id;"
-            db_manager.execute_many_query(insert_query, reviews)
+            db_manager.copy_rows("reviews", ("user_id", "game_id", "review_text", "review_date"), reviews)
             
             comments_on_review = [
                 (7, 7, "Spot on! Great observation.", "2025-05-10 08:32:47"),
@@ -435,8 +427,7 @@ def main():
             ]
             
             print("--- Inserting Comments ---")
-            insert_query = "INSERT INTO ReviewComments (review_id, user_id, comment_text, comment_date) VALUES (%s, %s, %s, %s);"
-            db_manager.execute_many_query(insert_query, comments_on_review)
+            db_manager.copy_rows("reviewcomments", ("review_id", "user_id", "comment_text", "comment_date"), comments_on_review)
             break;
         
         elif command == 12:
@@ -459,8 +450,7 @@ def main():
             ]
             
             print("--- Inserting Purchase ---")
-            insert_query = "INSERT INTO Purchases (user_id, purchase_date, total_amount, status) VALUES (%s, %s, %s, %s);"
-            db_manager.execute_many_query(insert_query, purchases)
+            db_manager.copy_rows("purchases", ("user_id", "purchase_date", "total_amount", "status"), purchases)
             
             purchases_items = [
                 (1, 1, 225.00),
@@ -481,8 +471,7 @@ def main():
             ]
             
             print("--- Inserting Purchase Items ---")
-            insert_query = "INSERT INTO Purchases_Items (purchase_id, game_id, price_at_purchase) VALUES (%s, %s, %s);"
-            db_manager.execute_many_query(insert_query, purchases_items)
+            db_manager.copy_rows("purchases_items", ("purchase_id", "game_id", "price_at_purchase"), purchases_items)
             
             break
         
@@ -532,8 +521,7 @@ def main():
                 (40, 15, "2024-11-19 12:05:18", "Accepted", 41, "2024-11-17 12:06:18"),
             ]
 
-            insert_query = "INSERT INTO StudioApplications (user_id, studio_id, application_date, status, reviewed_by, review_date) VALUES (%s, %s, %s, %s, %s, %s);"
-            db_manager.execute_many_query(insert_query, studio_applications)
+            db_manager.copy_rows("studioapplications", ("user_id", "studio_id", "application_date", "status", "reviewed_by", "review_date"), studio_applications)
             print("--- Studio Applications Data Insertion Attempt Complete ---")
             break
         
@@ -583,8 +571,7 @@ def main():
                 (40, 40, "developer_status_request", "RobTop@gmail.com", "approved", "2024-06-11 14:11:48", 41, "2024-06-16 14:12:48"),
             ]
             
-            insert_query = "INSERT INTO AdminNotifications (user_id, target_user_id, notification_type, message, status, created_at, reviewed_by_admin_id, reviewed_at) VALUES (%s, %s, %s, %s, %s, %s, %s, %s);"
-            db_manager.execute_many_query(insert_query, admin_notifications)
+            db_manager.copy_rows("adminnotifications", ("user_id", "target_user_id", "notification_type", "message", "status", "created_at", "reviewed_by_admin_id", "reviewed_at"), admin_notifications)
             print("--- Admin Notifications Data Insertion Attempt Complete ---")
             
             break
@@ -645,12 +632,294 @@ def main():
         else:
             print("You've wrote an unexisting command! Try again: ", end="")    
             
-    
-def hash_password(password):
-    password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
-    hased = bcrypt.hashpw(password_bytes, salt)
-    return hased.decode()
 
+# --- Synthetic data generator --- #
+
+GENERATED_PASSWORD = "Generated1"
+GENERATION_END = datetime.datetime(2025, 5, 15, 12, 0, 0)
+
+BASE_SIZES = {
+    'users': 1000,
+    'studios': 25,
+    'games': 200,
+}
+REVIEW_PROBABILITY = 0.15
+MAX_PURCHASES_PER_USER = 200
+
+GENERATED_GENRES = ["Sandbox", "Adventure", "RPG", "Survival", "Indie", "Simulation", "Strategy", "Shooter", "Action", "Platformer"]
+GENERATED_PLATFORMS = ["PC", "macOS", "Linux", "Mobile"]
+GAME_TITLE_WORDS = ["Star", "Shadow", "Iron", "Lost", "Crystal", "Void", "Ember", "Frost", "Ancient", "Neon", "Silent", "Wild"]
+GAME_TITLE_NOUNS = ["Odyssey", "Legacy", "Frontier", "Kingdom", "Colony", "Dungeon", "Valley", "Empire", "Outpost", "Saga"]
+STUDIO_COUNTRIES = ["USA", "Canada", "Japan", "Sweden", "Poland", "Ukraine", "France", "Germany", "United Kingdom"]
+GAME_PRICES = [0.00, 99.00, 149.00, 199.00, 229.00, 299.00, 449.00, 599.00, 999.00]
+GAME_STATUSES = ['Released', 'Early Access', 'Beta', 'Alpha', 'Development', 'On Hold', 'Cancelled']
+GAME_STATUS_WEIGHTS = [70, 12, 5, 4, 5, 2, 2]
+PURCHASE_STATUSES = ['Completed', 'Refunded', 'Failed', 'Cancelled', 'Pending']
+PURCHASE_STATUS_WEIGHTS = [90, 3, 3, 2, 2]
+REVIEW_TEXTS = [
+    "Absolutely fantastic game! The atmosphere and gameplay are top-notch.",
+    "Pretty good, but I expected a bit more. There's room for improvement.",
+    "Hooked from the first few minutes. Hours just fly by!",
+    "Technical issues really spoil the experience. Needs patching ASAP.",
+    "Worth every penny. Lots of content and replayability.",
+    "Unfortunately, it didn't live up to my expectations at all.",
+]
+COMMENT_TEXTS = [
+    "Spot on! Great observation.",
+    "You might be right about that.",
+    "Couldn't agree more!",
+    "Well, I have a different opinion on this.",
+    "Thanks for the detailed review!",
+]
+
+def zipf_cum_weights(count, exponent=1.1):
+    """Cumulative Zipf weights for ranks 1..count, so a few items get most of the picks"""
+    cum_weights = []
+    total = 0.0
+    for rank in range(1, count + 1):
+        total += 1.0 / rank ** exponent
+        cum_weights.append(total)
+    return cum_weights
+
+def random_datetime(rng, start, end=GENERATION_END):
+    """Returns a random moment between start and end"""
+    span = max(1, int((end - start).total_seconds()))
+    return start + datetime.timedelta(seconds=rng.randrange(span))
+
+def user_registration_date(seed, user_id):
+    """Registration date of a generated user. Derived from the seed and the id, so every pass over the users agrees on it"""
+    rng = random.Random(f"{seed}-user-{user_id}")
+    return random_datetime(rng, GENERATION_END - datetime.timedelta(days=3650))
+
+def next_id(table, column):
+    """Returns the first id after the rows already stored in the table"""
+    query = sql.SQL("SELECT COALESCE(MAX({}), 0) + 1 FROM {};").format(sql.Identifier(column), sql.Identifier(table))
+    row = db_manager.execute_query(query, fetch_one=True)
+    return row[0] if row else 1
+
+def sync_sequence(table, column):
+    """Moves the SERIAL sequence of the column past the explicitly inserted ids"""
+    query = sql.SQL("SELECT setval(pg_get_serial_sequence(%s, %s), (SELECT COALESCE(MAX({}), 0) + 1 FROM {}), false);").format(
+        sql.Identifier(column), sql.Identifier(table))
+    db_manager.execute_query(query, (table, column), fetch_one=True)
+
+def ensure_names(table, id_column, names):
+    """Inserts the missing names into a lookup table (Genres, Platforms) and returns all of its ids"""
+    insert_query = sql.SQL("INSERT INTO {} (name) VALUES %s ON CONFLICT (name) DO NOTHING;").format(sql.Identifier(table))
+    db_manager.execute_values_query(insert_query, [(name,) for name in names])
+    select_query = sql.SQL("SELECT {} FROM {} ORDER BY {};").format(sql.Identifier(id_column), sql.Identifier(table), sql.Identifier(id_column))
+    return [row[0] for row in db_manager.execute_query(select_query, fetch_all=True) or []]
+
+def iter_user_activity(seed, first_user_id, user_count, popular_game_ids, game_cum_weights, game_prices,
+                       first_purchase_id, first_review_id):
+    """Yields (purchases, purchase_items, reviews, comments) per generated user. Each user has its own seeded generator, so the activity can be replayed for every table instead of kept in memory"""
+    purchase_id = first_purchase_id
+    review_id = first_review_id
+
+    for user_id in range(first_user_id, first_user_id + user_count):
+        rng = random.Random(f"{seed}-activity-{user_id}")
+        registration_date = user_registration_date(seed, user_id)
+        purchases, items, reviews, comments = [], [], [], []
+        owned_games = set()
+
+        # Pareto-distributed basket count: most users buy a couple of games, a few buy hundreds
+        purchase_count = min(int(rng.paretovariate(1.2)) - 1, MAX_PURCHASES_PER_USER)
+        for _ in range(purchase_count):
+            basket_size = rng.choice((1, 1, 1, 1, 2, 2, 3))
+            basket = set(rng.choices(popular_game_ids, cum_weights=game_cum_weights, k=basket_size)) - owned_games
+            if not basket:
+                continue
+
+            status = rng.choices(PURCHASE_STATUSES, weights=PURCHASE_STATUS_WEIGHTS)[0]
+            purchase_date = random_datetime(rng, registration_date)
+            total_amount = sum(game_prices[game_id] for game_id in basket)
+            purchases.append((purchase_id, user_id, purchase_date, total_amount, status))
+            items.extend((purchase_id, game_id, game_prices[game_id]) for game_id in sorted(basket))
+            if status == 'Completed':
+                owned_games |= basket
+            purchase_id += 1
+
+        for game_id in sorted(owned_games):
+            if rng.random() >= REVIEW_PROBABILITY:
+                continue
+            review_date = random_datetime(rng, registration_date)
+            reviews.append((review_id, user_id, game_id, rng.choice(REVIEW_TEXTS), review_date))
+            for _ in range(int(rng.paretovariate(1.5)) - 1):
+                commenter_id = rng.randrange(first_user_id, first_user_id + user_count)
+                comments.append((review_id, commenter_id, rng.choice(COMMENT_TEXTS), random_datetime(rng, review_date)))
+            review_id += 1
+
+        yield purchases, items, reviews, comments
+
+def generate_data(scale=1.0, seed=42):
+    """Appends a synthetic data set (users, studios, developers, games, skewed purchases, reviews and comments) to the database"""
+    rng = random.Random(seed)
+    user_count = max(1, int(BASE_SIZES['users'] * scale))
+    studio_count = max(1, int(BASE_SIZES['studios'] * scale))
+    game_count = max(1, int(BASE_SIZES['games'] * scale))
+    print(f"--- Generating data: scale {scale}, seed {seed} ({user_count} users, {studio_count} studios, {game_count} games) ---")
+
+    first_user_id = next_id('users', 'user_id')
+    first_studio_id = next_id('studios', 'studio_id')
+    first_developer_id = next_id('developers', 'developer_id')
+    first_game_id = next_id('games', 'game_id')
+    first_purchase_id = next_id('purchases', 'purchase_id')
+    first_review_id = next_id('reviews', 'review_id')
+
+    # bcrypt is deliberately slow, so every generated user shares one hash
+    password_hash = hash_password(GENERATED_PASSWORD, db_manager.password_rounds)
+    print(f"Generated users log in with the password '{GENERATED_PASSWORD}'")
+
+    genre_ids = ensure_names('genres', 'genre_id', GENERATED_GENRES)
+    platform_ids = ensure_names('platforms', 'platform_id', GENERATED_PLATFORMS)
+
+    user_ids = range(first_user_id, first_user_id + user_count)
+    studio_ids = list(range(first_studio_id, first_studio_id + studio_count))
+    game_ids = list(range(first_game_id, first_game_id + game_count))
+
+    print("--- Inserting Users ---")
+    users = ((user_id, f"player{user_id}", f"player{user_id}@example.com", password_hash,
+              user_registration_date(seed, user_id), False) for user_id in user_ids)
+    db_manager.copy_rows("users", ("user_id", "username", "email", "password_hash", "registration_date", "is_app_admin"), users)
+
+    print("--- Inserting Studios ---")
+    studios = [(studio_id, f"Generated Studio {studio_id}", f"https://studio{studio_id}.example.com", "placeholder.png",
+                rng.choice(STUDIO_COUNTRIES), "A studio created by the data generator.",
+                random_datetime(rng, datetime.datetime(1980, 1, 1)).date()) for studio_id in studio_ids]
+    db_manager.copy_rows("studios", ("studio_id", "name", "website_url", "logo", "country", "description", "established_date"), studios)
+
+    print("--- Inserting Developers ---")
+    developers = []
+    studio_admins = {}
+    developer_user_ids = iter(user_ids)
+    developer_id = first_developer_id
+    for studio_id in studio_ids:
+        for member_index in range(1 + rng.randrange(4)):
+            user_id = next(developer_user_ids, None)
+            if user_id is None:
+                break
+            role = 'Admin' if member_index == 0 else 'Member'
+            developers.append((developer_id, user_id, studio_id, role))
+            if role == 'Admin':
+                studio_admins[studio_id] = developer_id
+            developer_id += 1
+    db_manager.copy_rows("developers", ("developer_id", "user_id", "studio_id", "role"), developers)
+
+    print("--- Inserting Games ---")
+    game_prices = {}
+    games = []
+    for game_id in game_ids:
+        status = rng.choices(GAME_STATUSES, weights=GAME_STATUS_WEIGHTS)[0]
+        price = None if status in ('Development', 'Cancelled') else decimal.Decimal(f"{rng.choice(GAME_PRICES):.2f}")
+        game_prices[game_id] = price if price is not None else decimal.Decimal("0.00")
+        release_date = random_datetime(rng, datetime.datetime(2005, 1, 1)).date() if status != 'Development' else None
+        title = f"{rng.choice(GAME_TITLE_WORDS)} {rng.choice(GAME_TITLE_NOUNS)} {game_id}"
+        games.append((game_id, title, f"Synthetic description of {title}.", price, release_date, "placeholder.png", status))
+    db_manager.copy_rows("games", ("game_id", "title", "description", "price", "release_date", "image", "status"), games)
+
+    print("--- Inserting Game Links ---")
+    studio_cum_weights = zipf_cum_weights(len(studio_ids), exponent=0.8)
+    game_studios, developer_games, game_genres, game_platforms = [], [], [], []
+    for game_id in game_ids:
+        developer_studio_id = rng.choices(studio_ids, cum_weights=studio_cum_weights)[0]
+        game_studios.append((game_id, developer_studio_id, 'Developer'))
+        if rng.random() < 0.4:
+            game_studios.append((game_id, rng.choice(studio_ids), 'Publisher'))
+        if developer_studio_id in studio_admins:
+            developer_games.append((studio_admins[developer_studio_id], game_id))
+        game_genres.extend((game_id, genre_id) for genre_id in rng.sample(genre_ids, min(len(genre_ids), rng.randint(1, 3))))
+        game_platforms.extend((game_id, platform_id) for platform_id in rng.sample(platform_ids, min(len(platform_ids), rng.randint(1, 3))))
+    db_manager.copy_rows("game_studios", ("game_id", "studio_id", "role"), game_studios)
+    db_manager.copy_rows("developers_games", ("developer_id", "game_id"), developer_games)
+    db_manager.copy_rows("game_genres", ("game_id", "genre_id"), game_genres)
+    db_manager.copy_rows("game_platforms", ("game_id", "platform_id"), game_platforms)
+
+    # Game popularity follows Zipf's law over a shuffled ranking, so the bestsellers are spread over the id range
+    popular_game_ids = game_ids[:]
+    rng.shuffle(popular_game_ids)
+    game_cum_weights = zipf_cum_weights(len(popular_game_ids))
+
+    def activity():
+        return iter_user_activity(seed, first_user_id, user_count, popular_game_ids, game_cum_weights, game_prices,
+                                  first_purchase_id, first_review_id)
+
+    # The per-row counter triggers are replaced by one recomputation after the load
+    set_purchase_counter_triggers(False)
+    try:
+        print("--- Inserting Purchases ---")
+        db_manager.copy_rows("purchases", ("purchase_id", "user_id", "purchase_date", "total_amount", "status"),
+                             (row for purchases, _, _, _ in activity() for row in purchases))
+
+        print("--- Inserting Purchase Items ---")
+        db_manager.copy_rows("purchases_items", ("purchase_id", "game_id", "price_at_purchase"),
+                             (row for _, items, _, _ in activity() for row in items))
+    finally:
+        set_purchase_counter_triggers(True)
+
+    print("--- Refreshing Purchase Counters ---")
+    db_manager.execute_query("SELECT refresh_game_purchase_counts();", fetch_one=True)
+    db_manager.execute_query("SELECT refresh_user_purchase_stats();", fetch_one=True)
+
+    print("--- Inserting Reviews ---")
+    db_manager.copy_rows("reviews", ("review_id", "user_id", "game_id", "review_text", "review_date"),
+                         (row for _, _, reviews, _ in activity() for row in reviews))
+
+    print("--- Inserting Comments ---")
+    db_manager.copy_rows("reviewcomments", ("review_id", "user_id", "comment_text", "comment_date"),
+                         (row for _, _, _, comments in activity() for row in comments))
+
+    for table, column in (('users', 'user_id'), ('studios', 'studio_id'), ('developers', 'developer_id'),
+                          ('games', 'game_id'), ('purchases', 'purchase_id'), ('reviews', 'review_id')):
+        sync_sequence(table, column)
+
+    db_manager.execute_query("ANALYZE;")
+    print("--- The Generated Data is Successfully Inserted ---")
+
+def set_change_notify_triggers(enabled):
+    """Enables or disables the per-row change notifications, so a bulk load does not flood listening clients"""
+    action = "ENABLE" if enabled else "DISABLE"
+    for table in ('games', 'users', 'reviews', 'reviewcomments', 'game_genres', 'game_platforms',
+                  'game_studios', 'studios', 'genres', 'platforms'):
+        query = sql.SQL("ALTER TABLE {} " + action + " TRIGGER {};").format(sql.Identifier(table), sql.Identifier(f"{table}_notify_trigger"))
+        db_manager.execute_query(query)
+
+def set_parent_touch_triggers(enabled):
+    """Enables or disables the triggers that bump modified_at and modified_xid of users and studios on every developer and game studio row"""
+    action = "ENABLE" if enabled else "DISABLE"
+    for table, trigger in (('developers', 'developers_touch_parents_trigger'),
+                           ('game_studios', 'game_studios_touch_parents_trigger')):
+        query = sql.SQL("ALTER TABLE {} " + action + " TRIGGER {};").format(sql.Identifier(table), sql.Identifier(trigger))
+        db_manager.execute_query(query)
+
+def set_purchase_counter_triggers(enabled):
+    """Enables or disables the triggers maintaining purchase_count, owned_games_count and total_spent"""
+    action = "ENABLE" if enabled else "DISABLE"
+    for table, trigger in (('purchases_items', 'purchase_items_counter_trigger'),
+                           ('purchases', 'purchases_counter_insert_trigger'),
+                           ('purchases', 'purchases_counter_delete_trigger'),
+                           ('purchases', 'purchases_counter_update_trigger')):
+        query = sql.SQL("ALTER TABLE {} " + action + " TRIGGER {};").format(sql.Identifier(table), sql.Identifier(trigger))
+        db_manager.execute_query(query)
+    
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Loads test data into the game store database")
+    parser.add_argument('--generate', action='store_true', help="Generate a synthetic data set instead of opening the interactive menu")
+    parser.add_argument('--scale', type=float, default=1.0, help="Data set size; 1 means 1000 users, 25 studios and 200 games")
+    parser.add_argument('--seed', type=int, default=42, help="Seed of the generated data set")
+    parser.add_argument('--config', default='config.json', help="Config file of the target database")
+    args = parser.parse_args()
+
+    setup_logging_from_config(args.config)
+    db_manager = DatabaseManager(args.config)
+    if args.generate:
+        set_change_notify_triggers(False)
+        set_parent_touch_triggers(False)
+        try:
+            generate_data(args.scale, args.seed)
+        finally:
+            set_parent_touch_triggers(True)
+            set_change_notify_triggers(True)
+    else:
+        main()
+    # Running clients reload once instead of patching row by row
+    db_manager.notify_reload()
\ No newline at end of file